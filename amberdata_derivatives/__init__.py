@@ -2,10 +2,60 @@
 
 """
 Module to set up the default imports.
+
+The classes are imported on first access, so that importing the SDK stays fast (and free of heavy dependencies).
 """
 
 # ======================================================================================================================
 
-from .amberdata import AmberdataDerivatives
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+# Module of each class exported by the package
+_EXPORTS = {
+    'AmberdataDerivatives':      'amberdata',
+    'AsyncAmberdataDerivatives': 'async_amberdata',
+    'ArrowCache':                'arrow_cache',
+    'ResponseCache':             'cache',
+    'DiskCache':                 'disk_cache',
+    'EventRecorder':             'instrumentation',
+    'ParquetStore':              'parquet_store',
+    'RequestEvent':              'instrumentation',
+    'RetryPolicy':               'throttling',
+    'SyncStore':                 'sync_store',
+    'TokenBucket':               'throttling',
+    'InMemoryExporter':          'tracing',
+    'OpenTelemetryTracer':       'tracing',
+    'Tracer':                    'tracing',
+}
+
+__all__ = list(_EXPORTS)
+
+if _TYPE_CHECKING:  # pragma: no cover
+    from .amberdata import AmberdataDerivatives
+    from .arrow_cache import ArrowCache
+    from .async_amberdata import AsyncAmberdataDerivatives
+    from .cache import ResponseCache
+    from .disk_cache import DiskCache
+    from .instrumentation import EventRecorder, RequestEvent
+    from .parquet_store import ParquetStore
+    from .sync_store import SyncStore
+    from .throttling import RetryPolicy, TokenBucket
+    from .tracing import InMemoryExporter, OpenTelemetryTracer, Tracer
+
+
+# ======================================================================================================================
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(_importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # ======================================================================================================================
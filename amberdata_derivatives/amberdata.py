@@ -6,35 +6,112 @@ Module to handle Amberdata's API calls.
 
 # ======================================================================================================================
 
+import contextlib
+import contextvars
+import functools
 import os
-
-import dotenv
-import requests
-
+import threading
+import time
+
+from amberdata_derivatives import (
+    batching, cache, coalescing, columnar, endpoints, instrumentation, json_backend, lazy, pagination, query,
+    ranges, streaming, throttling, tracing, transport
+)
+from amberdata_derivatives.disk_cache import DiskCache
 from amberdata_derivatives.version import __version__
 
-dotenv.load_dotenv()
+# Imported on first use (dotenv on the construction of the first client, the others on the first call)
+dotenv = lazy.load('dotenv')
+concurrent_futures = lazy.load('concurrent.futures')
+requests = lazy.load('requests')
 
 
 # ======================================================================================================================
 
-# pylint: disable=too-many-lines, too-many-public-methods
+# pylint: disable=too-many-lines, too-many-public-methods, too-many-instance-attributes
 class AmberdataDerivatives:
     """
     Main class to handle Amberdata's API calls.
     """
 
-    def __init__(self, api_key: str, time_format: str = None):
+    # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+    def __init__(
+            self,
+            api_key: str,
+            time_format: str = None,
+            pool_connections: int = transport.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: int = transport.DEFAULT_POOL_MAXSIZE,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            response_cache: cache.ResponseCache = None,
+            disk_cache: DiskCache = None,
+            result_format: str = columnar.JSON,
+            timestamp_dtype: str = None,
+            json_library: str = None,
+            rate_limiter: throttling.TokenBucket = None,
+            retry_policy: throttling.RetryPolicy = None,
+            coalesce_calls: bool = False,
+            observers: list = None,
+            tracer=None,
+            validate_params: bool = True
+    ):
         """
         Initializes the SDK.
 
-        QUERY PARAMS:
-        - api_key     (string) [Required] The key granting access to the API.
-        - time_format (string) [Optional] The default time format for all the endpoints (ms | iso | hr).
-        """
+        All the calls issued by the client share a pool of persistent (keep-alive) connections, which is released by
+        `close()` - or automatically when the client is used as a context manager.
 
+        QUERY PARAMS:
+        - api_key          (string)  [Required] The key granting access to the API.
+        - time_format      (string)  [Optional] The default time format for all the endpoints (ms | iso | hr).
+        - pool_connections (int)     [Optional] The number of per-host connection pools to cache (defaults to 10).
+        - pool_maxsize     (int)     [Optional] The maximum number of connections kept open per host (defaults to 10).
+        - pool_block       (boolean) [Optional] If true, wait for a free connection rather than exceed `pool_maxsize`.
+        - keep_alive       (boolean) [Optional] If false, connections are closed after each call (defaults to true).
+        - response_cache   (object)  [Optional] The in-memory cache of successful responses (ex: ResponseCache()).
+        - disk_cache       (object)  [Optional] The on-disk cache of successful responses (ex: DiskCache()).
+        - result_format    (string)  [Optional] The format of the records in `payload.data` (json* | columns |
+                                     dataframe | rows): `columns` is a dictionary of NumPy arrays, `dataframe` a
+                                     DataFrame, `rows` a list of named tuples (one class per endpoint, see `rows`).
+        - timestamp_dtype  (string)  [Optional] The type all the timestamp fields are normalized to, whatever their
+                                     `timeFormat` (int64 | datetime64[ms]) - requires `columns` or `dataframe`.
+        - json_library     (string)  [Optional] The JSON decoder (orjson | simdjson | json), defaults to the fastest
+                                     installed. All of them decode responses into identical objects.
+        - rate_limiter     (object)  [Optional] The token bucket throttling the calls (ex: TokenBucket(rate=10)), to
+                                     share between all the clients using the same API key.
+        - retry_policy     (object)  [Optional] The retries of failed calls (429, 5xx & connection errors), honoring
+                                     `Retry-After` (ex: RetryPolicy(max_retries=3)). Defaults to no retry (error
+                                     responses are returned as is).
+        - coalesce_calls   (boolean) [Optional] If true, identical concurrent calls share one network call and one
+                                     decoded response (which must not be modified).
+        - observers        (list)    [Optional] The callables receiving one `instrumentation.RequestEvent` per call
+                                     (ex: [EventRecorder()]), from the thread which issued it.
+        - tracer           (object)  [Optional] The tracer recording one span per call, with child spans for its stages
+                                     (ex: tracing.Tracer() or tracing.OpenTelemetryTracer()).
+        - validate_params  (boolean) [Optional] If true, calls with invalid parameters (unsupported, or of the wrong
+                                     type) get the API's 400 response without a network call (defaults to true).
+        """
+
+        if result_format not in columnar.RESULT_FORMATS:
+            raise ValueError(
+                f"Invalid result_format: expected one of {list(columnar.RESULT_FORMATS)}, found '{result_format}'."
+            )
+        if timestamp_dtype not in columnar.TIMESTAMP_DTYPES:
+            raise ValueError(
+                f"Invalid timestamp_dtype: expected one of {list(columnar.TIMESTAMP_DTYPES)}, "
+                f"found '{timestamp_dtype}'."
+            )
+        if timestamp_dtype is not None and result_format in (columnar.JSON, columnar.ROWS):
+            raise ValueError(
+                f"Invalid timestamp_dtype: '{timestamp_dtype}' requires result_format '{columnar.COLUMNS}' or "
+                f"'{columnar.DATAFRAME}'."
+            )
+
+        load_environment()
+
+        self._loads = json_backend.get_loads(json_library)
         self.__base_url = os.getenv('API_URL', 'https://api.amberdata.com')
-        self.__headers = {
+        self._headers = {
             'accept':             'application/json',
             'Accept-Encoding':    'gzip',
             'x-api-key':          api_key,
@@ -42,6 +119,40 @@ class AmberdataDerivatives:
         }
         self.__time_format = time_format
         self.__version = __version__
+        self.__pool_options = {
+            'pool_connections': pool_connections,
+            'pool_maxsize':     pool_maxsize,
+            'pool_block':       pool_block,
+            'keep_alive':       keep_alive,
+        }
+        self.__session = None
+        self.__session_lock = threading.Lock()
+        self.__response_cache = response_cache
+        self.__disk_cache = disk_cache
+        self.__result_format = result_format
+        self.__timestamp_dtype = timestamp_dtype
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._single_flight = coalescing.SingleFlight() if coalesce_calls else None
+        self._observers = list(observers or [])
+        self._tracer = tracer
+        self.__validate_params = validate_params
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes all the pooled connections held by the client.
+        """
+
+        with self.__session_lock:
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
 
     # ==================================================================================================================
 
@@ -54,6 +165,95 @@ class AmberdataDerivatives:
 
     # ==================================================================================================================
 
+    # pylint: disable=invalid-name # Disable warning about `startDate` because this is the name as expected in the API
+    def fetch_range(self, function_name: str, startDate, endDate, max_workers: int = 8, **kwargs):
+        """
+        Fetches an arbitrary historical date range from an endpoint (ex: 'get_volatility_level_1_quotes').
+
+        The range is split into the largest windows the endpoint can serve in one call (for the requested
+        `timeInterval`), the windows are fetched concurrently, and their responses are merged into one response whose
+        records are time-ordered and de-duplicated. If any window fails, its (error) response is returned instead.
+
+        QUERY PARAMS:
+        - function_name (string)    [Required] [Examples] get_volatility_level_1_quotes | get_volatility_index
+        - startDate     (date-time) [Required] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - endDate       (date-time) [Required] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - max_workers   (int)       [Optional] [Defaults] 8 (number of windows fetched concurrently)
+        - **kwargs                  [Optional] Any other parameter accepted by the endpoint
+        """
+
+        endpoint, windows = self._split_range(function_name, startDate, endDate, kwargs)
+        url_path = endpoint.url_path
+
+        with self._span('amberdata.fetch_range', tracing.get_call_attributes(url_path, kwargs)) as span:
+            span.set_attribute('amberdata.windows', len(windows))
+            responses = self.__fetch_windows(url_path, windows, kwargs, max_workers)
+            response = ranges.merge_responses(responses, endpoint.timestamp_field)
+            return self._format_response(url_path, response, kwargs)
+
+    # pylint: disable-next=invalid-name
+    def sync(self, function_name: str, store, startDate=None, endDate=None, max_workers: int = 8, **kwargs):
+        """
+        Synchronizes a time series (an endpoint and its parameters, ex: 'get_volatility_index' for deribit/BTC) into a
+        local store: only the records newer than the watermark of the series (its latest stored timestamp) are
+        requested, appended to the store, and returned.
+
+        The first synchronization of a series starts at `startDate`, the next ones right after its watermark (the
+        records at the boundary being stored once). The range is fetched like `fetch_range`, in milliseconds. If any
+        window fails, its (error) response is returned and the store is left unchanged.
+
+        QUERY PARAMS:
+        - function_name (string)    [Required] [Examples] get_volatility_index | get_futures_perpetuals_open_interest
+        - store         (object)    [Required] [Examples] SyncStore() | SyncStore('/data/series.sqlite3')
+        - startDate     (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+                                               (required by the first synchronization of a series)
+        - endDate       (date-time) [Optional] [Defaults] now
+        - max_workers   (int)       [Optional] [Defaults] 8 (number of windows fetched concurrently)
+        - **kwargs                  [Optional] Any other parameter accepted by the endpoint
+        """
+
+        endpoint, windows = self._start_sync(function_name, store, startDate, endDate, kwargs)
+
+        with self._span('amberdata.sync', tracing.get_call_attributes(endpoint.url_path, kwargs)) as span:
+            span.set_attribute('amberdata.windows', len(windows))
+            responses = self.__fetch_windows(endpoint.url_path, windows, kwargs, max_workers)
+            return self._finish_sync(endpoint, store, kwargs, responses)
+
+    def fetch_batch(self, function_name: str, params_list: list, max_workers: int = 8) -> dict:
+        """
+        Calls one endpoint (ex: 'get_volatility_index') with each parameter set of a batch, concurrently (over the
+        shared pool of connections), and returns the results keyed by parameter set (see `batching.make_key`).
+
+        Failures are reported per parameter set: the result is the error response of the API, or the exception raised
+        by the call (ex: TypeError for a missing parameter, requests.ConnectionError) - the other calls are unaffected.
+        Items which are not parameter sets are keyed by their representation, with a TypeError.
+
+        QUERY PARAMS:
+        - function_name (string) [Required] [Examples] get_volatility_index | get_trades_flow_volume_aggregates
+        - params_list   (list)   [Required] [Examples] [{'exchange': 'deribit', 'currency': 'BTC'}, ...] or
+                                                       batching.combinations(exchange=[...], currency=[...])
+        - max_workers   (int)    [Optional] [Defaults] 8 (number of calls issued concurrently)
+        """
+
+        endpoint = self._get_endpoint(function_name)
+
+        def call(params):
+            try:
+                return endpoint(**params)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return e
+
+        calls, errors = batching.deduplicate(params_list)
+        with self._span('amberdata.fetch_batch', {'amberdata.calls': len(calls)}):
+            with concurrent_futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # The calls are traced as children of the batch (in the threads of the executor)
+                futures = [executor.submit(contextvars.copy_context().run, call, params) for params in calls.values()]
+                results = [future.result() for future in futures]
+
+        return {**dict(zip(calls, results)), **errors}
+
+    # ==================================================================================================================
+
     def get_instruments_information(self, **kwargs):
         """
         Given an exchange parameter and underlying currency (ex: deribit, BTC) this endpoint retrieves a list of all
@@ -72,7 +272,7 @@ class AmberdataDerivatives:
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/instruments/information',
             {
                 **kwargs
@@ -94,7 +294,7 @@ class AmberdataDerivatives:
         - timeFormat   (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/instruments/most-traded',
             {
                 'exchange': exchange,
@@ -115,12 +315,12 @@ class AmberdataDerivatives:
         QUERY PARAMS:
         - asset      (string) [Required] [Examples] BTC | ETH
         - interval   (string) [Required] [Examples] 7D | 30D | 90D |180D
-        - startDate  (string) [Required] [Optional] 1578531600 | 1578531600000 | 2020-09-01T01:00:00
-        - endDate    (string) [Required] [Optional] 1578531600 | 1578531600000 | 2020-09-01T01:00:00
-        - timeFormat (string) [Optional] [Optional] milliseconds | ms* | iso | iso8601 | hr
+        - startDate  (string) [Optional] [Examples] 1578531600 | 1578531600000 | 2020-09-01T01:00:00
+        - endDate    (string) [Optional] [Examples] 1578531600 | 1578531600000 | 2020-09-01T01:00:00
+        - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/futures-perpetuals/apr-basis/constant-maturities',
             {
                 'asset': asset,
@@ -141,7 +341,7 @@ class AmberdataDerivatives:
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/futures-perpetuals/apr-basis/live-term-structures',
             {
                 'asset': asset,
@@ -163,7 +363,7 @@ class AmberdataDerivatives:
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/futures-perpetuals/open-interest-total',
             {
                 'asset': asset,
@@ -186,7 +386,7 @@ class AmberdataDerivatives:
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/futures-perpetuals/realized-funding-rates-cumulated',
             {
                 'asset': asset,
@@ -203,12 +403,13 @@ class AmberdataDerivatives:
 
         QUERY PARAMS:
         - asset      (string) [Required] [Examples] BTC | ETH
+        - timeFrame  (string) [Optional] [Examples] 12h | 7d
         - startDate  (string) [Optional] [Examples] 1578531600 | 1578531600000 | 2020-09-01T01:00:00
         - endDate    (string) [Optional] [Examples] 1578531600 | 1578531600000 | 2020-09-01T01:00:00
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/futures-perpetuals/volumes',
             {
                 'asset': asset,
@@ -225,12 +426,13 @@ class AmberdataDerivatives:
         QUERY PARAMS:
         - exchange   (string)    [Required] [Examples] deribit | okex | bybit
         - currency   (string)    [Required] [Examples] BTC | SOL_USDC
+        - limit      (int32)     [Optional] [Examples] 2 | 100
         - startDate  (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/options-scanner/block-trades',
             {
                 'exchange': exchange,
@@ -246,12 +448,13 @@ class AmberdataDerivatives:
         QUERY PARAMS:
         - exchange   (string)    [Required] [Examples] deribit | okex | bybit
         - currency   (string)    [Required] [Examples] BTC | SOL_USDC
+        - limit      (int32)     [Optional] [Examples] 2 | 100
         - startDate  (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/options-scanner/on-screen-trades',
             {
                 'exchange': exchange,
@@ -265,12 +468,13 @@ class AmberdataDerivatives:
         TODO.
 
         QUERY PARAMS:
-        - exchange   (string) [Required] [Examples] deribit | okex | bybit
-        - currency   (string) [Required] [Examples] BTC | SOL_USDC
-        - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
+        - exchange   (string)    [Required] [Examples] deribit | okex | bybit
+        - currency   (string)    [Required] [Examples] BTC | SOL_USDC
+        - expiration (date-time) [Required] [Examples] 1735286400000 | 2024-12-27T08:00:00
+        - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/options-scanner/strikes-bought-sold-by-aggressors',
             {
                 'exchange': exchange,
@@ -297,13 +501,14 @@ class AmberdataDerivatives:
         QUERY PARAMS:
         - exchange     (string)    [Required] [Examples] deribit | okex | bybit
         - currency     (string)    [Required] [Examples] BTC | SOL_USDC
-        - blockTradeId (boolean)   [Optional] [Examples] true | false
+        - blockTradeId (string)    [Optional] [Examples] true | false | BLOCK-135080
+        - expiration   (date-time) [Optional] [Examples] 2024-04-03 | 2024-04-03T08:00:00
         - startDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - endDate      (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat   (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/options-scanner/top-trades',
             {
                 'exchange': exchange,
@@ -319,12 +524,14 @@ class AmberdataDerivatives:
         QUERY PARAMS:
         - exchange     (string)    [Required] [Examples] deribit | okex | bybit
         - currency     (string)    [Required] [Examples] BTC | SOL_USDC
-        - uniqueTrade  (string)    [Optional] [Examples] ...
-        - blockTradeId (boolean)   [Optional] [Examples] true | false
+        - uniqueTrade  (string)    [Required] [Examples] ...
+        - blockTradeId (string)    [Optional] [Examples] true | false | BLOCK-138789
+        - startDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - endDate      (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat   (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/options-scanner/top-trades-by-unique-trade',
             {
                 'exchange': exchange,
@@ -345,7 +552,7 @@ class AmberdataDerivatives:
         - pair       (string) [Required] [Examples] btc_usd
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/annual-performance',
             {
                 'exchange': exchange,
@@ -366,7 +573,7 @@ class AmberdataDerivatives:
         - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/cones',
             {
                 'exchange': exchange,
@@ -386,7 +593,7 @@ class AmberdataDerivatives:
         - exchange   (string) [Required] [Examples] binance | bithumb | ...
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/cones/information',
             {
                 'exchange': exchange,
@@ -408,7 +615,7 @@ class AmberdataDerivatives:
         - pair2      (string) [Required] [Examples] btc_usd
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/correlation-beta',
             {
                 'exchange': exchange,
@@ -431,7 +638,7 @@ class AmberdataDerivatives:
         - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/implied-vs-realized',
             {
                 'exchange': exchange,
@@ -453,7 +660,7 @@ class AmberdataDerivatives:
         - pair       (string) [Required] [Examples] btc_usd
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/monthly-vs-daily-ratio',
             {
                 'exchange': exchange,
@@ -474,7 +681,7 @@ class AmberdataDerivatives:
         - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/performance-comparison',
             {
                 'exchange': exchange,
@@ -497,7 +704,7 @@ class AmberdataDerivatives:
         - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/seasonality/day-of-week',
             {
                 'exchange': exchange,
@@ -520,7 +727,7 @@ class AmberdataDerivatives:
         - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/realized-volatility/seasonality/month-of-year',
             {
                 'exchange': exchange,
@@ -546,7 +753,7 @@ class AmberdataDerivatives:
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/block-volumes',
             {
                 'exchange': exchange,
@@ -577,7 +784,7 @@ class AmberdataDerivatives:
         - strike       (int32)     [Optional] [Examples] 100000 | 3500
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/decorated-trades',
             {
                 'exchange': exchange,
@@ -597,7 +804,7 @@ class AmberdataDerivatives:
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/gamma-exposures/normalized-usd',
             {
                 'exchange': exchange,
@@ -619,14 +826,15 @@ class AmberdataDerivatives:
         database of MMs gamma exposure.
 
         QUERY PARAMS:
-        - exchange   (string)    [Required] [Examples] deribit | okex | bybit
-        - currency   (string)    [Required] [Examples] BTC | SOL_USDC
-        - startDate  (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
-        - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
-        - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
+        - exchange     (string)    [Required] [Examples] deribit | okex | bybit
+        - currency     (string)    [Required] [Examples] BTC | SOL_USDC
+        - startDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - endDate      (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - timeInterval (string)    [Optional] [Examples] hour | day
+        - timeFormat   (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/gamma-exposures-snapshots',
             {
                 'exchange': exchange,
@@ -648,7 +856,7 @@ class AmberdataDerivatives:
         - timeFormat            (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/net-positioning',
             {
                 'exchange': exchange,
@@ -671,7 +879,7 @@ class AmberdataDerivatives:
         - timeFormat            (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/net-volumes',
             {
                 'exchange': exchange,
@@ -706,7 +914,7 @@ class AmberdataDerivatives:
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/options-yields',
             {
                 'exchange': exchange,
@@ -727,11 +935,12 @@ class AmberdataDerivatives:
         - startDate           (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - endDate             (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
         - strike              (int32)     [Optional] [Examples] 100000 | 3500
+        - expiration          (date-time) [Optional] [Examples] 1578531600000 | 2024-04-15T08:00:00
         - expirationTimestamp (string)    [Optional] [Examples] 1578531600
         - timeFormat          (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/put-call-distribution',
             {
                 'exchange': exchange,
@@ -757,7 +966,7 @@ class AmberdataDerivatives:
         - timeInterval (string)    [Optional] [Examples] minute | hour | day
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/trades-flow/volume-aggregates',
             {
                 'exchange': exchange,
@@ -793,7 +1002,7 @@ class AmberdataDerivatives:
         - timeFormat            (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/delta-surfaces/constant',
             {
                 'exchange': exchange,
@@ -827,7 +1036,7 @@ class AmberdataDerivatives:
         - timeFormat            (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/delta-surfaces/floating',
             {
                 'exchange': exchange,
@@ -843,15 +1052,16 @@ class AmberdataDerivatives:
         Deribit developed their Bitcoin VIX called the DVOL index.
 
         QUERY PARAMS:
-        - exchange   (string)    [Required] [Examples] deribit | okex | bybit
-        - currency   (string)    [Required] [Examples] BTC | SOL_USDC
-        - startDate  (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
-        - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
-        - timestamp  (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:14:00
-        - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
+        - exchange     (string)    [Required] [Examples] deribit | okex | bybit
+        - currency     (string)    [Required] [Examples] BTC | SOL_USDC
+        - startDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - endDate      (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - timestamp    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:14:00
+        - timeInterval (string)    [Optional] [Examples] minute | hour | day
+        - timeFormat   (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/index',
             {
                 'exchange': exchange,
@@ -872,15 +1082,16 @@ class AmberdataDerivatives:
         and underlying spot prices.
 
         QUERY PARAMS:
-        - currency   (string)    [Required] [Examples] BTC | SOL_USDC
-        - exchange   (string)    [Required] [Examples] deribit | okex | bybit
-        - startDate  (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
-        - endDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
-        - timestamp  (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:14:00
-        - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
+        - currency     (string)    [Required] [Examples] BTC | SOL_USDC
+        - exchange     (string)    [Required] [Examples] deribit | okex | bybit
+        - startDate    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - endDate      (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:00:00
+        - timestamp    (date-time) [Optional] [Examples] 1578531600 | 1578531600000 | 2024-04-03T08:14:00
+        - timeInterval (string)    [Optional] [Examples] minute | hour | day
+        - timeFormat   (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/index-decorated',
             {
                 'exchange': exchange,
@@ -912,7 +1123,7 @@ class AmberdataDerivatives:
         - timeFormat   (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/level-1-quotes',
             {
                 'exchange': exchange,
@@ -937,7 +1148,7 @@ class AmberdataDerivatives:
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/metrics',
             {
                 'exchange': exchange,
@@ -956,13 +1167,13 @@ class AmberdataDerivatives:
         All the differences are found in the columns with the indication "change" (current metrics vs days ago metrics).
 
         QUERY PARAMS:
-        - exchange   (string)    [Required] [Examples] deribit | okex | bybit
+        - exchange   (string)    [Optional] [Examples] deribit | okex | bybit
         - currency   (string)    [Required] [Examples] BTC | SOL_USDC
         - daysBack   (date-time) [Optional] [Examples] 1 | 7 | 14
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/volatility-of-volatility',
             {
                 'currency': currency,
@@ -981,7 +1192,7 @@ class AmberdataDerivatives:
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/term-structures/forward-volatility/constant',
             {
                 'exchange': exchange,
@@ -1001,7 +1212,7 @@ class AmberdataDerivatives:
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/term-structures/forward-volatility/floating',
             {
                 'exchange': exchange,
@@ -1030,7 +1241,7 @@ class AmberdataDerivatives:
         - timeFormat (string)    [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/term-structures/richness',
             {
                 'exchange': exchange,
@@ -1054,7 +1265,7 @@ class AmberdataDerivatives:
         - timeFormat (string) [Optional] [Defaults] milliseconds | ms* | iso | iso8601 | hr
         """
 
-        return self.__make_request(
+        return self._make_request(
             'markets/derivatives/analytics/volatility/variance-premium',
             {
                 'currency': currency,
@@ -1062,22 +1273,406 @@ class AmberdataDerivatives:
             }
         )
 
+    def iter_rows(self, function_name: str, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE, **kwargs):
+        """
+        Calls an endpoint (ex: 'get_trades_flow_decorated_trades') and yields the records of `payload.data` one by one,
+        as the (gzip) body is received and decoded - without ever holding the whole response in memory.
+
+        Streamed calls bypass the caches, and the records are always dictionaries (whatever the result format).
+        Raises a `requests.HTTPError` if the call is not successful.
+
+        QUERY PARAMS:
+        - function_name (string) [Required] [Examples] get_trades_flow_decorated_trades | get_instruments_information
+        - chunk_size    (int)    [Optional] [Defaults] 65536 (number of bytes read at once)
+        - **kwargs               [Optional] Any parameter accepted by the endpoint
+        """
+
+        url = self._get_stream_url(function_name, kwargs)
+
+        with self.__send(url, stream=True) as response:
+            response.raise_for_status()
+            yield from streaming.iter_rows(response.iter_content(chunk_size))
+
+    def iter_pages(self, function_name: str, page_size: int = None, prefetch: bool = True, page_limit: int = None,
+                   **kwargs):
+        """
+        Calls an endpoint (ex: 'get_trades_flow_decorated_trades') page by page, and yields the response of each page
+        (in the result format of the client) - to walk a large result set in bounded pieces.
+
+        Pages follow the continuation links of the API (`payload.metadata.next`) when present. A date range is walked
+        in consecutive time windows of `page_size` milliseconds (a cursor on the timestamp field of the records): a
+        full page (`page_limit` records) is followed by the rest of its window, from its latest timestamp. Records
+        repeated on both sides of a boundary are yielded once. The next page is fetched (in a background thread) while
+        the caller processes the current one. An unsuccessful response ends the pagination, and is yielded last.
+
+        QUERY PARAMS:
+        - function_name (string)  [Required] [Examples] get_trades_flow_decorated_trades | get_instruments_information
+        - page_size     (int)     [Optional] [Defaults] The largest window the endpoint serves in one call, or one day
+        - prefetch      (boolean) [Optional] [Defaults] true (fetch the next page while the current one is processed)
+        - page_limit    (int)     [Optional] [Defaults] The `limit` parameter (number of records the API caps a page at)
+        - **kwargs                [Optional] Any parameter accepted by the endpoint (`endDate` defaults to now)
+        """
+
+        cursor = self._create_cursor(function_name, page_size, page_limit, kwargs)
+
+        with concurrent_futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = self.__request_page(executor, cursor)
+            while future is not None:
+                response = cursor.advance(future.result())
+                future = self.__request_page(executor, cursor) if prefetch else None
+                yield self._format_response(cursor.url_path, response, kwargs)
+                if future is None:
+                    future = self.__request_page(executor, cursor)
+
     # ==================================================================================================================
 
-    def __make_request(self, url_path: str, query_params: dict):
+    def _make_request(self, url_path: str, query_params: dict):
         """Helper method to make HTTP GET requests and parse the JSON response into a DataFrame."""
 
+        with self._trace_call(url_path, query_params):
+            return self._format_response(url_path, self._request_json(url_path, query_params), query_params)
+
+    def _request_json(self, url_path: str, query_params: dict, validate: bool = True):
+        """Helper method to make HTTP GET requests (unless cached or in flight) and parse the JSON response."""
+
+        url = self._build_url(url_path, query_params)
+        event = self._create_event(url_path, query_params)
+
+        with instrumentation.observe(self._observers, event):
+            if self._single_flight is not None:
+                return self._single_flight.do(
+                    cache.make_key(url_path, query_params),
+                    lambda: self.__fetch_json(url, url_path, query_params, self._lead(event), validate)
+                )
+            return self.__fetch_json(url, url_path, query_params, event, validate)
+
+    def _request_window(self, url_path: str, query_params: dict, validate: bool = True):
+        """Helper method to request the JSON response of a window of a range fetch (traced as a call)."""
+
+        with self._trace_call(url_path, query_params):
+            return self._request_json(url_path, query_params, validate=validate)
+
+    def __fetch_windows(self, url_path: str, windows: list, query_params: dict, max_workers: int) -> list:
+        """Helper method to request the JSON responses of the windows of a range, concurrently."""
+
+        with concurrent_futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # The calls of the windows are traced as children of the range (in the threads of the executor)
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._request_window, url_path, {**query_params, 'startDate': window[0], 'endDate': window[1]}
+                )
+                for window in windows
+            ]
+            return [future.result() for future in futures]
+
+    def __request_page(self, executor, cursor: pagination.PageCursor):
+        """Helper method to request the JSON response of a page in the background (None once all pages were fetched)."""
+
+        if cursor.request is None:
+            return None
+        # The call of the page is traced as a child of the current span (in the thread of the executor)
+        return executor.submit(
+            contextvars.copy_context().run, self._request_window, *cursor.request, validate=cursor.validate
+        )
+
+    def __fetch_json(self, url: str, url_path: str, query_params: dict, event=None, validate: bool = True):
+        """Helper method to make HTTP GET requests (unless cached) and parse the JSON response."""
+
+        cache_key, response = self._get_local_response(url_path, query_params, event, validate)
+        if response is None:
+            # Issue REST call & parse response payload
+            if event is None:
+                response = self._loads(self.__send(url).content)
+            else:
+                # Instrumented calls are streamed, and their body received as is, to time each stage apart
+                with self._span(tracing.TRANSPORT) as span:
+                    http_response = self.__send(url, stream=True, event=event)
+                    # Time elapsed between sending the request and parsing the response headers
+                    event.status = http_response.status_code
+                    event.timings['first_byte'] = http_response.elapsed.total_seconds()
+                    self._tag_transport(span, event)
+
+                    started = time.perf_counter()
+                    body = http_response.raw.read(decode_content=False)
+                    event.timings['download'] = time.perf_counter() - started
+
+                response = self._decode(body, http_response.headers.get('Content-Encoding'), event)
+
+            response = self._cache_response(cache_key, query_params, response)
+
+        return response
+
+    def _get_endpoint(self, function_name: str):
+        """Helper method to look up the method of an endpoint (of the registry) by name."""
+
+        return getattr(self, endpoints.get_endpoint(function_name).name)
+
+    def _get_stream_url(self, function_name: str, query_params: dict):
+        """Helper method to check the parameters of a streamed call to an endpoint (by name), and build its URL."""
+
+        endpoint = endpoints.get_endpoint(function_name)
+        endpoint.check_params(query_params)
+        url = self._build_url(endpoint.url_path, query_params)
+
+        invalid_response = self._check_params(endpoint.url_path, query_params)
+        if invalid_response is not None:
+            raise ValueError(invalid_response['message'])
+        return url
+
+    @staticmethod
+    def _create_cursor(function_name: str, page_size: int, page_limit: int, query_params: dict):
+        """Helper method to check the parameters of a paginated call, and position a cursor on its first page."""
+
+        endpoint = endpoints.get_endpoint(function_name)
+        endpoint.check_params(query_params)
+        return pagination.PageCursor(endpoint, query_params, page_size, page_limit)
+
+    @staticmethod
+    def _split_range(function_name: str, start_date, end_date, query_params: dict):
+        """Helper method to check the parameters of a range fetch, and split it into windows (with the endpoint)."""
+
+        endpoint = endpoints.get_endpoint(function_name)
+        endpoint.check_params({'startDate': start_date, 'endDate': end_date, **query_params})
+        return endpoint, endpoint.split_range(start_date, end_date, query_params.get('timeInterval'))
+
+    @staticmethod
+    def _start_sync(function_name: str, store, start_date, end_date, query_params: dict):
+        """Helper method to check the parameters of a synchronization, and split its range (after the watermark)."""
+
+        endpoint = endpoints.get_endpoint(function_name)
+        endpoint.check_params({'startDate': start_date, 'endDate': end_date, **query_params})
+
+        # The watermarks are kept in milliseconds
+        time_format = query_params.setdefault('timeFormat', 'ms')
+        if cache.TIME_FORMATS.get(time_format) != 'ms':
+            raise ValueError(f"Invalid timeFormat: synchronized series are in milliseconds, found '{time_format}'.")
+
+        watermark = store.get_watermark(function_name, query_params)
+        if watermark is not None:
+            start_date = watermark + 1
+        elif start_date is None:
+            raise TypeError(f"{function_name}() is not synchronized yet: missing required argument: 'startDate'.")
+
+        end_date = ranges.to_milliseconds(end_date) if end_date is not None else int(time.time() * 1000)
+        if ranges.to_milliseconds(start_date) >= end_date:
+            # Up to date
+            return endpoint, []
+        return endpoint, endpoint.split_range(start_date, end_date, query_params.get('timeInterval'))
+
+    def _finish_sync(self, endpoint, store, query_params: dict, responses: list):
+        """Helper method to append the records of a synchronization to the store, and return the new ones."""
+
+        if not responses:
+            response = {'description': 'Successful request', 'payload': {'data': []}, 'status': 200, 'title': 'OK'}
+        else:
+            response = ranges.merge_responses(responses, endpoint.timestamp_field)
+            if response.get('status') != 200:
+                return response
+
+        records = store.append(endpoint.name, query_params, response['payload']['data'], endpoint.timestamp_field)
+        response = {**response, 'payload': {**response['payload'], 'data': records}}
+        return self._format_response(endpoint.url_path, response, query_params)
+
+    def _build_url(self, url_path: str, query_params: dict):
+        """Helper method to add the default parameters to a call and build its URL."""
+
         # Add default parameters
         if self.__time_format is not None:
             if 'timeFormat' not in query_params:
                 query_params['timeFormat'] = self.__time_format
 
-        # Build query and URL
-        query_string = '&'.join([f"{key}={value}" for key, value in query_params.items()])
-        url = f"{self.__base_url}/{url_path}?{query_string}"
+        # Build query (canonical: ordered by name, and URL-encoded) and URL
+        return f"{self.__base_url}/{url_path}?{query.encode(query_params)}"
+
+    def _check_params(self, url_path: str, query_params: dict, event: instrumentation.RequestEvent = None):
+        """Helper method to validate the parameters of a call (returns the API's response if invalid, None if valid)."""
+
+        if not self.__validate_params:
+            return None
+
+        endpoint = endpoints.find_endpoint(url_path)
+        message = None if endpoint is None else query.validate(endpoint, query_params)
+        if message is None:
+            return None
+
+        # Rejected before the network hop (and never cached)
+        if event is not None:
+            event.status = 400
+        return query.bad_request(message)
+
+    def _get_local_response(self, url_path: str, query_params: dict, event: instrumentation.RequestEvent = None,
+                            validate: bool = True):
+        """
+        Helper method to look up the response of a call served locally: rejected or cached (with its cache key). The
+        parameters of continuation links (built by the API) are not validated (`validate` false).
+        """
+
+        invalid_response = self._check_params(url_path, query_params, event) if validate else None
+        if invalid_response is not None:
+            return None, invalid_response
+
+        if self.__response_cache is None and self.__disk_cache is None:
+            return None, None
+
+        cache_key = cache.make_key(url_path, query_params)
+        if event is not None:
+            event.cache = instrumentation.MISS
+
+        if self.__response_cache is not None:
+            response = self.__response_cache.get(cache_key)
+            if response is not None:
+                if event is not None:
+                    event.cache = instrumentation.MEMORY
+                return cache_key, response
+
+        if self.__disk_cache is not None:
+            response = self.__disk_cache.get(cache_key)
+            if response is not None:
+                if self.__response_cache is not None:
+                    self.__response_cache.put(cache_key, response)
+                if event is not None:
+                    event.cache = instrumentation.DISK
+                return cache_key, response
+
+        return cache_key, None
+
+    def _cache_response(self, cache_key: tuple, query_params: dict, response):
+        """Helper method to cache the response of a call, if successful."""
+
+        if cache_key is not None and isinstance(response, dict) and response.get('status') == 200:
+            if self.__response_cache is not None:
+                self.__response_cache.put(cache_key, response)
+            if self.__disk_cache is not None:
+                self.__disk_cache.put(cache_key, response, query_params)
+        return response
+
+    def _format_response(self, url_path: str, response, query_params: dict = None):
+        """
+        Helper method to convert the records of a response to the result format of the client (its timestamps from the
+        `timeFormat` of the call, see `query_params`).
+        """
+
+        if self.__result_format == columnar.JSON:
+            return response
+
+        time_format = (query_params or {}).get('timeFormat', self.__time_format)
+        with self._span(tracing.COLUMNAR, {'amberdata.result_format': self.__result_format}):
+            return columnar.convert_response(
+                response, self.__result_format, endpoints.get_function_name(url_path), self.__timestamp_dtype,
+                time_format
+            )
+
+    def _span(self, name: str, attributes: dict = None):
+        """Helper method to start a span (no-op if the client is not traced)."""
+
+        return tracing.start_span(self._tracer, name, attributes)
+
+    def _trace_call(self, url_path: str, query_params: dict):
+        """Helper method to start the span of a call of an endpoint (no-op if the client is not traced)."""
+
+        if self._tracer is None:
+            return contextlib.nullcontext()
+        return self._tracer.start_span(
+            f"amberdata.{endpoints.get_function_name(url_path)}", tracing.get_call_attributes(url_path, query_params)
+        )
+
+    def _create_event(self, url_path: str, query_params: dict):
+        """Helper method to create the event of a call, if observed or traced (coalesced until proven to be issued)."""
+
+        if not self._observers and self._tracer is None:
+            return None
+
+        event = instrumentation.RequestEvent(url_path, query_params)
+        event.coalesced = self._single_flight is not None
+        return event
+
+    def _lead(self, event: instrumentation.RequestEvent):
+        """Helper method to flag the event of a coalesced call as issuing the call (rather than sharing its result)."""
+
+        if event is not None:
+            event.coalesced = False
+        return event
+
+    def _decode(self, body: bytes, encoding: str, event: instrumentation.RequestEvent):
+        """Helper method to decompress and parse the body of an instrumented call (timed, and traced)."""
+
+        with self._span(tracing.DECOMPRESS, {'amberdata.content_encoding': encoding or 'identity'}) as span:
+            started = time.perf_counter()
+            content = transport.decompress(body, encoding)
+            event.timings['decompress'] = time.perf_counter() - started
+            event.compressed_bytes = len(body)
+            event.uncompressed_bytes = len(content)
+            span.set_attribute('amberdata.compressed_bytes', event.compressed_bytes)
+            span.set_attribute('amberdata.uncompressed_bytes', event.uncompressed_bytes)
+
+        with self._span(tracing.JSON_PARSE):
+            started = time.perf_counter()
+            response = self._loads(content)
+            event.timings['decode'] = time.perf_counter() - started
+
+        return response
+
+    @staticmethod
+    def _tag_transport(span, event: instrumentation.RequestEvent):
+        """Helper method to tag the transport span of a call with its outcome."""
+
+        span.set_attribute('http.status_code', event.status)
+        span.set_attribute('amberdata.retries', event.retries)
+
+    def __send(self, url: str, stream: bool = False, event: instrumentation.RequestEvent = None):
+        """Helper method to issue a HTTP GET request, throttled by the rate limiter and retried if it fails."""
+
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+
+            if event is not None:
+                event.retries = attempt
+                transport.pop_connect_time()
+            try:
+                response = self.__get_session().get(
+                    url, headers=self._headers, timeout=transport.DEFAULT_TIMEOUT, stream=stream
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if self._retry_policy is None or not self._retry_policy.should_retry(attempt):
+                    raise
+                delay = self._retry_policy.get_delay(attempt)
+            else:
+                retry_after = response.headers.get('Retry-After')
+                if self._retry_policy is None or not self._retry_policy.should_retry(
+                        attempt, response.status_code, retry_after
+                ):
+                    return response
+                delay = self._retry_policy.get_delay(attempt, retry_after)
+                response.close()
+                if response.status_code == 429 and self._rate_limiter is not None:
+                    # Quota exceeded: hold the calls of all the callers sharing the bucket
+                    self._rate_limiter.pause(delay)
+            finally:
+                if event is not None:
+                    event.timings['connect'] += transport.pop_connect_time()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def __get_session(self):
+        """Helper method to lazily create the pooled HTTP session (shared by all the threads using the client)."""
+
+        with self.__session_lock:
+            if self.__session is None:
+                self.__session = transport.create_session(**self.__pool_options)
+            return self.__session
+
+# ======================================================================================================================
+
+@functools.lru_cache(maxsize=None)
+def load_environment():
+    """
+    Loads the environment file (.env) into the environment variables, once (on the construction of the first client).
+    """
 
-        # Issue REST call & parse response payload
-        response = requests.get(url, headers=self.__headers, timeout=30)
-        return response.json()
+    dotenv.load_dotenv()
 
 # ======================================================================================================================
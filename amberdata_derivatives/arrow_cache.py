@@ -0,0 +1,142 @@
+# ======================================================================================================================
+
+"""
+Module to cache the records of calls (ex: option chain snapshots) in Arrow IPC files, memory-mapped on read: the
+processes of a host reading the same call share one physical copy of it (the page cache), with no decoding on open.
+"""
+
+# ======================================================================================================================
+
+import hashlib
+import os
+import uuid
+from urllib.parse import urlencode
+
+from amberdata_derivatives import arrow_tables, endpoints, lazy, query
+
+# Imported on the construction of the first cache
+pa = lazy.load('pyarrow')
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'amberdata-derivatives', 'arrow')
+
+# Parameters which do not change the cached records (timestamps are stored as UTC milliseconds)
+IGNORED_PARAMS = ('timeFormat',)
+
+
+# ======================================================================================================================
+
+def make_key(function_name: str, query_params: dict) -> str:
+    """
+    Returns the key of a call: the endpoint and its parameters, whatever their order and except their `timeFormat`
+    (ex: 'get_volatility_level_1_quotes?currency=BTC&exchange=deribit').
+    """
+
+    params = {key: value for key, value in query_params.items() if key not in IGNORED_PARAMS}
+    return f"{function_name}?{urlencode(query.canonicalize(params))}"
+
+
+# ======================================================================================================================
+
+class ArrowCache:
+    """
+    Class to cache the records of calls in uncompressed Arrow IPC files (one per call), typed by the schemas of the
+    endpoints.
+
+    Reads memory-map the files: columns are not copied nor decoded (fixed-width columns without missing values convert
+    to NumPy arrays without a copy, see `pyarrow.ChunkedArray.to_numpy`), and the pages of a file are shared by all the
+    processes reading it. Writes replace the files atomically: readers keep the version they mapped.
+    """
+
+    def __init__(self, root: str = DEFAULT_PATH):
+        """
+        Initializes the cache.
+
+        PARAMS:
+        - root (string) The directory of the files (created if missing).
+        """
+
+        if pa is None:
+            raise ImportError("Arrow caches require 'pyarrow' (pip install amberdata-derivatives[parquet]).")
+
+        self.root = root
+
+        os.makedirs(root, exist_ok=True)
+
+    # ==================================================================================================================
+
+    def write(self, function_name: str, response, **query_params) -> int:
+        """
+        Caches the records of a call (its response, or the records themselves: list of records, columns or DataFrame)
+        and returns the number of records cached.
+        """
+
+        if isinstance(response, dict) and 'payload' in response:
+            if response.get('status') != 200:
+                raise ValueError(f"Invalid response: only successful responses can be cached, found status "
+                                 f"'{response.get('status')}'.")
+            response = response['payload'].get('data')
+
+        table = arrow_tables.to_table(function_name, response)
+        table = table.replace_schema_metadata({'key': make_key(function_name, query_params)})
+
+        path = self.get_path(function_name, **query_params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temporary_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with pa.OSFile(temporary_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        return table.num_rows
+
+    def read(self, function_name: str, columns: list = None, **query_params):
+        """
+        Returns the records of a call as an Arrow table backed by the memory-mapped file (see `pyarrow.Table`), or None
+        if the call is not cached.
+
+        PARAMS:
+        - function_name (string) [Required] [Examples] get_volatility_level_1_quotes |
+                                                       get_volatility_delta_surfaces_floating
+        - columns       (list)   [Optional] [Examples] ['timestamp', 'instrument', 'markIv'] (defaults to all)
+        - query_params  (any)    [Required] [Examples] exchange='deribit', currency='BTC', startDate=..., endDate=...
+                                                       (the parameters of the call)
+        """
+
+        path = self.get_path(function_name, **query_params)
+        try:
+            source = pa.memory_map(path, 'r')
+        except FileNotFoundError:
+            return None
+
+        table = pa.ipc.open_file(source).read_all()
+        return table if columns is None else table.select(columns)
+
+    def get_path(self, function_name: str, **query_params) -> str:
+        """
+        Returns the file of a call (named after the hash of its key).
+        """
+
+        endpoints.get_endpoint(function_name)
+        digest = hashlib.sha256(make_key(function_name, query_params).encode('utf-8')).hexdigest()
+        return os.path.join(self.root, function_name, f"{digest}.arrow")
+
+    def clear(self, function_name: str = None):
+        """
+        Removes the cached calls of an endpoint (of all the endpoints if `function_name` is None).
+        """
+
+        directories = [function_name] if function_name is not None else os.listdir(self.root)
+        for directory in directories:
+            path = os.path.join(self.root, directory)
+            if not os.path.isdir(path):
+                continue
+            for name in os.listdir(path):
+                if name.endswith('.arrow'):
+                    os.remove(os.path.join(path, name))
+
+# ======================================================================================================================
@@ -0,0 +1,107 @@
+# ======================================================================================================================
+
+"""
+Module to convert the records of a response (`payload.data`) into Arrow tables typed by the schemas of the endpoints,
+for the local stores (see `parquet_store`, `arrow_cache`).
+"""
+
+# ======================================================================================================================
+
+from amberdata_derivatives import lazy, schemas
+
+# Imported on the construction of the first store
+pa = lazy.load('pyarrow')
+pc = lazy.load('pyarrow.compute')
+
+# Timestamps are stored as UTC milliseconds, whatever the `timeFormat` they were requested in
+TIMESTAMP_UNIT = 'ms'
+TIMEZONE = 'UTC'
+
+# Timestamps formatted as strings: 2024-04-01T00:00:00.000Z (iso) or 2024-04-01 00:00:00 000 (hr)
+_TIMESTAMP_LENGTH = 23
+
+
+# ======================================================================================================================
+
+def get_arrow_type(kind: str = schemas.TIMESTAMP):
+    """
+    Returns the Arrow type of a schemas type (ex: schemas.FLOAT -> float64), timestamps being UTC milliseconds.
+    """
+
+    return {
+        schemas.BOOL:      pa.bool_(),
+        schemas.FLOAT:     pa.float64(),
+        schemas.INT:       pa.int64(),
+        schemas.STR:       pa.string(),
+        schemas.TIMESTAMP: pa.timestamp(TIMESTAMP_UNIT, tz=TIMEZONE),
+    }[kind]
+
+
+def get_schema(function_name: str):
+    """
+    Returns the Arrow schema of the known fields of an endpoint (see `schemas.FIELDS`).
+    """
+
+    return pa.schema([(name, get_arrow_type(kind)) for name, kind in schemas.get_fields(function_name).items()])
+
+
+def to_table(function_name: str, data):
+    """
+    Converts records (list of records, columns or DataFrame) into an Arrow table typed by the schema of an endpoint:
+    missing known fields are added (as nulls), and timestamps in any `timeFormat` converted to UTC milliseconds.
+    Fields missing from the schema are typed from their values (strings if they are all missing).
+    """
+
+    if pa is None:
+        raise ImportError("Arrow tables require 'pyarrow' (pip install amberdata-derivatives[parquet]).")
+
+    table = _from_records(data)
+    schema = get_schema(function_name)
+    for field in schema:
+        if field.name not in table.column_names:
+            table = table.append_column(field.name, pa.nulls(table.num_rows, field.type))
+
+    fields = schemas.get_fields(function_name)
+    for index, name in enumerate(table.column_names):
+        column = table.column(index)
+        if fields.get(name) == schemas.TIMESTAMP:
+            column = _to_timestamps(column)
+        elif name in fields:
+            column = column.cast(schema.field(name).type)
+        elif pa.types.is_null(column.type):
+            column = column.cast(pa.string())
+        table = table.set_column(index, name, column)
+
+    return table
+
+
+# ======================================================================================================================
+
+def _from_records(data):
+    """Helper function to convert records (list of records, columns or DataFrame) into a table typed by their values."""
+
+    if isinstance(data, list):
+        return pa.Table.from_pylist(data)
+    if isinstance(data, dict):
+        return pa.table(data)
+    if data is not None:
+        return pa.Table.from_pandas(data, preserve_index=False)
+
+    raise ValueError('Invalid records: expected a list of records, columns or a DataFrame, found None.')
+
+
+def _to_timestamps(column):
+    """Helper function to convert timestamps in any `timeFormat` (ms, iso or hr) to UTC milliseconds."""
+
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        # ISO and human-readable strings only differ by their separators (the trailing `Z` of ISO strings is truncated)
+        column = pc.utf8_slice_codeunits(column, 0, _TIMESTAMP_LENGTH)
+        column = pc.utf8_replace_slice(column, start=19, stop=20, replacement='.')
+        column = column.cast(pa.timestamp(TIMESTAMP_UNIT))
+    elif pa.types.is_floating(column.type):
+        # Milliseconds with missing values (NaN)
+        column = pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column).cast(pa.int64())
+
+    return column.cast(get_arrow_type())
+
+# ======================================================================================================================
@@ -0,0 +1,407 @@
+# ======================================================================================================================
+
+"""
+Module to handle Amberdata's API calls from an asyncio event loop.
+"""
+
+# ======================================================================================================================
+
+import asyncio
+import time
+
+from amberdata_derivatives import (
+    batching, cache, coalescing, columnar, instrumentation, lazy, pagination, ranges, streaming, throttling, tracing,
+    transport
+)
+from amberdata_derivatives.amberdata import AmberdataDerivatives
+from amberdata_derivatives.disk_cache import DiskCache
+
+# Imported on the creation of the first session
+aiohttp = lazy.load('aiohttp')
+
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+# ======================================================================================================================
+
+class AsyncAmberdataDerivatives(AmberdataDerivatives):
+    """
+    Class to handle Amberdata's API calls from an asyncio event loop.
+
+    Every `get_*` endpoint has the same name and signature as in `AmberdataDerivatives`, but returns an awaitable
+    (`get_version` excepted, as it does not issue any call). All the calls share one pool of connections, and at most
+    `max_concurrency` of them are in flight at any time.
+
+    Requires the optional dependency `aiohttp` (pip install amberdata-derivatives[async]).
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+    def __init__(
+            self,
+            api_key: str,
+            time_format: str = None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            pool_maxsize: int = DEFAULT_MAX_CONCURRENCY,
+            pool_maxsize_per_host: int = 0,
+            keep_alive: bool = True,
+            response_cache: cache.ResponseCache = None,
+            disk_cache: DiskCache = None,
+            result_format: str = columnar.JSON,
+            timestamp_dtype: str = None,
+            json_library: str = None,
+            rate_limiter: throttling.TokenBucket = None,
+            retry_policy: throttling.RetryPolicy = None,
+            coalesce_calls: bool = False,
+            observers: list = None,
+            tracer=None,
+            validate_params: bool = True
+    ):
+        """
+        Initializes the SDK.
+
+        The connection pool is created on the first call (from within the running event loop), and released by
+        `await close()` - or automatically when the client is used as an asynchronous context manager.
+
+        QUERY PARAMS:
+        - api_key               (string)  [Required] The key granting access to the API.
+        - time_format           (string)  [Optional] The default time format for all the endpoints (ms | iso | hr).
+        - max_concurrency       (int)     [Optional] The maximum number of calls in flight at once (defaults to 100).
+        - pool_maxsize          (int)     [Optional] The maximum number of open connections (defaults to 100).
+        - pool_maxsize_per_host (int)     [Optional] The maximum number of open connections per host (0 = no limit).
+        - keep_alive            (boolean) [Optional] If false, connections are closed after each call (default: true).
+        - response_cache        (object)  [Optional] The in-memory cache of successful responses (ex: ResponseCache()).
+        - disk_cache            (object)  [Optional] The on-disk cache of successful responses (ex: DiskCache()).
+        - result_format         (string)  [Optional] The format of the records in `payload.data` (json* | columns |
+                                          dataframe | rows).
+        - timestamp_dtype       (string)  [Optional] The type all the timestamp fields are normalized to (int64 |
+                                          datetime64[ms]) - requires `columns` or `dataframe`.
+        - json_library          (string)  [Optional] The JSON decoder (orjson | simdjson | json), defaults to the
+                                          fastest installed.
+        - rate_limiter          (object)  [Optional] The token bucket throttling the calls (ex: TokenBucket(rate=10)).
+        - retry_policy          (object)  [Optional] The retries of failed calls (ex: RetryPolicy(max_retries=3)).
+                                          Defaults to no retry (error responses are returned as is).
+        - coalesce_calls        (boolean) [Optional] If true, identical concurrent calls share one network call and one
+                                          decoded response (which must not be modified).
+        - observers             (list)    [Optional] The callables receiving one `instrumentation.RequestEvent` per
+                                          call (ex: [EventRecorder()]), from the event loop.
+        - tracer                (object)  [Optional] The tracer recording one span per call, with child spans for its
+                                          stages (ex: tracing.Tracer() or tracing.OpenTelemetryTracer()).
+        - validate_params       (boolean) [Optional] If true, calls with invalid parameters get the API's 400 response
+                                          without a network call (defaults to true).
+        """
+
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncAmberdataDerivatives requires 'aiohttp' (pip install amberdata-derivatives[async])."
+            )
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency: expected a positive integer, found '{max_concurrency}'.")
+
+        super().__init__(
+            api_key=api_key,
+            time_format=time_format,
+            response_cache=response_cache,
+            disk_cache=disk_cache,
+            result_format=result_format,
+            timestamp_dtype=timestamp_dtype,
+            json_library=json_library,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            observers=observers,
+            tracer=tracer,
+            validate_params=validate_params
+        )
+
+        self._single_flight = coalescing.AsyncSingleFlight() if coalesce_calls else None
+
+        self.__connector_options = {
+            'limit':          pool_maxsize,
+            'limit_per_host': pool_maxsize_per_host,
+            'force_close':    not keep_alive,
+        }
+        self.__max_concurrency = max_concurrency
+        self.__session = None
+        self.__semaphore = None
+
+    def __enter__(self):
+        raise TypeError("AsyncAmberdataDerivatives must be used with 'async with'.")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    # pylint: disable-next=invalid-overridden-method
+    async def close(self):
+        """
+        Closes all the pooled connections held by the client.
+        """
+
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+            self.__semaphore = None
+
+    # ==================================================================================================================
+
+    # pylint: disable-next=invalid-name, invalid-overridden-method
+    async def fetch_range(self, function_name: str, startDate, endDate, max_workers: int = None, **kwargs):
+        """
+        Fetches an arbitrary historical date range from an endpoint (ex: 'get_volatility_level_1_quotes').
+
+        Same as `AmberdataDerivatives.fetch_range`, except that the windows are fetched concurrently on the event loop
+        (bounded by `max_concurrency`, or by `max_workers` if lower).
+        """
+
+        endpoint, windows = self._split_range(function_name, startDate, endDate, kwargs)
+        url_path = endpoint.url_path
+
+        with self._span('amberdata.fetch_range', tracing.get_call_attributes(url_path, kwargs)) as span:
+            span.set_attribute('amberdata.windows', len(windows))
+            responses = await self.__fetch_windows(url_path, windows, kwargs, max_workers)
+            merged_response = ranges.merge_responses(responses, endpoint.timestamp_field)
+            return self._format_response(url_path, merged_response, kwargs)
+
+    # pylint: disable-next=invalid-name, invalid-overridden-method
+    async def sync(self, function_name: str, store, startDate=None, endDate=None, max_workers: int = None, **kwargs):
+        """
+        Synchronizes a time series (an endpoint and its parameters) into a local store, requesting only the records
+        newer than its watermark.
+
+        Same as `AmberdataDerivatives.sync`, except that the windows are fetched concurrently on the event loop
+        (bounded by `max_concurrency`, or by `max_workers` if lower).
+        """
+
+        endpoint, windows = self._start_sync(function_name, store, startDate, endDate, kwargs)
+
+        with self._span('amberdata.sync', tracing.get_call_attributes(endpoint.url_path, kwargs)) as span:
+            span.set_attribute('amberdata.windows', len(windows))
+            responses = await self.__fetch_windows(endpoint.url_path, windows, kwargs, max_workers)
+            return self._finish_sync(endpoint, store, kwargs, responses)
+
+    # pylint: disable-next=invalid-overridden-method
+    async def fetch_batch(self, function_name: str, params_list: list, max_workers: int = None) -> dict:
+        """
+        Calls one endpoint (ex: 'get_volatility_index') with each parameter set of a batch, and returns the results
+        keyed by parameter set (see `batching.make_key`).
+
+        Same as `AmberdataDerivatives.fetch_batch`, except that the calls are issued concurrently on the event loop
+        (bounded by `max_concurrency`, or by `max_workers` if lower).
+        """
+
+        endpoint = self._get_endpoint(function_name)
+        calls, errors = batching.deduplicate(params_list)
+        semaphore = asyncio.Semaphore(max_workers or max(len(calls), 1))
+
+        async def call(params):
+            async with semaphore:
+                try:
+                    return await endpoint(**params)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    return e
+
+        with self._span('amberdata.fetch_batch', {'amberdata.calls': len(calls)}):
+            results = await asyncio.gather(*[call(params) for params in calls.values()])
+        return {**dict(zip(calls, results)), **errors}
+
+    # pylint: disable-next=invalid-overridden-method
+    async def iter_rows(self, function_name: str, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE, **kwargs):
+        """
+        Calls an endpoint (ex: 'get_trades_flow_decorated_trades') and yields the records of `payload.data` one by one,
+        as the (gzip) body is received and decoded - without ever holding the whole response in memory.
+
+        Same as `AmberdataDerivatives.iter_rows`, as an asynchronous generator (`async for row in ...`). Raises an
+        `aiohttp.ClientResponseError` if the call is not successful.
+        """
+
+        url = self._get_stream_url(function_name, kwargs)
+
+        session, semaphore = self.__get_session()
+        async with semaphore:
+            # The whole download may exceed the default timeout: only the reads are bounded
+            timeout = aiohttp.ClientTimeout(total=None, sock_read=transport.DEFAULT_TIMEOUT)
+            async with await self.__send(session, url, timeout=timeout) as http_response:
+                http_response.raise_for_status()
+
+                decoder = streaming.RowDecoder()
+                async for chunk in http_response.content.iter_chunked(chunk_size):
+                    for row in decoder.feed(chunk):
+                        yield row
+                    if decoder.done:
+                        return
+                for row in decoder.close():
+                    yield row
+
+    # pylint: disable-next=invalid-overridden-method
+    async def iter_pages(self, function_name: str, page_size: int = None, prefetch: bool = True,
+                         page_limit: int = None, **kwargs):
+        """
+        Calls an endpoint (ex: 'get_trades_flow_decorated_trades') page by page, and yields the response of each page
+        (in the result format of the client) - to walk a large result set in bounded pieces.
+
+        Same as `AmberdataDerivatives.iter_pages`, as an asynchronous generator (`async for page in ...`): the next page
+        is fetched in a task of the event loop while the caller processes the current one.
+        """
+
+        cursor = self._create_cursor(function_name, page_size, page_limit, kwargs)
+
+        task = self.__request_page(cursor)
+        try:
+            while task is not None:
+                response = cursor.advance(await task)
+                task = self.__request_page(cursor) if prefetch else None
+                yield self._format_response(cursor.url_path, response, kwargs)
+                if task is None:
+                    task = self.__request_page(cursor)
+        finally:
+            # The pagination was interrupted: the prefetched page is not needed
+            if task is not None:
+                task.cancel()
+
+    # ==================================================================================================================
+
+    # pylint: disable-next=invalid-overridden-method
+    async def _make_request(self, url_path: str, query_params: dict):
+        """Helper method to make asynchronous HTTP GET requests and parse the JSON response."""
+
+        with self._trace_call(url_path, query_params):
+            return self._format_response(url_path, await self._request_json(url_path, query_params), query_params)
+
+    # pylint: disable-next=invalid-overridden-method
+    async def _request_json(self, url_path: str, query_params: dict, validate: bool = True):
+        """Helper method to make asynchronous HTTP GET requests (unless cached or in flight) and parse the response."""
+
+        url = self._build_url(url_path, query_params)
+        event = self._create_event(url_path, query_params)
+
+        with instrumentation.observe(self._observers, event):
+            if self._single_flight is not None:
+                return await self._single_flight.do(
+                    cache.make_key(url_path, query_params),
+                    lambda: self.__fetch_json(url, url_path, query_params, self._lead(event), validate)
+                )
+            return await self.__fetch_json(url, url_path, query_params, event, validate)
+
+    # pylint: disable-next=invalid-overridden-method
+    async def __fetch_windows(self, url_path: str, windows: list, query_params: dict, max_workers: int) -> list:
+        """Helper method to request the JSON responses of the windows of a range, concurrently."""
+
+        semaphore = asyncio.Semaphore(max_workers or max(len(windows), 1))
+
+        async def fetch(window):
+            window_params = {**query_params, 'startDate': window[0], 'endDate': window[1]}
+            async with semaphore:
+                with self._trace_call(url_path, window_params):
+                    return await self._request_json(url_path, window_params)
+
+        return await asyncio.gather(*[fetch(window) for window in windows])
+
+    def __request_page(self, cursor: pagination.PageCursor):
+        """Helper method to request the JSON response of a page in a task (None once all pages were fetched)."""
+
+        if cursor.request is None:
+            return None
+
+        async def fetch(url_path, query_params, validate):
+            with self._trace_call(url_path, query_params):
+                return await self._request_json(url_path, query_params, validate=validate)
+
+        return asyncio.ensure_future(fetch(*cursor.request, cursor.validate))
+
+    # pylint: disable-next=invalid-overridden-method
+    async def __fetch_json(self, url: str, url_path: str, query_params: dict, event=None, validate: bool = True):
+        """Helper method to make asynchronous HTTP GET requests (unless cached) and parse the JSON response."""
+
+        cache_key, response = self._get_local_response(url_path, query_params, event, validate)
+        if response is None:
+            # Issue REST call & parse response payload
+            session, semaphore = self.__get_session()
+            async with semaphore:
+                if event is None:
+                    async with await self.__send(session, url) as http_response:
+                        response = self._loads(await http_response.read())
+                else:
+                    # The body of instrumented calls is received as is, to time each stage apart
+                    with self._span(tracing.TRANSPORT) as span:
+                        async with await self.__send(session, url, event=event, auto_decompress=False) as http_response:
+                            started = time.perf_counter()
+                            body = await http_response.read()
+                            event.timings['download'] = time.perf_counter() - started
+                        self._tag_transport(span, event)
+
+                    response = self._decode(body, http_response.headers.get('Content-Encoding'), event)
+            response = self._cache_response(cache_key, query_params, response)
+
+        return response
+
+    # pylint: disable-next=invalid-overridden-method
+    async def __send(self, session, url: str, event: instrumentation.RequestEvent = None, **kwargs):
+        """Helper method to issue a HTTP GET request, throttled by the rate limiter and retried if it fails."""
+
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                delay = self._rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            if event is not None:
+                # The connections opened for the request are timed by the trace config of the session
+                event.retries = attempt
+                kwargs['trace_request_ctx'] = event
+                started = time.perf_counter()
+            try:
+                http_response = await session.get(url, headers=self._headers, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if self._retry_policy is None or not self._retry_policy.should_retry(attempt):
+                    raise
+                delay = self._retry_policy.get_delay(attempt)
+            else:
+                if event is not None:
+                    event.timings['first_byte'] = time.perf_counter() - started
+                    event.status = http_response.status
+                retry_after = http_response.headers.get('Retry-After')
+                if self._retry_policy is None or not self._retry_policy.should_retry(
+                        attempt, http_response.status, retry_after
+                ):
+                    return http_response
+                delay = self._retry_policy.get_delay(attempt, retry_after)
+                http_response.release()
+                if http_response.status == 429 and self._rate_limiter is not None:
+                    # Quota exceeded: hold the calls of all the callers sharing the bucket
+                    self._rate_limiter.pause(delay)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def __get_session(self):
+        """Helper method to lazily create the pooled HTTP session (bound to the running event loop)."""
+
+        if self.__session is None:
+            self.__session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self.__connector_options),
+                timeout=aiohttp.ClientTimeout(total=transport.DEFAULT_TIMEOUT),
+                trace_configs=[_create_trace_config()]
+            )
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+        return self.__session, self.__semaphore
+
+# ======================================================================================================================
+
+def _create_trace_config():
+    """Helper function to create the trace config timing the connections opened for instrumented calls."""
+
+    async def on_connection_create_start(_session, context, _params):
+        context.connect_started = time.perf_counter()
+
+    async def on_connection_create_end(_session, context, _params):
+        if isinstance(context.trace_request_ctx, instrumentation.RequestEvent):
+            context.trace_request_ctx.timings['connect'] += time.perf_counter() - context.connect_started
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
+
+# ======================================================================================================================
@@ -0,0 +1,55 @@
+# ======================================================================================================================
+
+"""
+Module to build the parameter sets of a batch of calls to one endpoint, and to key their results.
+"""
+
+# ======================================================================================================================
+
+import itertools
+
+from amberdata_derivatives import query
+
+
+# ======================================================================================================================
+
+def combinations(**values) -> list:
+    """
+    Returns the parameter sets of all the combinations of the values of each parameter.
+
+    Ex: combinations(exchange=['deribit', 'okex'], currency=['BTC', 'ETH']) returns 4 parameter sets.
+    """
+
+    names = list(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*values.values())]
+
+
+def make_key(params: dict) -> tuple:
+    """
+    Returns the key of a parameter set in the results of a batch: its (name, value) pairs in canonical form, as sent to
+    the API (ex: (('currency', 'BTC'), ('exchange', 'deribit'))), whatever the types of the values (ex: lists).
+    """
+
+    if not isinstance(params, dict):
+        raise TypeError(f"Invalid parameter set: expected a dict, found '{params}'.")
+
+    return query.canonicalize(params)
+
+
+def deduplicate(params_list: list) -> tuple:
+    """
+    Returns the distinct parameter sets of a batch by key (see `make_key`), and the errors of the items whose key
+    cannot be built (ex: not a dict) by representation - reported as their results, the other items being unaffected.
+    """
+
+    calls = {}
+    errors = {}
+    for params in params_list:
+        try:
+            calls.setdefault(make_key(params), params)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            errors[repr(params)] = e
+
+    return calls, errors
+
+# ======================================================================================================================
@@ -0,0 +1,145 @@
+# ======================================================================================================================
+
+"""
+Module to cache API responses in memory (bounded in size, with time-to-live expiration).
+"""
+
+# ======================================================================================================================
+
+import threading
+import time
+from collections import OrderedDict
+
+from amberdata_derivatives import query
+
+# Spellings of the `timeFormat` parameter that yield the same response
+TIME_FORMATS = {
+    'milliseconds': 'ms', 'ms': 'ms',
+    'nanoseconds': 'ns', 'ns': 'ns',
+    'iso': 'iso', 'iso8601': 'iso', 'iso8611': 'iso',
+    'human': 'hr', 'human_readable': 'hr', 'humanReadable': 'hr', 'hr': 'hr',
+}
+
+
+# ======================================================================================================================
+
+def make_key(url_path: str, query_params: dict) -> tuple:
+    """
+    Builds the cache key of a call, independently of the order of its parameters and of the spelling of `timeFormat`.
+    """
+
+    params = {}
+    for key, value in query.canonicalize(query_params):
+        params[key] = TIME_FORMATS.get(value, value) if key == 'timeFormat' else value
+
+    # The API defaults to milliseconds
+    params.setdefault('timeFormat', 'ms')
+
+    return url_path.strip('/'), tuple(sorted(params.items()))
+
+
+# ======================================================================================================================
+
+# pylint: disable=too-many-instance-attributes
+class ResponseCache:
+    """
+    Class to cache successful API responses in memory, with LRU eviction and per-endpoint time-to-live.
+
+    Cached responses are shared between callers and must not be modified.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60, ttls: dict = None):
+        """
+        Initializes the cache.
+
+        PARAMS:
+        - maxsize (int)   The maximum number of responses to keep (the least recently used are evicted first).
+        - ttl     (float) The default number of seconds a response is kept for.
+        - ttls    (dict)  The number of seconds responses are kept for, per endpoint path - or any trailing part of it
+                          (ex: {'volatility/metrics': 30, 'trades-flow/gamma-exposures/normalized-usd': 300}).
+        """
+
+        if maxsize < 1:
+            raise ValueError(f"Invalid maxsize: expected a positive integer, found '{maxsize}'.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = {path.strip('/'): value for path, value in (ttls or {}).items()}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    # ==================================================================================================================
+
+    def get(self, key: tuple):
+        """
+        Returns the response cached for `key`, or None if missing or expired.
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self.__entries[key]
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, response):
+        """
+        Caches the response for `key` (the first element of the key being the endpoint path).
+        """
+
+        ttl = self.get_ttl(key[0])
+        if ttl <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + ttl, response)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_ttl(self, url_path: str) -> float:
+        """
+        Returns the number of seconds responses of an endpoint are kept for.
+        """
+
+        for path, ttl in self.ttls.items():
+            if url_path == path or url_path.endswith('/' + path):
+                return ttl
+        return self.ttl
+
+    def clear(self):
+        """
+        Removes all the cached responses (the counters are kept).
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the hit/miss counters of the cache.
+        """
+
+        with self.__lock:
+            return {
+                'hits':      self.hits,
+                'misses':    self.misses,
+                'evictions': self.evictions,
+                'size':      len(self.__entries),
+                'maxsize':   self.maxsize,
+            }
+
+# ======================================================================================================================
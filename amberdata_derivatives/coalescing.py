@@ -0,0 +1,136 @@
+# ======================================================================================================================
+
+"""
+Module to coalesce identical concurrent calls (single-flight): they share one network call, and one decoded result.
+"""
+
+# ======================================================================================================================
+
+import threading
+
+from amberdata_derivatives import lazy
+
+# Imported on the first asynchronous call
+asyncio = lazy.load('asyncio')
+
+
+# ======================================================================================================================
+
+class SingleFlight:
+    """
+    Class to de-duplicate identical calls issued concurrently by several threads: the first caller of a key runs the
+    call, the others wait for - and share - its result (or its exception).
+
+    Shared results must not be modified by the callers.
+    """
+
+    def __init__(self):
+        """
+        Initializes the registry of in-flight calls.
+        """
+
+        self.calls = 0
+        self.shared = 0
+
+        self.__lock = threading.Lock()
+        self.__in_flight = {}
+
+    def do(self, key, function):
+        """
+        Returns the result of `function()`, unless a call with the same `key` is in flight, whose result is returned.
+        """
+
+        with self.__lock:
+            call = self.__in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self.__in_flight[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not is_leader:
+            return call.wait()
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__in_flight[key]
+            call.event.set()
+
+        return call.result
+
+    def stats(self) -> dict:
+        """
+        Returns the number of calls issued, and of calls which shared the result of an in-flight call.
+        """
+
+        with self.__lock:
+            return {'calls': self.calls, 'shared': self.shared, 'in_flight': len(self.__in_flight)}
+
+
+class AsyncSingleFlight:
+    """
+    Class to de-duplicate identical calls issued concurrently by several coroutines (of one event loop): the first
+    caller of a key runs the call in a task, the others await - and share - its result (or its exception).
+
+    Cancelling a caller does not cancel the shared call. Shared results must not be modified by the callers.
+    """
+
+    def __init__(self):
+        """
+        Initializes the registry of in-flight calls.
+        """
+
+        self.calls = 0
+        self.shared = 0
+
+        self.__in_flight = {}
+
+    async def do(self, key, function):
+        """
+        Returns the result of `await function()`, unless a call with the same `key` is in flight, whose result is
+        returned.
+        """
+
+        task = self.__in_flight.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self.__in_flight[key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda _: self.__in_flight.pop(key, None))
+            self.calls += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        """
+        Returns the number of calls issued, and of calls which shared the result of an in-flight call.
+        """
+
+        return {'calls': self.calls, 'shared': self.shared, 'in_flight': len(self.__in_flight)}
+
+
+# ======================================================================================================================
+
+class _Call:  # pylint: disable=too-few-public-methods
+    """Helper class holding the state of an in-flight call."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        """Waits for the call to complete, and returns its result (or raises its exception)."""
+
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+# ======================================================================================================================
@@ -0,0 +1,198 @@
+# ======================================================================================================================
+
+"""
+Module to convert the records of a response (`payload.data`) into typed columns (NumPy arrays), a pandas DataFrame or
+row objects (see `rows`).
+"""
+
+# ======================================================================================================================
+
+from amberdata_derivatives import cache, lazy, rows, schemas
+
+# Imported on the first conversion
+np = lazy.load('numpy')
+pd = lazy.load('pandas')
+
+JSON = 'json'
+COLUMNS = 'columns'
+DATAFRAME = 'dataframe'
+ROWS = 'rows'
+RESULT_FORMATS = (JSON, COLUMNS, DATAFRAME, ROWS)
+
+# Types timestamp columns can be normalized to (None = as returned by the API, depending on `timeFormat`)
+EPOCH_MS = 'int64'
+DATETIME64 = 'datetime64[ms]'
+TIMESTAMP_DTYPES = (None, EPOCH_MS, DATETIME64)
+
+# Timestamps formatted as strings: 2024-04-01T00:00:00.000Z (iso) or 2024-04-01 00:00:00 000 (hr)
+_TIMESTAMP_LENGTH = 23
+
+# Number of units per millisecond of the timestamps formatted as integers (by canonical `timeFormat`)
+_UNITS_PER_MS = {'ms': 1, 'ns': 1000000}
+
+
+# ======================================================================================================================
+
+def to_columns(data: list, fields: dict = None, timestamp_dtype: str = None, time_format: str = None) -> dict:
+    """
+    Converts a list of records into a dictionary of NumPy arrays (one per field), typed according to `fields`.
+
+    Fields missing from `fields` (name -> schemas type) are typed from their values. Numbers with missing values are
+    stored as floats (NaN). Timestamps are normalized to `timestamp_dtype` (int64 | datetime64[ms]) if set (from the
+    `time_format` they were requested in, see `normalize_timestamps`), otherwise timestamps expressed as strings
+    (timeFormat=iso|hr) are kept as objects. The strings of categorical fields (see
+    `schemas.CATEGORICAL_FIELDS`) are interned: one object per distinct value.
+    """
+
+    if np is None:
+        raise ImportError("Columnar results require 'numpy' (pip install amberdata-derivatives[columnar]).")
+
+    fields = fields or {}
+
+    names = dict.fromkeys(fields)
+    for record in data:
+        names.update(dict.fromkeys(record))
+
+    columns = {}
+    for name in names:
+        values = [record.get(name) for record in data]
+        if timestamp_dtype is not None and fields.get(name) == schemas.TIMESTAMP:
+            columns[name] = normalize_timestamps(values, timestamp_dtype, time_format)
+        elif name in schemas.CATEGORICAL_FIELDS:
+            columns[name] = _to_array(rows.intern_strings(values), fields.get(name))
+        else:
+            columns[name] = _to_array(values, fields.get(name))
+    return columns
+
+
+def to_dataframe(data: list, fields: dict = None, timestamp_dtype: str = None, time_format: str = None):
+    """
+    Converts a list of records into a pandas DataFrame, with columns typed according to `fields`. Categorical fields
+    (see `schemas.CATEGORICAL_FIELDS`) are categorical columns: one code per record, and one value per category.
+    """
+
+    if pd is None:
+        raise ImportError("DataFrame results require 'pandas' (pip install amberdata-derivatives[columnar]).")
+
+    columns = to_columns(data, fields, timestamp_dtype, time_format)
+    for name, column in columns.items():
+        if name in schemas.CATEGORICAL_FIELDS and column.dtype == 'object':
+            columns[name] = pd.Categorical(column)
+    return pd.DataFrame(columns, copy=False)
+
+
+def normalize_timestamps(values, dtype: str = DATETIME64, time_format: str = None):
+    """
+    Converts timestamps in any `timeFormat` (milliseconds, nanoseconds, iso or hr) into one array of `dtype`
+    (datetime64[ms], or int64 milliseconds since epoch), in one vectorized pass. Missing values are NaT (datetime64) or
+    NaN (int64).
+
+    Integers are read in the unit of `time_format` (the `timeFormat` they were requested in, milliseconds if None).
+    """
+
+    if np is None:
+        raise ImportError("Columnar results require 'numpy' (pip install amberdata-derivatives[columnar]).")
+    if dtype not in (EPOCH_MS, DATETIME64):
+        raise ValueError(f"Invalid timestamp dtype: expected one of [{EPOCH_MS},{DATETIME64}], found '{dtype}'.")
+
+    canonical_format = cache.TIME_FORMATS.get(time_format or 'ms')
+    if canonical_format is None:
+        raise ValueError(f"Invalid timeFormat: expected one of [{','.join(cache.TIME_FORMATS)}], found "
+                         f"'{time_format}'.")
+
+    values = np.asarray(values, dtype='object')
+    missing = np.equal(values, None)
+    present = values[~missing]
+
+    if len(present) > 0 and isinstance(present[0], str):
+        # ISO and human-readable strings only differ by their separators: overwrite them in place (the trailing `Z`
+        # of ISO strings is truncated), and let NumPy parse the resulting ISO 8601 strings.
+        text = np.where(missing, '1970-01-01T00:00:00.000', values).astype(f"S{_TIMESTAMP_LENGTH}")
+        characters = text.view('uint8').reshape(-1, _TIMESTAMP_LENGTH)
+        characters[:, 10] = ord('T')
+        characters[:, 19] = ord('.')
+        try:
+            timestamps = text.astype(DATETIME64)
+        except ValueError as e:
+            raise ValueError(f"Invalid timestamp values: expected ms, iso or hr format, found '{present[0]}'.") from e
+    else:
+        integers = np.where(missing, 0, values).astype('int64')
+        if canonical_format in _UNITS_PER_MS:
+            integers //= _UNITS_PER_MS[canonical_format]
+        timestamps = integers.astype(DATETIME64)
+
+    if dtype == EPOCH_MS:
+        milliseconds = timestamps.view('int64')
+        if missing.any():
+            milliseconds = np.where(missing, np.nan, milliseconds)
+        return milliseconds
+
+    timestamps[missing] = np.datetime64('NaT')
+    return timestamps
+
+
+def convert_response(
+        response, result_format: str, function_name: str = None, timestamp_dtype: str = None, time_format: str = None
+):
+    """
+    Returns the response with its records (`payload.data`) converted to the requested format (json | columns |
+    dataframe | rows), with timestamps normalized to `timestamp_dtype` (if set, except for rows) from the `time_format`
+    of the call. Unsuccessful responses are returned as is.
+    """
+
+    if result_format == JSON or not isinstance(response, dict) or response.get('status') != 200:
+        return response
+
+    data = response.get('payload', {}).get('data')
+    if not isinstance(data, list):
+        return response
+
+    fields = schemas.get_fields(function_name)
+    if result_format == ROWS:
+        data = rows.to_rows(data, function_name)
+    elif result_format == DATAFRAME:
+        data = to_dataframe(data, fields, timestamp_dtype, time_format)
+    else:
+        data = to_columns(data, fields, timestamp_dtype, time_format)
+
+    return {**response, 'payload': {**response['payload'], 'data': data}}
+
+
+# ======================================================================================================================
+
+def _to_array(values: list, kind: str = None):
+    if kind is None:
+        kind = _infer_kind(values)
+
+    if kind == schemas.FLOAT:
+        return np.array(values, dtype='float64')
+
+    if kind in (schemas.INT, schemas.TIMESTAMP):
+        try:
+            return np.array(values, dtype='int64')
+        except (TypeError, ValueError):
+            # Missing values (None) or timestamps formatted as strings
+            if all(isinstance(value, (int, float)) or value is None for value in values):
+                return np.array(values, dtype='float64')
+
+    if kind == schemas.BOOL and None not in values:
+        return np.array(values, dtype='bool')
+
+    array = np.empty(len(values), dtype='object')
+    for index, value in enumerate(values):
+        array[index] = value
+    return array
+
+
+def _infer_kind(values: list):
+    kinds = {type(value) for value in values if value is not None}
+
+    if kinds == {bool}:
+        return schemas.BOOL
+    if kinds == {int}:
+        return schemas.INT
+    if kinds and kinds <= {int, float}:
+        return schemas.FLOAT
+    return None
+
+# ======================================================================================================================
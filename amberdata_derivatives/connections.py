@@ -0,0 +1,61 @@
+# ======================================================================================================================
+
+"""
+Module to time the connections opened by the HTTP transport (imported with requests, on the creation of the first
+session).
+"""
+
+# ======================================================================================================================
+
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from amberdata_derivatives import transport
+
+
+# ======================================================================================================================
+
+class TimedConnectionMixin:  # pylint: disable=too-few-public-methods
+    """Class to measure the time spent opening a connection."""
+
+    def connect(self):
+        """Opens the connection, and adds its duration to the connect time of the current thread."""
+
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            transport.add_connect_time(time.perf_counter() - started)
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    """Class of timed HTTP connections."""
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    """Class of timed HTTPS connections."""
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """Class of pools of timed HTTP connections."""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """Class of pools of timed HTTPS connections."""
+
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Class of adapters whose connections are timed."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+
+# ======================================================================================================================
@@ -0,0 +1,62 @@
+# ======================================================================================================================
+
+"""
+Module to open the SQLite databases backing the on-disk stores (responses cache, synchronized series).
+"""
+
+# ======================================================================================================================
+
+import os
+import threading
+
+from amberdata_derivatives import lazy
+
+# Imported on the construction of the first store
+sqlite3 = lazy.load('sqlite3')
+
+
+# ======================================================================================================================
+
+class Database:
+    """
+    Base class of the stores kept in a SQLite database, which can be shared by several processes on one host.
+
+    One connection per store, serialized by a lock. Concurrent processes are handled by SQLite's file locking.
+    """
+
+    def __init__(self, path: str, tables: list):
+        """
+        Opens the database (created if missing, as well as its directory) and creates its missing tables.
+
+        PARAMS:
+        - path   (string) The SQLite database file.
+        - tables (list)   The `CREATE TABLE IF NOT EXISTS` statements of the tables (and of their indexes).
+        """
+
+        self.path = path
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        for table in tables:
+            self._connection.execute(table)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+
+        with self._lock:
+            self._connection.close()
+
+# ======================================================================================================================
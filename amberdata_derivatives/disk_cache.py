@@ -0,0 +1,151 @@
+# ======================================================================================================================
+
+"""
+Module to cache API responses on disk, indefinitely for historical windows which are closed (and can no longer change).
+"""
+
+# ======================================================================================================================
+
+import json
+import os
+import time
+import zlib
+from urllib.parse import urlencode
+
+from amberdata_derivatives import database, json_backend, ranges
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'amberdata-derivatives', 'responses.sqlite3')
+
+
+# ======================================================================================================================
+
+# pylint: disable=too-many-instance-attributes
+class DiskCache(database.Database):
+    """
+    Class to cache successful API responses in a SQLite database, which can be shared by several processes on one host.
+
+    Responses of closed historical windows (whose `endDate` - or `timestamp` - is older than `closed_after` seconds)
+    are kept indefinitely. Responses of open-ended or recent windows expire after `open_ttl` seconds.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, open_ttl: float = 60, closed_after: float = 3600, level: int = 6):
+        """
+        Initializes the cache.
+
+        PARAMS:
+        - path         (string) The SQLite database file (created if missing).
+        - open_ttl     (float)  The number of seconds the responses of open-ended or recent windows are kept for
+                                (0 to not cache them at all).
+        - closed_after (float)  The number of seconds after which a window is considered closed (i.e. its data final).
+        - level        (int)    The zlib compression level of the stored responses (0-9).
+        """
+
+        super().__init__(path, [
+            'CREATE TABLE IF NOT EXISTS responses ('
+            '  key        TEXT PRIMARY KEY,'
+            '  expires_at REAL,'
+            '  created_at REAL NOT NULL,'
+            '  body       BLOB NOT NULL'
+            ')'
+        ])
+
+        self.open_ttl = open_ttl
+        self.closed_after = closed_after
+        self.level = level
+        self.hits = 0
+        self.misses = 0
+
+    # ==================================================================================================================
+
+    def get(self, key: tuple):
+        """
+        Returns the response cached for `key` (as built by `cache.make_key`), or None if missing or expired.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT expires_at, body FROM responses WHERE key = ?', (self.__serialize_key(key),)
+            ).fetchone()
+
+            if row is None or (row[0] is not None and row[0] <= time.time()):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return json_backend.loads(zlib.decompress(row[1]))
+
+    def put(self, key: tuple, response, query_params: dict):
+        """
+        Caches the response for `key` (as built by `cache.make_key`), for a duration depending on the call parameters.
+        """
+
+        now = time.time()
+        if self.is_closed_window(query_params, now):
+            expires_at = None
+        elif self.open_ttl > 0:
+            expires_at = now + self.open_ttl
+        else:
+            return
+
+        body = zlib.compress(json.dumps(response, separators=(',', ':')).encode('utf-8'), self.level)
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses (key, expires_at, created_at, body) VALUES (?, ?, ?, ?)',
+                (self.__serialize_key(key), expires_at, now, body)
+            )
+
+    def is_closed_window(self, query_params: dict, now: float = None) -> bool:
+        """
+        Returns True if the call is for a historical window which is closed (i.e. whose data can no longer change).
+        """
+
+        end_date = query_params.get('endDate', query_params.get('timestamp'))
+        if end_date is None:
+            return False
+
+        try:
+            end_date = ranges.to_milliseconds(end_date)
+        except ValueError:
+            return False
+
+        now = time.time() if now is None else now
+        return end_date <= (now - self.closed_after) * 1000
+
+    def purge(self) -> int:
+        """
+        Removes the expired responses from the database, and returns how many were removed.
+        """
+
+        with self._lock:
+            cursor = self._connection.execute(
+                'DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time(),)
+            )
+            return cursor.rowcount
+
+    def clear(self):
+        """
+        Removes all the cached responses.
+        """
+
+        with self._lock:
+            self._connection.execute('DELETE FROM responses')
+
+    def stats(self) -> dict:
+        """
+        Returns the hit/miss counters of the cache.
+        """
+
+        with self._lock:
+            size = self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            return {'hits': self.hits, 'misses': self.misses, 'size': size}
+
+    # ==================================================================================================================
+
+    @staticmethod
+    def __serialize_key(key: tuple) -> str:
+        url_path, params = key
+        return f"{url_path}?{urlencode(params)}"
+
+# ======================================================================================================================
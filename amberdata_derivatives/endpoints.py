@@ -0,0 +1,389 @@
+# ======================================================================================================================
+
+"""
+Module describing the endpoints of the API in one registry: their paths, parameters, date-range limits, timestamp
+fields and record schemas - the metadata driving range fetches, parameter checks and columnar conversions.
+"""
+
+# ======================================================================================================================
+
+from amberdata_derivatives import ranges, schemas
+from amberdata_derivatives.ranges import DAY, HOUR
+from amberdata_derivatives.schemas import BOOL, INT, STR, TIMESTAMP
+
+BASE_PATH = 'markets/derivatives/analytics'
+
+# Accepted values of the enumerated parameters (as listed by the API)
+INTERVALS = ('7d', '7D', '30d', '30D', '90d', '90D', '180d', '180D')
+MARGIN_TYPES = ('coins', 'stables')
+PUT_CALL = ('P', 'p', 'put', 'Put', 'PUT', 'C', 'c', 'call', 'Call', 'CALL')
+TIME_FORMATS = (
+    'nanoseconds', 'ns', 'milliseconds', 'ms', 'iso', 'iso8601', 'iso8611', 'human', 'human_readable', 'humanReadable',
+    'hr',
+)
+
+# Parameters shared by most endpoints
+DATE_RANGE = {'startDate': TIMESTAMP, 'endDate': TIMESTAMP}
+TIME_FORMAT = {'timeFormat': TIME_FORMATS}
+
+# Specification of each endpoint (by name of its method):
+# - path            The path of the endpoint, relative to BASE_PATH.
+# - required        The required parameters (name -> type), in the order of the arguments of the method.
+# - optional        The optional parameters (name -> type), any other parameter being rejected by the API.
+#                   Types are those of `schemas`, or the tuple of the accepted values.
+# - range_limits    The largest date range (in milliseconds) served in one call, per `timeInterval` (None = parameter
+#                   omitted) - endpoints (or intervals) not listed are fetched in one call.
+# - timestamp_field The field holding the time of each record (defaults to `timestamp`).
+# The fields of the records are described by `schemas.FIELDS`.
+SPECS = {
+    'get_futures_perpetuals_apr_basis_constant_maturities': {
+        'path':     'futures-perpetuals/apr-basis/constant-maturities',
+        'required': {'asset': STR, 'interval': INTERVALS},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_futures_perpetuals_apr_basis_live_term_structures': {
+        'path':     'futures-perpetuals/apr-basis/live-term-structures',
+        'required': {'asset': STR, 'marginType': MARGIN_TYPES},
+        'optional': {**TIME_FORMAT},
+    },
+    'get_futures_perpetuals_open_interest': {
+        'path':     'futures-perpetuals/open-interest-total',
+        'required': {'asset': STR},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_futures_perpetuals_realized_funding_rates_cumulated': {
+        'path':     'futures-perpetuals/realized-funding-rates-cumulated',
+        'required': {'asset': STR, 'marginType': MARGIN_TYPES},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_futures_perpetuals_volumes': {
+        'path':     'futures-perpetuals/volumes',
+        'required': {'asset': STR},
+        'optional': {'timeFrame': STR, **DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_instruments_information': {
+        'path':     'instruments/information',
+        'required': {},
+        'optional': {
+            'exchange': STR, 'currency': STR, 'putCall': PUT_CALL, 'strike': INT, 'timestamp': TIMESTAMP,
+            **TIME_FORMAT,
+        },
+    },
+    'get_instruments_most_traded': {
+        'path':     'instruments/most-traded',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'blockTradeId': BOOL, **DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_options_scanner_block_trades': {
+        'path':     'options-scanner/block-trades',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'limit': INT, **DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_options_scanner_on_screen_trades': {
+        'path':     'options-scanner/on-screen-trades',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'limit': INT, **DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_options_scanner_strikes_bought_sold': {
+        'path':     'options-scanner/strikes-bought-sold-by-aggressors',
+        'required': {'exchange': STR, 'currency': STR, 'expiration': TIMESTAMP},
+        'optional': {**TIME_FORMAT},
+    },
+    'get_options_scanner_top_trades': {
+        'path':            'options-scanner/top-trades',
+        'required':        {'exchange': STR, 'currency': STR},
+        'optional':        {'blockTradeId': STR, 'expiration': TIMESTAMP, **DATE_RANGE, **TIME_FORMAT},
+        'timestamp_field': 'exchangeTimestamp',
+    },
+    'get_options_scanner_top_trades_by_unique_trade': {
+        'path':     'options-scanner/top-trades-by-unique-trade',
+        'required': {'exchange': STR, 'currency': STR, 'uniqueTrade': STR},
+        'optional': {'blockTradeId': STR, **DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_realized_volatility_annual_performance': {
+        'path':     'realized-volatility/annual-performance',
+        'required': {'exchange': STR, 'pair': STR},
+        'optional': {**TIME_FORMAT},
+    },
+    'get_realized_volatility_cones': {
+        'path':     'realized-volatility/cones',
+        'required': {'exchange': STR, 'pair': STR},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_realized_volatility_cones_information': {
+        'path':     'realized-volatility/cones/information',
+        'required': {'exchange': STR},
+        'optional': {**TIME_FORMAT},
+    },
+    'get_realized_volatility_correlation_beta': {
+        'path':     'realized-volatility/correlation-beta',
+        'required': {'exchange': STR, 'pair': STR, 'pair2': STR},
+        'optional': {**TIME_FORMAT},
+    },
+    'get_realized_volatility_implied_vs_realized': {
+        'path':     'realized-volatility/implied-vs-realized',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_realized_volatility_monthly_vs_daily_ratio': {
+        'path':     'realized-volatility/monthly-vs-daily-ratio',
+        'required': {'exchange': STR, 'pair': STR},
+        'optional': {**TIME_FORMAT},
+    },
+    'get_realized_volatility_performance_comparison': {
+        'path':     'realized-volatility/performance-comparison',
+        'required': {'exchange': STR, 'pair': STR, 'pair2': STR},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_realized_volatility_seasonality_day_of_week': {
+        'path':     'realized-volatility/seasonality/day-of-week',
+        'required': {'exchange': STR, 'pair': STR},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_realized_volatility_seasonality_month_of_year': {
+        'path':     'realized-volatility/seasonality/month-of-year',
+        'required': {'exchange': STR, 'pair': STR},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_trades_flow_block_volumes': {
+        'path':     'trades-flow/block-volumes',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {**DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_trades_flow_decorated_trades': {
+        'path':            'trades-flow/decorated-trades',
+        'required':        {'exchange': STR, 'currency': STR},
+        'optional':        {
+            'blockTradeId': BOOL, 'instrument': STR, 'putCall': PUT_CALL, 'strike': INT, **DATE_RANGE, **TIME_FORMAT,
+        },
+        # Not documented - one day per call keeps the payloads to a manageable size
+        'range_limits':    {None: DAY},
+        'timestamp_field': 'exchangeTimestamp',
+    },
+    'get_trades_flow_gamma_exposures_normalized_usd': {
+        'path':            'trades-flow/gamma-exposures/normalized-usd',
+        'required':        {'exchange': STR, 'currency': STR},
+        'optional':        {**TIME_FORMAT},
+        'timestamp_field': 'snapshotTimestamp',
+    },
+    'get_trades_flow_gamma_exposures_snapshots': {
+        'path':            'trades-flow/gamma-exposures-snapshots',
+        'required':        {'exchange': STR, 'currency': STR},
+        'optional':        {'timeInterval': STR, **DATE_RANGE, **TIME_FORMAT},
+        'timestamp_field': 'snapshotTimestamp',
+    },
+    'get_trades_flow_net_positioning': {
+        'path':            'trades-flow/net-positioning',
+        'required':        {'exchange': STR, 'currency': STR},
+        'optional':        {'showActiveExpirations': BOOL, **DATE_RANGE, **TIME_FORMAT},
+        'timestamp_field': 'snapshotTimestamp',
+    },
+    'get_trades_flow_net_volumes': {
+        'path':     'trades-flow/net-volumes',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'blockTradeId': BOOL, 'showActiveExpirations': BOOL, **DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_trades_flow_options_yields': {
+        'path':     'trades-flow/options-yields',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {**TIME_FORMAT},
+    },
+    'get_trades_flow_put_call_distribution': {
+        'path':     'trades-flow/put-call-distribution',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {
+            'blockTradeId': BOOL, 'strike': INT, 'expiration': TIMESTAMP, 'expirationTimestamp': TIMESTAMP,
+            **DATE_RANGE, **TIME_FORMAT,
+        },
+    },
+    'get_trades_flow_volume_aggregates': {
+        'path':     'trades-flow/volume-aggregates',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'timeInterval': STR, **DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_volatility_delta_surfaces_constant': {
+        'path':         'volatility/delta-surfaces/constant',
+        'required':     {'exchange': STR, 'currency': STR},
+        'optional':     {
+            'daysToExpirationStart': INT, 'daysToExpirationEnd': INT, 'timeInterval': STR, **DATE_RANGE, **TIME_FORMAT,
+        },
+        'range_limits': {None: HOUR, 'minute': HOUR, 'hour': 90 * DAY, 'day': 365 * DAY},
+    },
+    'get_volatility_delta_surfaces_floating': {
+        'path':         'volatility/delta-surfaces/floating',
+        'required':     {'exchange': STR, 'currency': STR},
+        'optional':     {
+            'daysToExpirationStart': INT, 'daysToExpirationEnd': INT, 'timeInterval': STR, **DATE_RANGE, **TIME_FORMAT,
+        },
+        'range_limits': {None: HOUR, 'minute': HOUR, 'hour': 90 * DAY, 'day': 365 * DAY},
+    },
+    'get_volatility_index': {
+        'path':            'volatility/index',
+        'required':        {'exchange': STR, 'currency': STR},
+        'optional':        {'timestamp': TIMESTAMP, 'timeInterval': STR, **DATE_RANGE, **TIME_FORMAT},
+        'timestamp_field': 'exchangeTimestamp',
+    },
+    'get_volatility_index_decorated': {
+        'path':            'volatility/index-decorated',
+        'required':        {'exchange': STR, 'currency': STR},
+        'optional':        {'timestamp': TIMESTAMP, 'timeInterval': STR, **DATE_RANGE, **TIME_FORMAT},
+        'timestamp_field': 'exchangeTimestamp',
+    },
+    'get_volatility_level_1_quotes': {
+        'path':         'volatility/level-1-quotes',
+        'required':     {'exchange': STR, 'currency': STR},
+        'optional':     {
+            'instrument': STR, 'isAtm': BOOL, 'putCall': PUT_CALL, 'strike': INT, 'timeInterval': STR,
+            **DATE_RANGE, **TIME_FORMAT,
+        },
+        # The daily limit is not documented - a month per call keeps the payloads in line with the other intervals
+        'range_limits': {None: HOUR, 'minute': HOUR, 'hour': DAY, 'day': 30 * DAY},
+    },
+    'get_volatility_metrics': {
+        'path':     'volatility/metrics',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'daysBack': INT, **TIME_FORMAT},
+    },
+    'get_volatility_of_volatility': {
+        'path':     'volatility/volatility-of-volatility',
+        'required': {'currency': STR},
+        'optional': {'exchange': STR, 'daysBack': INT, **TIME_FORMAT},
+    },
+    'get_volatility_term_structures_constant': {
+        'path':     'volatility/term-structures/forward-volatility/constant',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'timestamp': TIMESTAMP, **TIME_FORMAT},
+    },
+    'get_volatility_term_structures_floating': {
+        'path':     'volatility/term-structures/forward-volatility/floating',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'timestamp': TIMESTAMP, **TIME_FORMAT},
+    },
+    'get_volatility_term_structures_richness': {
+        'path':     'volatility/term-structures/richness',
+        'required': {'exchange': STR, 'currency': STR},
+        'optional': {'timestamp': TIMESTAMP, **DATE_RANGE, **TIME_FORMAT},
+    },
+    'get_volatility_variance_premium': {
+        'path':     'volatility/variance-premium',
+        'required': {'currency': STR},
+        'optional': {**TIME_FORMAT},
+    },
+}
+
+
+# ======================================================================================================================
+
+class Endpoint:
+    """
+    Class describing an endpoint of the API, as specified in `SPECS`.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+            self,
+            name: str,
+            path: str,
+            required: dict,
+            optional: dict,
+            range_limits: dict = None,
+            timestamp_field: str = 'timestamp'
+    ):
+        """
+        Initializes the endpoint.
+
+        PARAMS:
+        - name            (string) The name of the method of the endpoint (ex: 'get_volatility_index').
+        - path            (string) The path of the endpoint, relative to BASE_PATH.
+        - required        (dict)   The required parameters (name -> type, or tuple of the accepted values).
+        - optional        (dict)   The optional parameters (name -> type, or tuple of the accepted values).
+        - range_limits    (dict)   The largest date range (in milliseconds) served in one call, per `timeInterval`.
+        - timestamp_field (string) The field holding the time of each record.
+        """
+
+        self.name = name
+        self.url_path = f"{BASE_PATH}/{path}"
+        self.required = dict(required)
+        self.optional = dict(optional)
+        self.range_limits = dict(range_limits or {})
+        self.timestamp_field = timestamp_field
+
+    @property
+    def params(self) -> dict:
+        """
+        Returns all the parameters (name -> type) of the endpoint, the required ones first.
+        """
+
+        return {**self.required, **self.optional}
+
+    @property
+    def fields(self) -> dict:
+        """
+        Returns the fields (name -> type) of the records returned by the endpoint.
+        """
+
+        return schemas.get_fields(self.name)
+
+    @property
+    def historical(self) -> bool:
+        """
+        Returns True if the endpoint serves date ranges (`startDate` and `endDate`).
+        """
+
+        return 'startDate' in self.params and 'endDate' in self.params
+
+    def check_params(self, query_params: dict):
+        """
+        Raises a TypeError (as a call of the method would) if a required parameter is missing from `query_params`.
+        """
+
+        missing = [name for name in self.required if name not in query_params]
+        if missing:
+            raise TypeError(f"{self.name}() missing required arguments: {', '.join(repr(name) for name in missing)}.")
+
+    def split_range(self, start_date, end_date, time_interval: str = None) -> list:
+        """
+        Splits the date range [start_date, end_date) into consecutive windows (start_ms, end_ms) the endpoint can serve.
+        """
+
+        return ranges.split_range(start_date, end_date, ranges.window_size(self.range_limits, time_interval))
+
+    def __repr__(self):
+        return f"Endpoint({self.name!r}, {self.url_path!r})"
+
+
+ENDPOINTS = {name: Endpoint(name, **spec) for name, spec in SPECS.items()}
+
+_BY_URL_PATH = {endpoint.url_path: endpoint for endpoint in ENDPOINTS.values()}
+
+
+# ======================================================================================================================
+
+def get_endpoint(function_name: str) -> Endpoint:
+    """
+    Returns the endpoint of a method (ex: 'get_volatility_index'). Raises a ValueError if unknown.
+    """
+
+    endpoint = ENDPOINTS.get(function_name)
+    if endpoint is None:
+        raise ValueError(f"Unknown endpoint: '{function_name}'.")
+    return endpoint
+
+
+def find_endpoint(url_path: str):
+    """
+    Returns the endpoint at `url_path`, or None if unknown.
+    """
+
+    return _BY_URL_PATH.get(url_path.strip('/'))
+
+
+def get_function_name(url_path: str):
+    """
+    Returns the name of the method of the endpoint at `url_path`, or None if unknown.
+    """
+
+    endpoint = find_endpoint(url_path)
+    return None if endpoint is None else endpoint.name
+
+# ======================================================================================================================
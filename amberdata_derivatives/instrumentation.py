@@ -0,0 +1,174 @@
+# ======================================================================================================================
+
+"""
+Module to instrument the API calls: one structured event per call (endpoint, parameters, HTTP status, byte counts,
+timings, cache and retry outcomes), passed to the observers registered on the client.
+"""
+
+# ======================================================================================================================
+
+import contextlib
+import threading
+import time
+from collections import deque
+
+from amberdata_derivatives import lazy
+
+# Imported on the first failure of an observer
+logging = lazy.load('logging')
+
+# Cache outcomes of a call
+MEMORY = 'memory'
+DISK = 'disk'
+MISS = 'miss'
+
+
+# ======================================================================================================================
+
+# pylint: disable=too-many-instance-attributes, too-few-public-methods
+class RequestEvent:
+    """
+    Class describing one call of an endpoint, as passed to the observers once the call completes (or fails).
+
+    ATTRIBUTES:
+    - url_path           (string) The path of the endpoint.
+    - params             (dict)   The query parameters of the call.
+    - status             (int)    The HTTP status of the (last) request, None if no request was issued.
+    - cache              (string) The cache outcome (memory | disk | miss), None if the client has no cache.
+    - coalesced          (bool)   True if the call shared the response of an identical call in flight.
+    - retries            (int)    The number of retries of the request.
+    - compressed_bytes   (int)    The number of bytes received (as sent by the API, ex: gzip).
+    - uncompressed_bytes (int)    The number of bytes of the decompressed body.
+    - timings            (dict)   The durations (in seconds) of the phases of the call:
+                                  - connect:    opening new connections (DNS, TCP & TLS), 0 if a connection was reused
+                                  - first_byte: from sending the (last) request to receiving the response headers
+                                  - download:   receiving the (compressed) body
+                                  - decompress: decompressing the body
+                                  - decode:     parsing the JSON body
+                                  - total:      the whole call, including cache lookups, throttling and retries
+    - error              (object) The exception raised by the call, if any.
+    """
+
+    def __init__(self, url_path: str, params: dict):
+        """
+        Initializes the event of a call starting now.
+        """
+
+        self.url_path = url_path
+        self.params = dict(params)
+        self.status = None
+        self.cache = None
+        self.coalesced = False
+        self.retries = 0
+        self.compressed_bytes = None
+        self.uncompressed_bytes = None
+        self.timings = {
+            'connect': 0.0, 'first_byte': None, 'download': None, 'decompress': None, 'decode': None, 'total': None
+        }
+        self.error = None
+
+        self.__started = time.perf_counter()
+
+    def finish(self, error: BaseException = None):
+        """
+        Records the end of the call (and its exception, if any), and returns the event.
+        """
+
+        self.timings['total'] = time.perf_counter() - self.__started
+        self.error = error
+        return self
+
+    def to_dict(self) -> dict:
+        """
+        Returns the event as a dictionary (ex: to log it as JSON), the exception being replaced by its description.
+        """
+
+        return {
+            'url_path':           self.url_path,
+            'params':             dict(self.params),
+            'status':             self.status,
+            'cache':              self.cache,
+            'coalesced':          self.coalesced,
+            'retries':            self.retries,
+            'compressed_bytes':   self.compressed_bytes,
+            'uncompressed_bytes': self.uncompressed_bytes,
+            'timings':            dict(self.timings),
+            'error':              None if self.error is None else f"{type(self.error).__name__}: {self.error}",
+        }
+
+    def __repr__(self):
+        return f"RequestEvent({self.to_dict()})"
+
+
+# ======================================================================================================================
+
+class EventRecorder:
+    """
+    Class to keep the events of the latest calls in memory (ex: to inspect them, or in tests). Thread-safe.
+    """
+
+    def __init__(self, max_events: int = 10000):
+        """
+        Initializes the recorder.
+
+        PARAMS:
+        - max_events (int) The maximum number of events kept (the oldest are discarded first).
+        """
+
+        self.__events = deque(maxlen=max_events)
+        self.__lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent):
+        with self.__lock:
+            self.__events.append(event)
+
+    @property
+    def events(self) -> list:
+        """
+        Returns the recorded events, from the oldest to the latest.
+        """
+
+        with self.__lock:
+            return list(self.__events)
+
+    def clear(self):
+        """
+        Discards all the recorded events.
+        """
+
+        with self.__lock:
+            self.__events.clear()
+
+
+# ======================================================================================================================
+
+@contextlib.contextmanager
+def observe(observers: list, event: RequestEvent):
+    """
+    Context manager passing the event of the call it wraps to the observers, once the call completes (or fails).
+    """
+
+    if event is None:
+        yield event
+        return
+
+    try:
+        yield event
+    except BaseException as e:
+        notify(observers, event.finish(e))
+        raise
+    notify(observers, event.finish())
+
+
+def notify(observers: list, event: RequestEvent):
+    """
+    Passes an event to each observer. An observer raising an exception is logged, and does not fail the call.
+    """
+
+    for observer in observers:
+        try:
+            observer(event)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.getLogger(__name__).exception("Observer %r failed on %r", observer, event)
+
+# ======================================================================================================================
@@ -0,0 +1,75 @@
+# ======================================================================================================================
+
+"""
+Module to decode JSON documents with the fastest backend installed (orjson, simdjson), or the standard library.
+"""
+
+# ======================================================================================================================
+
+import json
+
+from amberdata_derivatives import lazy
+
+# Imported on first use
+orjson = lazy.load('orjson')
+simdjson = lazy.load('simdjson')
+
+ORJSON = 'orjson'
+SIMDJSON = 'simdjson'
+STDLIB = 'json'
+
+# Backends by order of preference
+BACKENDS = (ORJSON, SIMDJSON, STDLIB)
+AVAILABLE_BACKENDS = tuple(
+    backend for backend, module in zip(BACKENDS, (orjson, simdjson, json)) if module is not None
+)
+DEFAULT_BACKEND = AVAILABLE_BACKENDS[0]
+
+
+# ======================================================================================================================
+
+def get_loads(backend: str = None):
+    """
+    Returns the decoding function of a backend (orjson | simdjson | json), or of the fastest one installed if None.
+
+    The decoded objects are identical whatever the backend: documents a fast backend rejects (ex: NaN, integers over
+    64 bits) are decoded by the standard library instead.
+    """
+
+    backend = DEFAULT_BACKEND if backend is None else backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Invalid JSON backend: expected one of {list(BACKENDS)}, found '{backend}'.")
+    if backend not in AVAILABLE_BACKENDS:
+        raise ImportError(f"JSON backend '{backend}' is not installed (pip install {backend}).")
+
+    return {ORJSON: _orjson_loads, SIMDJSON: _simdjson_loads, STDLIB: json.loads}[backend]
+
+
+def loads(data):
+    """
+    Decodes a JSON document (bytes or string) with the default backend.
+    """
+
+    return _DEFAULT_LOADS(data)
+
+
+# ======================================================================================================================
+
+def _orjson_loads(data):
+    # pylint: disable=no-member # orjson is a compiled extension, which pylint does not inspect
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _simdjson_loads(data):
+    try:
+        return simdjson.loads(data)
+    except ValueError:
+        return json.loads(data)
+
+
+_DEFAULT_LOADS = get_loads()
+
+# ======================================================================================================================
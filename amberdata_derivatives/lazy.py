@@ -0,0 +1,52 @@
+# ======================================================================================================================
+
+"""
+Module to defer the import of heavy dependencies (requests, aiohttp, NumPy, pandas...) until they are first used, to
+keep the import of the SDK fast.
+"""
+
+# ======================================================================================================================
+
+import importlib
+import importlib.util
+import sys
+import types
+
+
+# ======================================================================================================================
+
+class LazyModule(types.ModuleType):
+    """
+    Class standing for a module, which is imported on the first access to one of its attributes.
+    """
+
+    def __getattr__(self, name: str):
+        # Not looked up in sys.modules: a module being imported by another thread is there partially initialized, and
+        # importing it waits for its initialization
+        return getattr(importlib.import_module(self.__name__), name)
+
+    def __repr__(self):
+        return f"<lazy module '{self.__name__}'>"
+
+
+def load(name: str):
+    """
+    Returns a module (ex: 'numpy'), imported on first use, or None if it is not installed (as a failed import would).
+    """
+
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    # The standard library is always installed (looking a module up costs about as much as importing a small one)
+    if name.partition('.')[0] in getattr(sys, 'stdlib_module_names', ()):
+        return LazyModule(name)
+
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+
+    return None if spec is None else LazyModule(name)
+
+# ======================================================================================================================
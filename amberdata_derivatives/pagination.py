@@ -0,0 +1,172 @@
+# ======================================================================================================================
+
+"""
+Module to walk the results of a call page by page: following the continuation links of the API when present, or
+else a date range in consecutive time windows (cursors on the timestamp field of the records).
+"""
+
+# ======================================================================================================================
+
+import time
+from collections import deque
+from urllib.parse import parse_qsl, urlsplit
+
+from amberdata_derivatives import ranges
+
+# Time span (in milliseconds) of the pages of endpoints serving any date range in one call
+DEFAULT_PAGE_SIZE = ranges.DAY
+
+
+# ======================================================================================================================
+
+def get_next_url(response):
+    """
+    Returns the continuation link of a response (`payload.metadata.next`), or None if it is the last page.
+    """
+
+    if not isinstance(response, dict) or response.get('status') != 200:
+        return None
+
+    payload = response.get('payload')
+    metadata = payload.get('metadata') if isinstance(payload, dict) else None
+    return (metadata.get('next') if isinstance(metadata, dict) else None) or None
+
+
+def parse_url(url: str) -> tuple:
+    """
+    Returns the URL path and the query parameters of a continuation link.
+    """
+
+    split_url = urlsplit(url)
+    return split_url.path.strip('/'), dict(parse_qsl(split_url.query, keep_blank_values=True))
+
+
+# ======================================================================================================================
+
+# pylint: disable=too-many-instance-attributes, too-few-public-methods
+class PageCursor:
+    """
+    Class holding the position of a paginated call: the request of the next page, None once all pages were fetched,
+    and whether its parameters are to be validated (not those of the continuation links, built by the API).
+
+    The pages of a date range (`startDate`, and `endDate` - defaults to now) are consecutive time windows of
+    `page_size` milliseconds: a cursor on the timestamp field of the records. A window whose response carries a
+    continuation link is completed first; a window whose page is full (`page_limit` records, capped by the API) is
+    completed from the latest timestamp of the page. Records repeated on both sides of a boundary are returned once.
+    """
+
+    def __init__(self, endpoint, query_params: dict, page_size: int = None, page_limit: int = None):
+        """
+        Initializes the cursor on the first page.
+
+        PARAMS:
+        - endpoint     (object) The endpoint called (see `endpoints.Endpoint`).
+        - query_params (dict)   The parameters of the call.
+        - page_size    (int)    The time span of a page (in milliseconds), defaults to the largest window the endpoint
+                                serves in one call (for the requested `timeInterval`), or to DEFAULT_PAGE_SIZE.
+        - page_limit   (int)    The number of records of a full page, defaults to the `limit` parameter of the call
+                                (None: pages are never full).
+        """
+
+        self.url_path = endpoint.url_path
+        self.request = None
+        self.validate = True
+
+        self.__query_params = dict(query_params)
+        self.__field = endpoint.timestamp_field
+        self.__limit = page_limit or (int(query_params['limit']) if query_params.get('limit') is not None else None)
+        self.__windows = deque()
+        self.__window = None
+        self.__boundary = None
+
+        if 'startDate' in query_params:
+            end_date = query_params.get('endDate', int(time.time() * 1000))
+            size = page_size or ranges.window_size(endpoint.range_limits, query_params.get('timeInterval'))
+            self.__windows.extend(ranges.split_range(query_params['startDate'], end_date, size or DEFAULT_PAGE_SIZE))
+            self.__next_window()
+        else:
+            self.request = (self.url_path, dict(self.__query_params))
+
+    def advance(self, response):
+        """
+        Moves the cursor past the page of a response (to its continuation link, to the rest of a full window, or to the
+        next window), and returns the page without the records already returned. Stops on an unsuccessful response.
+        """
+
+        if not isinstance(response, dict) or response.get('status') != 200:
+            self.request = None
+            return response
+
+        records = response['payload']['data']
+        if not isinstance(records, list):
+            records = []
+        elif self.__boundary is not None:
+            response = {**response, 'payload': {**response['payload'], 'data': ranges.drop_boundary(
+                records, self.__boundary, self.__field
+            )}}
+
+        next_url = get_next_url(response)
+        if next_url is not None:
+            self.__boundary = None
+            self.request = parse_url(next_url)
+            self.validate = False
+        elif self.__window is not None and self.__limit is not None and len(records) >= self.__limit:
+            # The records after the latest timestamp of a full page were capped: the window resumes from it
+            self.__boundary = ranges.get_boundary(records, self.__field)
+            self.__resume_window()
+        elif self.__windows:
+            # Records at the end of a window may be returned again at the start of the next one
+            self.__boundary = ranges.get_boundary(records, self.__field) if records else self.__boundary
+            self.__next_window()
+        else:
+            self.request = None
+
+        return response
+
+    def __next_window(self):
+        """Helper method to move the cursor to the next window of the date range."""
+
+        self.__window = self.__windows.popleft()
+        self.__request_window()
+
+    def __resume_window(self):
+        """Helper method to move the start of the current window to the latest timestamp of its last page."""
+
+        start, end = self.__window
+        latest = self.__boundary[0]
+        resumed = _to_milliseconds(latest) if latest is not None else start
+        if resumed <= start:
+            # A full page of records at one timestamp (or without timestamps): the window resumes just after it
+            resumed = start + 1
+            self.__boundary = None
+
+        if resumed >= end:
+            self.__window = None
+            if self.__windows:
+                self.__next_window()
+            else:
+                self.request = None
+            return
+
+        self.__window = (resumed, end)
+        self.__request_window()
+
+    def __request_window(self):
+        """Helper method to set the request of the current window."""
+
+        start, end = self.__window
+        self.request = (self.url_path, {**self.__query_params, 'startDate': start, 'endDate': end})
+        self.validate = True
+
+
+# ======================================================================================================================
+
+def _to_milliseconds(value) -> int:
+    """Helper function to convert a timestamp in any `timeFormat` (ms, iso or hr) into milliseconds since epoch."""
+
+    if isinstance(value, str) and len(value) >= 23 and value[19] == ' ':
+        # Human-readable timestamps (2024-04-01 00:00:00 000) only differ from ISO strings by their separators
+        value = f"{value[:19]}.{value[20:23]}Z"
+    return ranges.to_milliseconds(value)
+
+# ======================================================================================================================
@@ -0,0 +1,202 @@
+# ======================================================================================================================
+
+"""
+Module to store the records of endpoints in a local Parquet dataset, partitioned by endpoint / exchange / currency /
+day, to query large histories (ex: a year of level 1 quotes) without calling the API again.
+"""
+
+# ======================================================================================================================
+
+import os
+import time
+import uuid
+
+from amberdata_derivatives import arrow_tables, endpoints, lazy, ranges
+
+# Imported on the construction of the first store
+pa = lazy.load('pyarrow')
+pc = lazy.load('pyarrow.compute')
+ds = lazy.load('pyarrow.dataset')
+pafs = lazy.load('pyarrow.fs')
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'amberdata-derivatives', 'parquet')
+
+# Partitions of the dataset of an endpoint (hive layout: exchange=deribit/currency=BTC/date=2024-04-01)
+PARTITION_FIELDS = ('exchange', 'currency', 'date')
+
+
+# ======================================================================================================================
+
+class ParquetStore:
+    """
+    Class to store the records of endpoints in a columnar, compressed Parquet dataset (one per endpoint).
+
+    Records are partitioned by exchange, currency and day (of their timestamp field), and typed according to the
+    schemas of the endpoints. Reads are memory-mapped, only load the requested columns, and push their filters down to
+    the partitions and row groups of the dataset (ex: time range, instrument, strike, putCall).
+    """
+
+    def __init__(self, root: str = DEFAULT_PATH, compression: str = 'zstd'):
+        """
+        Initializes the store.
+
+        PARAMS:
+        - root        (string) The directory of the datasets (created if missing).
+        - compression (string) The compression codec of the Parquet files (zstd | snappy | gzip | lz4 | none).
+        """
+
+        if pa is None:
+            raise ImportError("Parquet stores require 'pyarrow' (pip install amberdata-derivatives[parquet]).")
+
+        self.root = root
+        self.compression = compression
+
+        os.makedirs(root, exist_ok=True)
+
+        self.__filesystem = pafs.LocalFileSystem(use_mmap=True)
+        self.__partitioning = ds.partitioning(
+            pa.schema([(name, pa.string()) for name in PARTITION_FIELDS]), flavor='hive'
+        )
+
+    # ==================================================================================================================
+
+    def write(self, function_name: str, response, replace: bool = False, **query_params) -> int:
+        """
+        Writes the records of a response (or the records themselves: list of records, columns or DataFrame) to the
+        dataset of an endpoint, and returns the number of records written.
+
+        The exchange and currency of records missing these fields are taken from `query_params` (the parameters of
+        the call). Records are appended to their partitions, unless `replace` is set: the partitions written to are
+        then replaced.
+        """
+
+        if isinstance(response, dict) and 'payload' in response:
+            if response.get('status') != 200:
+                raise ValueError(f"Invalid response: only successful responses can be stored, found status "
+                                 f"'{response.get('status')}'.")
+            response = response['payload'].get('data')
+
+        table = _to_table(function_name, response, query_params)
+        if table.num_rows == 0:
+            return 0
+
+        ds.write_dataset(
+            table,
+            self.get_path(function_name),
+            format='parquet',
+            partitioning=self.__partitioning,
+            filesystem=self.__filesystem,
+            file_options=ds.ParquetFileFormat().make_write_options(compression=self.compression),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior='delete_matching' if replace else 'overwrite_or_ignore',
+        )
+        return table.num_rows
+
+    def read(self, function_name: str, columns: list = None, start_date=None, end_date=None, **filters):
+        """
+        Returns the records of an endpoint as an Arrow table (see `pyarrow.Table.to_pandas`), ordered by time.
+
+        PARAMS:
+        - function_name (string) [Required] [Examples] get_volatility_level_1_quotes
+        - columns       (list)   [Optional] [Examples] ['timestamp', 'instrument', 'markIv'] (defaults to all)
+        - start_date    (any)    [Optional] [Examples] 2024-04-01T00:00:00 | 1711929600000 (included)
+        - end_date      (any)    [Optional] [Examples] 2024-05-01T00:00:00 | 1714521600000 (excluded)
+        - filters       (any)    [Optional] [Examples] exchange='deribit', currency='BTC', putCall='C',
+                                                       instrument='BTC-26APR24-60000-C', strike=[60000, 65000]
+                                                       (one value, or a list of accepted values, per field)
+        """
+
+        path = self.get_path(function_name)
+        if not os.path.isdir(path):
+            table = _get_schema(function_name).empty_table()
+            return table if columns is None else table.select(columns)
+
+        dataset = ds.dataset(path, format='parquet', partitioning=self.__partitioning, filesystem=self.__filesystem)
+        timestamp_field = _get_timestamp_field(function_name)
+
+        expression = _get_filter(timestamp_field, start_date, end_date, filters)
+        table = dataset.to_table(columns=columns, filter=expression)
+        if timestamp_field in table.column_names:
+            table = table.sort_by(timestamp_field)
+        return table
+
+    def get_path(self, function_name: str) -> str:
+        """
+        Returns the directory of the dataset of an endpoint.
+        """
+
+        endpoints.get_endpoint(function_name)
+        return os.path.join(self.root, function_name)
+
+
+# ======================================================================================================================
+
+def _get_filter(timestamp_field: str, start_date, end_date, filters: dict):
+    """Helper function to return the filter expression of a read (None if it has no filters)."""
+
+    conditions = []
+    for name, value in filters.items():
+        values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+        conditions.append(ds.field(name).isin(values))
+
+    # The day partitions prune the files out of the time range, and the timestamps the row groups and records
+    if start_date is not None:
+        start = ranges.to_milliseconds(start_date)
+        conditions.append(ds.field('date') >= _to_day(start))
+        conditions.append(ds.field(timestamp_field) >= pa.scalar(start, arrow_tables.get_arrow_type()))
+    if end_date is not None:
+        end = ranges.to_milliseconds(end_date)
+        conditions.append(ds.field('date') <= _to_day(end - 1))
+        conditions.append(ds.field(timestamp_field) < pa.scalar(end, arrow_tables.get_arrow_type()))
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _get_schema(function_name: str):
+    """Helper function to return the schema of the dataset of an endpoint (its known fields, and its partitions)."""
+
+    schema = arrow_tables.get_schema(function_name)
+    return pa.schema(list(schema) + [(name, pa.string()) for name in PARTITION_FIELDS if name not in schema.names])
+
+
+def _to_table(function_name: str, data, query_params: dict):
+    """Helper function to convert records into a table typed by the schema of the endpoint, with its partitions."""
+
+    table = arrow_tables.to_table(function_name, data)
+
+    # Partitions: the exchange and currency of the call for the records which lack them, and the day of the records
+    for name in PARTITION_FIELDS:
+        if name in table.column_names:
+            column = table.column(name).cast(pa.string())
+            if query_params.get(name) is not None:
+                column = pc.fill_null(column, str(query_params[name]))
+            table = table.set_column(table.column_names.index(name), name, column)
+        else:
+            table = table.append_column(name, pa.nulls(table.num_rows, pa.string()))
+
+    timestamp_field = _get_timestamp_field(function_name)
+    if timestamp_field in table.column_names:
+        days = pc.strftime(table.column(timestamp_field).cast(pa.timestamp(arrow_tables.TIMESTAMP_UNIT)),
+                           format='%Y-%m-%d')
+        table = table.set_column(table.column_names.index('date'), 'date', days)
+        # Records ordered by time make the statistics of the row groups selective on time ranges
+        table = table.sort_by(timestamp_field)
+
+    return table
+
+
+def _get_timestamp_field(function_name: str) -> str:
+    """Helper function to return the field holding the time of the records of an endpoint."""
+
+    return endpoints.get_endpoint(function_name).timestamp_field
+
+
+def _to_day(milliseconds: int) -> str:
+    """Helper function to return the day partition of a time (ex: '2024-04-01')."""
+
+    return time.strftime('%Y-%m-%d', time.gmtime(milliseconds // 1000))
+
+# ======================================================================================================================
@@ -0,0 +1,111 @@
+# ======================================================================================================================
+
+"""
+Module to check the parameters of the calls against the specs of the endpoints (see `endpoints.SPECS`) before they
+are sent, and to encode them into canonical query strings (ordered by name, and URL-encoded).
+"""
+
+# ======================================================================================================================
+
+import datetime as dt
+from urllib.parse import quote, urlencode
+
+from amberdata_derivatives import ranges, schemas
+
+# Fields of the responses of the API to invalid calls
+BAD_REQUEST = {
+    'description': 'Request was invalid or cannot be served. See message for details',
+    'error':       True,
+    'status':      400,
+    'title':       'BAD REQUEST',
+}
+
+# Characters left as is in the query strings (besides letters, digits and '_.-~')
+SAFE_CHARACTERS = ':,'
+
+
+# ======================================================================================================================
+
+def canonical_value(value) -> str:
+    """
+    Returns the canonical form of a parameter value, as sent to the API (ex: True -> 'true').
+    """
+
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, dt.datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def canonicalize(query_params: dict) -> tuple:
+    """
+    Returns the canonical form of the parameters of a call: their (name, value) pairs, ordered by name.
+    """
+
+    return tuple(sorted((key, canonical_value(value)) for key, value in query_params.items()))
+
+
+def encode(query_params: dict) -> str:
+    """
+    Returns the canonical query string of the parameters of a call (ex: 'currency=BTC&exchange=deribit').
+    """
+
+    return urlencode(canonicalize(query_params), safe=SAFE_CHARACTERS, quote_via=quote)
+
+
+# ======================================================================================================================
+
+def validate(endpoint, query_params: dict):
+    """
+    Returns the message of the first invalid parameter of a call to an endpoint (worded as the API would), or None if
+    all the parameters are valid.
+
+    Checked: unsupported parameters, and values not matching the type of their parameter (integers, dates or accepted
+    values) - only the checks the API makes itself, with its messages. Booleans are left to the API, which accepts
+    any value.
+    """
+
+    params = endpoint.params
+    for name, value in query_params.items():
+        kind = params.get(name)
+        if kind is None:
+            return f"Parameter '{name}' is not supported."
+
+        message = _validate_value(name, value, kind)
+        if message is not None:
+            return message
+
+    return None
+
+
+def bad_request(message: str) -> dict:
+    """
+    Returns the response of the API to an invalid call.
+    """
+
+    return {**BAD_REQUEST, 'message': message}
+
+
+# ======================================================================================================================
+
+def _validate_value(name: str, value, kind):
+    """Helper function to check the value of a parameter against its type (or its accepted values)."""
+
+    if isinstance(kind, tuple):
+        if canonical_value(value) not in kind:
+            return f"Invalid argument {name}: expected one of [{','.join(kind)}], found '{value}'."
+
+    elif kind == schemas.INT:
+        if isinstance(value, bool) or not str(value).lstrip('-').isdigit():
+            return f"The argument '{name}' is not in numerical form ({value})."
+
+    elif kind == schemas.TIMESTAMP:
+        try:
+            ranges.to_milliseconds(value)
+        except ValueError as e:
+            return str(e)
+
+    return None
+
+# ======================================================================================================================
@@ -0,0 +1,181 @@
+# ======================================================================================================================
+
+"""
+Module to split historical date ranges into windows the API can serve in one call, and to merge the results back.
+"""
+
+# ======================================================================================================================
+
+import datetime as dt
+import json
+import re
+
+MINUTE = 60 * 1000
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Accepted spellings of the `timeInterval` parameter
+TIME_INTERVALS = {
+    'm': 'minute', 'minute': 'minute', 'minutes': 'minute',
+    'h': 'hour',   'hour':   'hour',   'hours':   'hour',
+    'd': 'day',    'day':    'day',    'days':    'day',
+}
+
+# ISO 8601 dates, as documented by the API: 2024-04-03, 2024-04-03T08:00:00, 2024-04-03T08:00:00.123Z,
+# 2024-04-03T08:00:00+02:00... (parsed the same way whatever the version of Python)
+ISO_DATE = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,9}))?)?)?'
+    r'(Z|[+-]\d{2}:?\d{2})?'
+)
+
+
+# ======================================================================================================================
+
+def to_milliseconds(value) -> int:
+    """
+    Converts a date (as accepted by the API) into a number of milliseconds since epoch (UTC).
+
+    Accepted values: seconds (1578531600), milliseconds (1578531600000), ISO 8601 strings (2024-04-03T08:00:00) and
+    `datetime` objects. Dates without timezone are assumed to be in UTC.
+    """
+
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value * 1000) if value < 100000000000 else int(value)
+
+    if isinstance(value, str):
+        value = _parse_iso_date(value)
+
+    if isinstance(value, dt.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dt.timezone.utc)
+        return int(value.timestamp() * 1000)
+
+    raise ValueError(f"Invalid timestamp value: '{value}'.")
+
+
+def window_size(limits: dict, time_interval: str = None):
+    """
+    Returns the largest date range (in milliseconds) served in one call for a `timeInterval`, given the limits of an
+    endpoint (see `endpoints.SPECS`), or None if unlimited.
+    """
+
+    if time_interval is None:
+        return limits.get(None)
+
+    interval = TIME_INTERVALS.get(str(time_interval).lower())
+    if interval is None:
+        raise ValueError(f"Invalid argument timeInterval: expected one of [minute,hour,day], found '{time_interval}'.")
+
+    return limits.get(interval)
+
+
+def split_range(start_date, end_date, size: int = None) -> list:
+    """
+    Splits the date range [start_date, end_date) into consecutive windows (start_ms, end_ms) of `size` milliseconds at
+    most (one window if None).
+    """
+
+    start = to_milliseconds(start_date)
+    end = to_milliseconds(end_date)
+    if start >= end:
+        raise ValueError(f"Invalid date range: startDate '{start_date}' is not before endDate '{end_date}'.")
+
+    size = size or end - start
+    return [(window_start, min(window_start + size, end)) for window_start in range(start, end, size)]
+
+
+def merge_responses(responses: list, field: str = 'timestamp'):
+    """
+    Merges the responses of consecutive windows into one response, ordered by `field`. Records repeated on both sides
+    of a window boundary are kept once (see `drop_boundary`): other records are all kept, even if identical.
+
+    If any response is not successful, it is returned as is (mirroring a single call failing).
+    """
+
+    for response in responses:
+        if response.get('status') != 200:
+            return response
+
+    data = []
+    boundary = None
+    for response in responses:
+        records = response['payload']['data']
+        data.extend(drop_boundary(records, boundary, field) if boundary is not None else records)
+        boundary = get_boundary(records, field) if records else boundary
+
+    # Records without a timestamp are kept last (in the order received)
+    data.sort(key=lambda record: (record.get(field) is None, record.get(field) or 0))
+
+    merged = dict(responses[0])
+    merged['payload'] = {**responses[0]['payload'], 'data': data}
+    return merged
+
+
+def get_boundary(records: list, field: str = 'timestamp') -> tuple:
+    """
+    Returns the boundary of the records of a window: their latest time (value of `field`), and the keys of the records
+    at that time (the only records the next window returns again) - (None, empty set) if no record has a time.
+    """
+
+    times = [record.get(field) for record in records if record.get(field) is not None]
+    if not times:
+        return None, set()
+
+    latest = max(times)
+    return latest, {_get_key(record) for record in records if record.get(field) == latest}
+
+
+def drop_boundary(records: list, boundary: tuple, field: str = 'timestamp') -> list:
+    """
+    Returns the records of the window following a boundary (see `get_boundary`), without those the previous window
+    returned: the records before its latest time, and the records at that time with the same content.
+    """
+
+    latest, keys = boundary
+    if latest is None:
+        return records
+
+    return [
+        record for record in records
+        if record.get(field) is None or record.get(field) > latest
+        or (record.get(field) == latest and _get_key(record) not in keys)
+    ]
+
+
+# ======================================================================================================================
+
+def _get_key(record) -> str:
+    """Helper function to identify a record (by its content)."""
+
+    return json.dumps(record, sort_keys=True)
+
+
+def _parse_iso_date(value: str) -> dt.datetime:
+    """Helper function to parse an ISO 8601 date (fractional seconds are truncated to microseconds)."""
+
+    match = ISO_DATE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid timestamp value: '{value}'.")
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = None
+    if offset == 'Z':
+        tzinfo = dt.timezone.utc
+    elif offset is not None:
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        tzinfo = dt.timezone(sign * dt.timedelta(hours=int(digits[:2]), minutes=int(digits[2:])))
+
+    try:
+        return dt.datetime(
+            int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+            int((fraction or '0')[:6].ljust(6, '0')), tzinfo=tzinfo
+        )
+    except ValueError as e:
+        raise ValueError(f"Invalid timestamp value: '{value}'.") from e
+
+# ======================================================================================================================
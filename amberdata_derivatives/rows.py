@@ -0,0 +1,92 @@
+# ======================================================================================================================
+
+"""
+Module to convert the records of a response (`payload.data`) into compact row objects: one typed named tuple class
+per endpoint, generated from its schema (see `schemas.FIELDS`).
+"""
+
+# ======================================================================================================================
+
+import collections
+import functools
+import sys
+from typing import Optional, Union
+
+from amberdata_derivatives import schemas
+
+# Python type of each field type (timestamps are integers or strings, depending on `timeFormat`)
+PYTHON_TYPES = {
+    schemas.BOOL:      bool,
+    schemas.FLOAT:     float,
+    schemas.INT:       int,
+    schemas.STR:       str,
+    schemas.TIMESTAMP: Union[int, str],
+}
+
+# Number of row classes kept (one per endpoint and set of fields: responses with unexpected fields add classes)
+MAX_ROW_CLASSES = 256
+
+
+# ======================================================================================================================
+
+@functools.lru_cache(maxsize=MAX_ROW_CLASSES)
+def get_row_class(function_name: str, names: tuple = None) -> type:
+    """
+    Returns the row class of an endpoint (ex: 'get_volatility_level_1_quotes' -> VolatilityLevel1QuotesRow): a named
+    tuple with one attribute per field of its schema (in the order of `names` if set, to add fields it misses).
+
+    Rows take no per-instance dictionary (`__slots__ = ()`): a level 1 quote takes about a third of the memory of its
+    record, and its fields are read as attributes (ex: row.markIv) or converted back with `row._asdict()`. Fields
+    which are not valid attribute names (keywords, leading underscores...) are renamed by position (ex: `_3`).
+    """
+
+    fields = schemas.get_fields(function_name)
+    if names is None:
+        names = tuple(fields)
+
+    words = function_name.split('_')[1:] if function_name else []
+    class_name = ''.join(word.capitalize() for word in words) + 'Row'
+    row_class = collections.namedtuple(class_name, names, defaults=(None,) * len(names), rename=True)
+    row_class.__annotations__ = {
+        attribute: Optional[PYTHON_TYPES.get(fields.get(name), object)]
+        for attribute, name in zip(row_class._fields, names)
+    }
+    return row_class
+
+
+def to_rows(data: list, function_name: str) -> list:
+    """
+    Converts a list of records into row objects of the class of an endpoint (see `get_row_class`). Fields missing from
+    a record are None; fields missing from the schema of the endpoint are added to the class.
+
+    The values of categorical fields (see `schemas.CATEGORICAL_FIELDS`) are interned: all the rows share one string
+    per distinct instrument, exchange...
+    """
+
+    names = dict.fromkeys(schemas.get_fields(function_name))
+    for record in data:
+        names.update(dict.fromkeys(record))
+
+    make = get_row_class(function_name, tuple(names))._make
+    positions = [index for index, name in enumerate(names) if name in schemas.CATEGORICAL_FIELDS]
+    if not positions:
+        return [make(map(record.get, names)) for record in data]
+
+    rows = []
+    for record in data:
+        values = list(map(record.get, names))
+        for index in positions:
+            if isinstance(values[index], str):
+                values[index] = sys.intern(values[index])
+        rows.append(make(values))
+    return rows
+
+
+def intern_strings(values: list) -> list:
+    """
+    Returns the values with their strings interned (one object per distinct string, shared by all the values).
+    """
+
+    return [sys.intern(value) if isinstance(value, str) else value for value in values]
+
+# ======================================================================================================================
@@ -0,0 +1,612 @@
+# ======================================================================================================================
+
+"""
+Module describing the records returned by the endpoints of the API: their fields (in `payload.data`), and their types.
+"""
+
+# ======================================================================================================================
+
+# Field types (also the types of the parameters of the endpoints, see `endpoints.SPECS`)
+BOOL = 'bool'
+FLOAT = 'float'
+INT = 'int'
+STR = 'str'
+TIMESTAMP = 'timestamp'  # Milliseconds (integer) or ISO/human-readable (string), depending on `timeFormat`
+
+# String fields repeating a few distinct values across the records of a response (dictionary-encoded on conversion:
+# interned strings in rows, categorical columns in DataFrames)
+CATEGORICAL_FIELDS = frozenset(('currency', 'exchange', 'instrument', 'instrumentNormalized', 'putCall'))
+
+# Fields of the records returned by each endpoint (as documented in tests/schemata)
+FIELDS = {
+    'get_futures_perpetuals_apr_basis_constant_maturities': {
+        'apr':       FLOAT,
+        'basisUSD':  FLOAT,
+        'symbol':    STR,
+        'timestamp': TIMESTAMP,
+    },
+    'get_futures_perpetuals_apr_basis_live_term_structures': {
+        'apr':                 FLOAT,
+        'basis':               FLOAT,
+        'exchange':            STR,
+        'expirationTimestamp': TIMESTAMP,
+        'marginType':          STR,
+        'price':               FLOAT,
+    },
+    'get_futures_perpetuals_open_interest': {
+        'coin':      FLOAT,
+        'exchange':  STR,
+        'timestamp': TIMESTAMP,
+        'usd':       FLOAT,
+    },
+    'get_futures_perpetuals_realized_funding_rates_cumulated': {
+        'accumulatedRealizedFunding': FLOAT,
+        'realizedFunding':            FLOAT,
+        'symbol':                     STR,
+        'timestamp':                  TIMESTAMP,
+    },
+    'get_futures_perpetuals_volumes': {
+        'exchange':               STR,
+        'timestamp':              TIMESTAMP,
+        'totalDailyVolume':       FLOAT,
+        'totalDailyVolumeMilUSD': FLOAT,
+        'totalDailyVolumeNative': FLOAT,
+        'underlying':             STR,
+    },
+    'get_instruments_information': {
+        'currency':         STR,
+        'endDate':          TIMESTAMP,
+        'exchange':         STR,
+        'expiration':       TIMESTAMP,
+        'instrument':       STR,
+        'multiplier':       FLOAT,
+        'nativeInstrument': STR,
+        'putCall':          STR,
+        'strike':           FLOAT,
+    },
+    'get_instruments_most_traded': {
+        'contractVolume': FLOAT,
+        'currency':       STR,
+        'exchange':       STR,
+        'instrument':     STR,
+    },
+    'get_options_scanner_block_trades': {
+        'indexPrice':  FLOAT,
+        'netPremium':  FLOAT,
+        'numTrades':   FLOAT,
+        'tradeAmount': FLOAT,
+        'uniqueTrade': STR,
+    },
+    'get_options_scanner_on_screen_trades': {
+        'indexPrice':  FLOAT,
+        'netPremium':  FLOAT,
+        'numTrades':   FLOAT,
+        'tradeAmount': FLOAT,
+        'uniqueTrade': STR,
+    },
+    'get_options_scanner_strikes_bought_sold': {
+        'expirationTimestamp': TIMESTAMP,
+        'openInterest':        FLOAT,
+        'putCall':             STR,
+        'snapshotTimestamp':   TIMESTAMP,
+        'strike':              FLOAT,
+    },
+    'get_options_scanner_top_trades': {
+        'amberdataDirection': STR,
+        'blockAmount':        FLOAT,
+        'blockTradeId':       STR,
+        'currency':           STR,
+        'exchange':           STR,
+        'exchangeDirection':  STR,
+        'exchangeTimestamp':  TIMESTAMP,
+        'hedgeInstrument':    FLOAT,
+        'hedgeIsBuySide':     FLOAT,
+        'hedgePrice':         FLOAT,
+        'hedgeVolume':        FLOAT,
+        'indexPrice':         FLOAT,
+        'instrument':         STR,
+        'numberOfLegs':       FLOAT,
+        'openInterestChange': FLOAT,
+        'price':              FLOAT,
+        'priceUsd':           FLOAT,
+        'sizeDelta':          FLOAT,
+        'sizeGamma':          FLOAT,
+        'sizeTheta':          FLOAT,
+        'sizeUSD':            FLOAT,
+        'sizeVega':           FLOAT,
+        'tradeAmount':        FLOAT,
+        'tradeIv':            FLOAT,
+    },
+    'get_options_scanner_top_trades_by_unique_trade': {
+        'amberdataDirection': STR,
+        'blockAmount':        FLOAT,
+        'blockTradeId':       STR,
+        'currency':           STR,
+        'exchange':           STR,
+        'exchangeDirection':  STR,
+        'exchangeTimestamp':  TIMESTAMP,
+        'hedgeInstrument':    FLOAT,
+        'hedgeIsBuySide':     FLOAT,
+        'hedgePrice':         FLOAT,
+        'hedgeVolume':        FLOAT,
+        'indexPrice':         FLOAT,
+        'instrument':         STR,
+        'numberOfLegs':       FLOAT,
+        'openInterestChange': FLOAT,
+        'price':              FLOAT,
+        'priceUsd':           FLOAT,
+        'sizeDelta':          FLOAT,
+        'sizeGamma':          FLOAT,
+        'sizeTheta':          FLOAT,
+        'sizeUSD':            FLOAT,
+        'sizeVega':           FLOAT,
+        'tradeAmount':        FLOAT,
+        'tradeIv':            FLOAT,
+    },
+    'get_realized_volatility_annual_performance': {
+        'day':      INT,
+        'exchange': STR,
+        'month':    INT,
+        'pair':     STR,
+        'pnl':      FLOAT,
+        'year':     INT,
+    },
+    'get_realized_volatility_cones': {
+        'current_14days':  FLOAT,
+        'current_180days': FLOAT,
+        'current_1day':    FLOAT,
+        'current_30days':  FLOAT,
+        'current_7days':   FLOAT,
+        'current_90days':  FLOAT,
+        'exchange':        STR,
+        'max_14days':      FLOAT,
+        'max_180days':     FLOAT,
+        'max_1day':        FLOAT,
+        'max_30days':      FLOAT,
+        'max_7days':       FLOAT,
+        'max_90days':      FLOAT,
+        'min_14days':      FLOAT,
+        'min_180days':     FLOAT,
+        'min_1day':        FLOAT,
+        'min_30days':      FLOAT,
+        'min_7days':       FLOAT,
+        'min_90days':      FLOAT,
+        'p25_14days':      FLOAT,
+        'p25_180days':     FLOAT,
+        'p25_1day':        FLOAT,
+        'p25_30days':      FLOAT,
+        'p25_7days':       FLOAT,
+        'p25_90days':      FLOAT,
+        'p50_14days':      FLOAT,
+        'p50_180days':     FLOAT,
+        'p50_1day':        FLOAT,
+        'p50_30days':      FLOAT,
+        'p50_7days':       FLOAT,
+        'p50_90days':      FLOAT,
+        'p75_14days':      FLOAT,
+        'p75_180days':     FLOAT,
+        'p75_1day':        FLOAT,
+        'p75_30days':      FLOAT,
+        'p75_7days':       FLOAT,
+        'p75_90days':      FLOAT,
+        'pair':            STR,
+    },
+    'get_realized_volatility_cones_information': {
+        'endTimestamp':   TIMESTAMP,
+        'exchange':       STR,
+        'pair':           STR,
+        'startTimestamp': TIMESTAMP,
+    },
+    'get_realized_volatility_correlation_beta': {
+        'timestamp':                TIMESTAMP,
+        'pairOne':                  STR,
+        'closeOne':                 FLOAT,
+        'returnOne':                FLOAT,
+        'realizedVolatility30One':  FLOAT,
+        'realizedVolatility90One':  FLOAT,
+        'realizedVolatility180One': FLOAT,
+        'pairTwo':                  STR,
+        'closeTwo':                 FLOAT,
+        'returnTwo':                FLOAT,
+        'realizedVolatility30Two':  FLOAT,
+        'realizedVolatility90Two':  FLOAT,
+        'realizedVolatility180Two': FLOAT,
+        'correlation30':            FLOAT,
+        'correlation90':            FLOAT,
+        'correlation180':           FLOAT,
+        'beta30':                   FLOAT,
+        'beta90':                   FLOAT,
+        'beta180':                  FLOAT,
+    },
+    'get_realized_volatility_implied_vs_realized': {
+        'atm180':               FLOAT,
+        'atm30':                FLOAT,
+        'atm60':                FLOAT,
+        'atm7':                 FLOAT,
+        'atm90':                FLOAT,
+        'currency':             STR,
+        'exchange':             STR,
+        'indexPrice':           FLOAT,
+        'lnReturn':             FLOAT,
+        'realizedVolatility30': FLOAT,
+        'realizedVolatility7':  FLOAT,
+        'timestamp':            TIMESTAMP,
+    },
+    'get_realized_volatility_monthly_vs_daily_ratio': {
+        'dailyClose':                      FLOAT,
+        'dailyHigh':                       FLOAT,
+        'dailyHistoricalVolatility30Days': FLOAT,
+        'dailyLow':                        FLOAT,
+        'dailyOpen':                       FLOAT,
+        'monthlyHigh':                     FLOAT,
+        'monthlyHistoricalVolatility':     FLOAT,
+        'monthlyLow':                      FLOAT,
+        'timestamp':                       TIMESTAMP,
+    },
+    'get_realized_volatility_performance_comparison': {
+        'timestamp':                   TIMESTAMP,
+        'exchange':                    STR,
+        'pair':                        STR,
+        'open':                        FLOAT,
+        'high':                        FLOAT,
+        'low':                         FLOAT,
+        'close':                       FLOAT,
+        'volume':                      FLOAT,
+        'historicalVolatility1day':    FLOAT,
+        'historicalVolatility2days':   FLOAT,
+        'historicalVolatility3days':   FLOAT,
+        'historicalVolatility7days':   FLOAT,
+        'historicalVolatility14days':  FLOAT,
+        'historicalVolatility21days':  FLOAT,
+        'historicalVolatility30days':  FLOAT,
+        'historicalVolatility60days':  FLOAT,
+        'historicalVolatility90days':  FLOAT,
+        'historicalVolatility180days': FLOAT,
+        'pnl':                         FLOAT,
+    },
+    'get_realized_volatility_seasonality_day_of_week': {
+        'historicalVolatility1day': FLOAT,
+        'weekday':                  STR,
+    },
+    'get_realized_volatility_seasonality_month_of_year': {
+        'historicalVolatility1day': FLOAT,
+        'month':                    STR,
+    },
+    'get_trades_flow_block_volumes': {
+        'contractVolume':      FLOAT,
+        'currency':            STR,
+        'exchange':            STR,
+        'expirationTimestamp': TIMESTAMP,
+        'premiumVolume':       FLOAT,
+        'putCall':             STR,
+        'strike':              FLOAT,
+    },
+    'get_trades_flow_decorated_trades': {
+        'amberdataDirection':          FLOAT,
+        'blockTradeId':                STR,
+        'currency':                    STR,
+        'delta':                       FLOAT,
+        'exchange':                    STR,
+        'exchangeDirection':           FLOAT,
+        'exchangeTimestamp':           TIMESTAMP,
+        'expirationTimestamp':         TIMESTAMP,
+        'gamma':                       FLOAT,
+        'indexPrice':                  FLOAT,
+        'instrument':                  STR,
+        'instrumentNormalized':        STR,
+        'liquidation':                 FLOAT,
+        'numberOfLegs':                FLOAT,
+        'openInterestChange':          FLOAT,
+        'postTradeAskIv':              FLOAT,
+        'postTradeAskPrice':           FLOAT,
+        'postTradeAskVolume':          FLOAT,
+        'postTradeBidIv':              FLOAT,
+        'postTradeBidPrice':           FLOAT,
+        'postTradeBidVolume':          FLOAT,
+        'postTradeMarkIv':             FLOAT,
+        'postTradeMarkPrice':          FLOAT,
+        'postTradeMidIv':              FLOAT,
+        'postTradeMidPrice':           FLOAT,
+        'postTradeOpenInterest':       FLOAT,
+        'postTradeOrderbookTimestamp': TIMESTAMP,
+        'preTradeAskIv':               FLOAT,
+        'preTradeAskPrice':            FLOAT,
+        'preTradeAskVolume':           FLOAT,
+        'preTradeBidIv':               FLOAT,
+        'preTradeBidPrice':            FLOAT,
+        'preTradeBidVolume':           FLOAT,
+        'preTradeMarkIv':              FLOAT,
+        'preTradeMarkPrice':           FLOAT,
+        'preTradeMidIv':               FLOAT,
+        'preTradeMidPrice':            FLOAT,
+        'preTradeOpenInterest':        FLOAT,
+        'preTradeOrderbookTimestamp':  TIMESTAMP,
+        'price':                       FLOAT,
+        'priceHigh24h':                FLOAT,
+        'priceLow24h':                 FLOAT,
+        'priceUsd':                    FLOAT,
+        'putCall':                     STR,
+        'rho':                         FLOAT,
+        'strike':                      FLOAT,
+        'theta':                       FLOAT,
+        'tickDirection':               STR,
+        'tradeAmount':                 FLOAT,
+        'tradeId':                     STR,
+        'tradeIv':                     FLOAT,
+        'underlyingPrice':             FLOAT,
+        'vega':                        FLOAT,
+        'volume24h':                   FLOAT,
+    },
+    'get_trades_flow_gamma_exposures_normalized_usd': {
+        'currency':              STR,
+        'exchange':              STR,
+        'normalizedGammaNative': FLOAT,
+        'normalizedGammaUSD':    FLOAT,
+        'snapshotTimestamp':     TIMESTAMP,
+    },
+    'get_trades_flow_gamma_exposures_snapshots': {
+        'currency':             STR,
+        'dealerNetInventory':   FLOAT,
+        'dealerTotalInventory': FLOAT,
+        'exchange':             STR,
+        'expirationTimestamp':  TIMESTAMP,
+        'gammaLevel':           FLOAT,
+        'indexPrice':           FLOAT,
+        'instrumentNormalized': STR,
+        'putCall':              STR,
+        'snapshotTimestamp':    TIMESTAMP,
+        'strike':               FLOAT,
+    },
+    'get_trades_flow_net_positioning': {
+        'dealerNetInventory': FLOAT,
+        'indexPrice':         FLOAT,
+        'snapshotTimestamp':  TIMESTAMP,
+        'strike':             STR,
+    },
+    'get_trades_flow_net_volumes': {
+        'cumulativeTradeAmount': FLOAT,
+        'cumulativeTradeDelta':  FLOAT,
+        'cumulativeTradeGamma':  FLOAT,
+        'cumulativeTradeVega':   FLOAT,
+        'indexPrice':            FLOAT,
+        'strike':                FLOAT,
+        'timestamp':             TIMESTAMP,
+    },
+    'get_trades_flow_options_yields': {
+        'absoluteYield':        FLOAT,
+        'annualization':        FLOAT,
+        'annualizedYield':      FLOAT,
+        'currency':             STR,
+        'exchange':             STR,
+        'expirationTimestamp':  TIMESTAMP,
+        'indexPrice':           FLOAT,
+        'instrumentNormalized': STR,
+        'markPrice':            FLOAT,
+        'putCall':              STR,
+        'strike':               FLOAT,
+        'timestamp':            TIMESTAMP,
+        'yieldStrategy':        STR,
+    },
+    'get_trades_flow_put_call_distribution': {
+        'callsContractsBought':                  FLOAT,
+        'callsContractsBoughtExchangeDirection': FLOAT,
+        'callsContractsSold':                    FLOAT,
+        'callsContractsSoldExchangeDirection':   FLOAT,
+        'callsPremiumBought':                    FLOAT,
+        'callsPremiumBoughtExchangeDirection':   FLOAT,
+        'callsPremiumSold':                      FLOAT,
+        'callsPremiumSoldExchangeDirection':     FLOAT,
+        'putContractsBought':                    FLOAT,
+        'putContractsBoughtExchangeDirection':   FLOAT,
+        'putContractsSold':                      FLOAT,
+        'putContractsSoldExchangeDirection':     FLOAT,
+        'putPremiumBought':                      FLOAT,
+        'putPremiumBoughtExchangeDirection':     FLOAT,
+        'putPremiumSold':                        FLOAT,
+        'putPremiumSoldExchangeDirection':       FLOAT,
+    },
+    'get_trades_flow_volume_aggregates': {
+        'contractVolumeBlocked':  FLOAT,
+        'contractVolumeOnScreen': FLOAT,
+        'currency':               STR,
+        'exchange':               STR,
+        'notionalVolumeBlocked':  FLOAT,
+        'notionalVolumeOnScreen': FLOAT,
+        'premiumVolumeBlocked':   FLOAT,
+        'premiumVolumeOnScreen':  FLOAT,
+        'timestamp':              TIMESTAMP,
+    },
+    'get_volatility_delta_surfaces_constant': {
+        'atm':              FLOAT,
+        'currency':         STR,
+        'daysToExpiration': INT,
+        'delta50':          FLOAT,
+        'deltaCall05':      FLOAT,
+        'deltaCall10':      FLOAT,
+        'deltaCall15':      FLOAT,
+        'deltaCall20':      FLOAT,
+        'deltaCall25':      FLOAT,
+        'deltaCall30':      FLOAT,
+        'deltaCall35':      FLOAT,
+        'deltaCall40':      FLOAT,
+        'deltaCall45':      FLOAT,
+        'deltaPut05':       FLOAT,
+        'deltaPut10':       FLOAT,
+        'deltaPut15':       FLOAT,
+        'deltaPut20':       FLOAT,
+        'deltaPut25':       FLOAT,
+        'deltaPut30':       FLOAT,
+        'deltaPut35':       FLOAT,
+        'deltaPut40':       FLOAT,
+        'deltaPut45':       FLOAT,
+        'exchange':         STR,
+        'indexPrice':       FLOAT,
+        'multiplier':       FLOAT,
+        'openInterest':     FLOAT,
+        'timestamp':        TIMESTAMP,
+        'underlyingPrice':  FLOAT,
+    },
+    'get_volatility_delta_surfaces_floating': {
+        'atm':                 FLOAT,
+        'currency':            STR,
+        'daysToExpiration':    FLOAT,
+        'delta50':             FLOAT,
+        'deltaCall05':         FLOAT,
+        'deltaCall10':         FLOAT,
+        'deltaCall15':         FLOAT,
+        'deltaCall20':         FLOAT,
+        'deltaCall25':         FLOAT,
+        'deltaCall30':         FLOAT,
+        'deltaCall35':         FLOAT,
+        'deltaCall40':         FLOAT,
+        'deltaCall45':         FLOAT,
+        'deltaPut05':          FLOAT,
+        'deltaPut10':          FLOAT,
+        'deltaPut15':          FLOAT,
+        'deltaPut20':          FLOAT,
+        'deltaPut25':          FLOAT,
+        'deltaPut30':          FLOAT,
+        'deltaPut35':          FLOAT,
+        'deltaPut40':          FLOAT,
+        'deltaPut45':          FLOAT,
+        'exchange':            STR,
+        'expirationTimestamp': TIMESTAMP,
+        'indexPrice':          FLOAT,
+        'multiplier':          FLOAT,
+        'openInterest':        FLOAT,
+        'timestamp':           TIMESTAMP,
+        'underlyingPrice':     FLOAT,
+    },
+    'get_volatility_index': {
+        'close':             FLOAT,
+        'currency':          STR,
+        'exchange':          STR,
+        'exchangeTimestamp': TIMESTAMP,
+        'high':              FLOAT,
+        'instrument':        STR,
+        'low':               FLOAT,
+        'open':              FLOAT,
+    },
+    'get_volatility_index_decorated': {
+        'atm':               FLOAT,
+        'close':             FLOAT,
+        'currency':          STR,
+        'daysAgo':           FLOAT,
+        'delta25RrSkew':     FLOAT,
+        'delta50':           FLOAT,
+        'deltaCall25':       FLOAT,
+        'deltaPut25':        FLOAT,
+        'exchange':          STR,
+        'exchangeTimestamp': TIMESTAMP,
+        'indexPrice':        FLOAT,
+        'instrument':        STR,
+        'underlyingPrice':   FLOAT,
+    },
+    'get_volatility_level_1_quotes': {
+        'ask':                      FLOAT,
+        'askIv':                    FLOAT,
+        'askVolume':                FLOAT,
+        'bid':                      FLOAT,
+        'bidIv':                    FLOAT,
+        'bidVolume':                FLOAT,
+        'currency':                 STR,
+        'delta':                    FLOAT,
+        'exchange':                 STR,
+        'exchangeTimestamp':        TIMESTAMP,
+        'expirationTimestamp':      TIMESTAMP,
+        'gamma':                    FLOAT,
+        'indexPrice':               FLOAT,
+        'instrument':               STR,
+        'instrumentNormalized':     STR,
+        'isAtm':                    BOOL,
+        'isCarryForward':           BOOL,
+        'isExchangeProvidedGreeks': BOOL,
+        'markIv':                   FLOAT,
+        'markPrice':                FLOAT,
+        'multiplier':               INT,
+        'openInterest':             FLOAT,
+        'openInterestUSD':          FLOAT,
+        'putCall':                  STR,
+        'rho':                      FLOAT,
+        'strike':                   FLOAT,
+        'theta':                    FLOAT,
+        'timestamp':                TIMESTAMP,
+        'underlyingPrice':          FLOAT,
+        'vega':                     FLOAT,
+        'volume':                   FLOAT,
+        'volumeUSD':                FLOAT,
+    },
+    'get_volatility_metrics': {
+        'atm':                   FLOAT,
+        'atmChange':             FLOAT,
+        'butterfly15':           FLOAT,
+        'butterfly15Change':     FLOAT,
+        'butterfly25':           FLOAT,
+        'butterfly25Change':     FLOAT,
+        'currency':              STR,
+        'daysToExpiration':      FLOAT,
+        'exchange':              STR,
+        'expirationTimestamp':   TIMESTAMP,
+        'riskReversal15':        FLOAT,
+        'riskReversal15Change':  FLOAT,
+        'riskReversal25':        FLOAT,
+        'riskReversal25Change':  FLOAT,
+        'underlyingPrice':       FLOAT,
+        'underlyingPriceChange': FLOAT,
+    },
+    'get_volatility_of_volatility': {
+        'closeDvol': FLOAT,
+        'timestamp': TIMESTAMP,
+        'volVol30':  FLOAT,
+    },
+    'get_volatility_term_structures_constant': {
+        'atm':              FLOAT,
+        'currency':         STR,
+        'daysToExpiration': INT,
+        'exchange':         STR,
+        'fwdAtm':           FLOAT,
+        'timestamp':        TIMESTAMP,
+    },
+    'get_volatility_term_structures_floating': {
+        'atm':                 FLOAT,
+        'currency':            STR,
+        'daysToExpiration':    FLOAT,
+        'exchange':            STR,
+        'expirationTimestamp': TIMESTAMP,
+        'fwdAtm':              FLOAT,
+        'timestamp':           TIMESTAMP,
+    },
+    'get_volatility_term_structures_richness': {
+        'atm180days': FLOAT,
+        'atm30days':  FLOAT,
+        'atm60days':  FLOAT,
+        'atm7days':   FLOAT,
+        'atm90days':  FLOAT,
+        'counter':    FLOAT,
+        'currency':   STR,
+        'exchange':   STR,
+        'ratio':      FLOAT,
+        'richness':   FLOAT,
+        'timestamp':  TIMESTAMP,
+    },
+    'get_volatility_variance_premium': {
+        'closeDvol':                  FLOAT,
+        'exchange':                   STR,
+        'historicalVolatility30days': FLOAT,
+        'instrument':                 STR,
+        'timestamp':                  TIMESTAMP,
+        'vrp30':                      FLOAT,
+    },
+}
+
+
+# ======================================================================================================================
+
+def get_fields(function_name: str) -> dict:
+    """
+    Returns the fields (name -> type) of the records returned by an endpoint, or an empty dictionary if unknown.
+    """
+
+    return FIELDS.get(function_name, {})
+
+# ======================================================================================================================
@@ -0,0 +1,231 @@
+# ======================================================================================================================
+
+"""
+Module to decode API responses incrementally, yielding the records of `payload.data` as the body is received.
+"""
+
+# ======================================================================================================================
+
+import codecs
+import json
+import re
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DATA_PATH = ('payload', 'data')
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Parsing stages
+_OBJECT_START = 'object_start'
+_KEY = 'key'
+_SKIP_VALUE = 'skip_value'
+_ENTER_VALUE = 'enter_value'
+_NEXT_KEY = 'next_key'
+_ARRAY_START = 'array_start'
+_ELEMENT = 'element'
+_NEXT_ELEMENT = 'next_element'
+_DONE = 'done'
+
+
+class _Incomplete:  # pylint: disable=too-few-public-methods
+    """Marker of a value cut by the end of the buffer."""
+
+
+_INCOMPLETE = _Incomplete()
+
+
+# ======================================================================================================================
+
+# pylint: disable=too-many-instance-attributes
+class RowDecoder:
+    """
+    Class to decode a JSON document fed in chunks, and to return the elements of the array at `path` as soon as each of
+    them is complete. Only the current element (and the small values preceding the array) are held in memory.
+
+    Values found after the array (ex: `payload.metadata` when sent last) are not decoded.
+    """
+
+    def __init__(self, path: tuple = DATA_PATH):
+        """
+        Initializes the decoder.
+
+        PARAMS:
+        - path (tuple) The keys leading to the array whose elements are returned (defaults to `payload.data`).
+        """
+
+        self.path = tuple(path)
+
+        self.__decoder = json.JSONDecoder()
+        self.__text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.__buffer = ''
+        self.__position = 0
+        self.__depth = 0
+        self.__stage = _OBJECT_START if self.path else _ARRAY_START
+        self.__is_final = False
+
+    @property
+    def done(self) -> bool:
+        """
+        Returns True once the end of the array (or the absence of the path) has been reached.
+        """
+
+        return self.__stage == _DONE
+
+    def feed(self, chunk: bytes) -> list:
+        """
+        Decodes a chunk of the body, and returns the elements of the array which were completed by it.
+        """
+
+        self.__buffer = self.__buffer[self.__position:] + self.__text_decoder.decode(chunk)
+        self.__position = 0
+        return self.__parse()
+
+    def close(self) -> list:
+        """
+        Signals the end of the body, and returns the last elements of the array (if any).
+
+        Raises a ValueError if the body ended before the array did.
+        """
+
+        self.__buffer = self.__buffer[self.__position:] + self.__text_decoder.decode(b'', final=True)
+        self.__position = 0
+        self.__is_final = True
+
+        rows = self.__parse()
+        if self.__stage != _DONE:
+            raise ValueError(f"Invalid JSON document: the body ended before the end of '{'.'.join(self.path)}'.")
+        return rows
+
+    # ==================================================================================================================
+
+    # pylint: disable=too-many-branches, too-many-statements
+    def __parse(self) -> list:
+        """Helper method to parse as much of the buffer as possible (each step is atomic, and retried on more data)."""
+
+        rows = []
+        while self.__stage != _DONE:
+            start = self.__position
+            character = self.__peek()
+            if character is None:
+                break
+
+            if self.__stage == _OBJECT_START:
+                if character != '{':
+                    # The path does not lead to an object (ex: `payload` is null): there is no array to decode
+                    self.__stage = _DONE
+                    break
+                self.__position += 1
+                self.__stage = _KEY
+
+            elif self.__stage == _KEY:
+                if character == '}':
+                    # The key was not found at this level
+                    self.__stage = _DONE
+                    break
+                key = self.__decode_value()
+                if key is _INCOMPLETE:
+                    break
+                self.__stage = _ENTER_VALUE if key == self.path[self.__depth] else _SKIP_VALUE
+
+            elif self.__stage == _SKIP_VALUE:
+                self.__expect(character, ':')
+                if self.__peek() is None or self.__decode_value() is _INCOMPLETE:
+                    self.__position = start
+                    break
+                self.__stage = _NEXT_KEY
+
+            elif self.__stage == _NEXT_KEY:
+                if character == '}':
+                    self.__stage = _DONE
+                    break
+                self.__expect(character, ',')
+                self.__stage = _KEY
+
+            elif self.__stage == _ENTER_VALUE:
+                self.__expect(character, ':')
+                self.__depth += 1
+                self.__stage = _OBJECT_START if self.__depth < len(self.path) else _ARRAY_START
+
+            elif self.__stage == _ARRAY_START:
+                if character != '[':
+                    # Not an array (ex: null): it is decoded whole
+                    value = self.__decode_value()
+                    if value is _INCOMPLETE:
+                        break
+                    rows.extend(value if isinstance(value, list) else [])
+                    self.__stage = _DONE
+                    break
+                self.__position += 1
+                self.__stage = _ELEMENT
+
+            elif self.__stage == _ELEMENT:
+                if character == ']':
+                    # Empty array
+                    self.__position += 1
+                    self.__stage = _DONE
+                    break
+                row = self.__decode_value()
+                if row is _INCOMPLETE:
+                    break
+                rows.append(row)
+                self.__stage = _NEXT_ELEMENT
+
+            elif self.__stage == _NEXT_ELEMENT:
+                if character == ']':
+                    self.__position += 1
+                    self.__stage = _DONE
+                    break
+                self.__expect(character, ',')
+                self.__stage = _ELEMENT
+
+        return rows
+
+    def __peek(self):
+        """Helper method to skip whitespaces, and return the next character (or None if more data is needed)."""
+
+        self.__position = _WHITESPACE.match(self.__buffer, self.__position).end()
+        return self.__buffer[self.__position] if self.__position < len(self.__buffer) else None
+
+    def __expect(self, character: str, expected: str):
+        """Helper method to consume an expected character."""
+
+        if character != expected:
+            raise ValueError(
+                f"Invalid JSON document: expected '{expected}' at position {self.__position}, found '{character}'."
+            )
+        self.__position += 1
+
+    def __decode_value(self):
+        """Helper method to decode the next value, or to return _INCOMPLETE (consuming nothing) if it is cut."""
+
+        try:
+            value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+        except json.JSONDecodeError as e:
+            if self.__is_final:
+                raise ValueError(f"Invalid JSON document: {e}") from e
+            return _INCOMPLETE
+
+        # A number (or literal) ending with the buffer may continue in the next chunk
+        if end == len(self.__buffer) and not self.__is_final and not isinstance(value, (dict, list, str)):
+            return _INCOMPLETE
+
+        self.__position = end
+        return value
+
+
+
+# ======================================================================================================================
+
+def iter_rows(chunks, path: tuple = DATA_PATH):
+    """
+    Yields the elements of the array at `path` (defaults to `payload.data`) of a JSON document received in chunks.
+    """
+
+    decoder = RowDecoder(path)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+        if decoder.done:
+            return
+    yield from decoder.close()
+
+# ======================================================================================================================
@@ -0,0 +1,198 @@
+# ======================================================================================================================
+
+"""
+Module to store the records of time series synchronized incrementally: each series (endpoint and parameters) keeps a
+high-water mark on its timestamp field, so that only newer records are requested (see `AmberdataDerivatives.sync`).
+"""
+
+# ======================================================================================================================
+
+import json
+import os
+import time
+from urllib.parse import urlencode
+
+from amberdata_derivatives import database, json_backend, query, ranges
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'amberdata-derivatives', 'series.sqlite3')
+
+# Parameters which select the time window of a call, rather than the series
+WINDOW_PARAMS = ('startDate', 'endDate', 'timeFormat')
+
+
+# ======================================================================================================================
+
+def make_key(function_name: str, query_params: dict) -> str:
+    """
+    Returns the key of a series: the endpoint and its parameters, whatever their order and except the time window
+    (ex: 'get_volatility_index?currency=BTC&exchange=deribit').
+    """
+
+    params = {key: value for key, value in query_params.items() if key not in WINDOW_PARAMS}
+    return f"{function_name}?{urlencode(query.canonicalize(params))}"
+
+
+# ======================================================================================================================
+
+class SyncStore(database.Database):
+    """
+    Class to store synchronized time series in a SQLite database, which can be shared by several processes on one host.
+
+    The watermark of a series is the latest timestamp of its records. Appending records already stored is a no-op:
+    records before the watermark, and records at the watermark identical to one stored there (ex: returned again at
+    the boundary of two synchronizations) are dropped. Other records are all stored, even if identical (ex: two trades
+    of the same size in the same millisecond). Records without a timestamp cannot be placed against the watermark:
+    they are dropped if identical to one already stored.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """
+        Initializes the store.
+
+        PARAMS:
+        - path (string) The SQLite database file (created if missing).
+        """
+
+        super().__init__(path, [
+            'CREATE TABLE IF NOT EXISTS series ('
+            '  key        TEXT PRIMARY KEY,'
+            '  watermark  INTEGER,'
+            '  updated_at REAL NOT NULL'
+            ')',
+            'CREATE TABLE IF NOT EXISTS records ('
+            '  key       TEXT NOT NULL,'
+            '  timestamp INTEGER,'
+            '  record    TEXT NOT NULL'
+            ')',
+            'CREATE INDEX IF NOT EXISTS records_key_timestamp ON records (key, timestamp)',
+        ])
+
+    # ==================================================================================================================
+
+    def get_watermark(self, function_name: str, query_params: dict):
+        """
+        Returns the latest timestamp (in milliseconds) stored for a series, or None if it was never synchronized.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT watermark FROM series WHERE key = ?', (make_key(function_name, query_params),)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def append(self, function_name: str, query_params: dict, records: list, field: str = 'timestamp') -> list:
+        """
+        Appends records to a series (their `field` holding their time), moves its watermark, and returns the records
+        which were not stored yet (see `SyncStore`).
+        """
+
+        key = make_key(function_name, query_params)
+        rows = [(_get_timestamp(record, field), json.dumps(record, sort_keys=True), record) for record in records]
+
+        appended = []
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                watermark, boundary, untimed = self.__get_stored(key)
+                for timestamp, serialized, record in rows:
+                    if timestamp is None:
+                        if serialized in untimed:
+                            continue
+                    elif watermark is not None and (
+                            timestamp < watermark or (timestamp == watermark and serialized in boundary)
+                    ):
+                        continue
+
+                    self._connection.execute(
+                        'INSERT INTO records (key, timestamp, record) VALUES (?, ?, ?)', (key, timestamp, serialized)
+                    )
+                    appended.append(record)
+
+                self._connection.execute(
+                    'INSERT INTO series (key, watermark, updated_at) '
+                    'VALUES (?, (SELECT MAX(timestamp) FROM records WHERE key = ?), ?) '
+                    'ON CONFLICT (key) DO UPDATE SET watermark = excluded.watermark, updated_at = excluded.updated_at',
+                    (key, key, time.time())
+                )
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+        return appended
+
+    def __get_stored(self, key: str) -> tuple:
+        """
+        Helper method to return the watermark of a series, and the records stored at the watermark and without a
+        timestamp (serialized), within the transaction of an append.
+        """
+
+        watermark = self._connection.execute('SELECT MAX(timestamp) FROM records WHERE key = ?', (key,)).fetchone()[0]
+        boundary = {row[0] for row in self._connection.execute(
+            'SELECT record FROM records WHERE key = ? AND timestamp = ?', (key, watermark)
+        )} if watermark is not None else set()
+        untimed = {row[0] for row in self._connection.execute(
+            'SELECT record FROM records WHERE key = ? AND timestamp IS NULL', (key,)
+        )}
+        return watermark, boundary, untimed
+
+    def read(self, function_name: str, query_params: dict, start_date=None, end_date=None) -> list:
+        """
+        Returns the records of a series within [start_date, end_date) (both optional), ordered by time.
+        """
+
+        sql = 'SELECT record FROM records WHERE key = ?'
+        params = [make_key(function_name, query_params)]
+        if start_date is not None:
+            sql += ' AND timestamp >= ?'
+            params.append(ranges.to_milliseconds(start_date))
+        if end_date is not None:
+            sql += ' AND timestamp < ?'
+            params.append(ranges.to_milliseconds(end_date))
+
+        with self._lock:
+            rows = self._connection.execute(sql + ' ORDER BY timestamp, rowid', params).fetchall()
+        return [json_backend.loads(row[0]) for row in rows]
+
+    def clear(self, function_name: str = None, query_params: dict = None):
+        """
+        Removes the records and the watermark of a series (of all the series if `function_name` is None).
+        """
+
+        with self._lock:
+            if function_name is None:
+                self._connection.execute('DELETE FROM records')
+                self._connection.execute('DELETE FROM series')
+            else:
+                key = make_key(function_name, query_params or {})
+                self._connection.execute('DELETE FROM records WHERE key = ?', (key,))
+                self._connection.execute('DELETE FROM series WHERE key = ?', (key,))
+
+    def stats(self) -> dict:
+        """
+        Returns the number of records and the watermark of each series (by key).
+        """
+
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT series.key, COUNT(records.key), series.watermark FROM series '
+                'LEFT JOIN records ON records.key = series.key GROUP BY series.key'
+            ).fetchall()
+        return {key: {'records': count, 'watermark': watermark} for key, count, watermark in rows}
+
+
+# ======================================================================================================================
+
+def _get_timestamp(record: dict, field: str):
+    """Helper function to return the time of a record (in milliseconds), None if it has none."""
+
+    value = record.get(field) if isinstance(record, dict) else None
+    if value is None:
+        return None
+
+    try:
+        return ranges.to_milliseconds(value)
+    except ValueError:
+        return None
+
+# ======================================================================================================================
@@ -0,0 +1,190 @@
+# ======================================================================================================================
+
+"""
+Module to throttle API calls (token bucket shared by all the callers of an API key), and to retry transient failures.
+"""
+
+# ======================================================================================================================
+
+import datetime as dt
+import random
+import threading
+import time
+
+from amberdata_derivatives import lazy
+
+# Imported on the first `Retry-After` date
+email_utils = lazy.load('email.utils')
+
+# HTTP statuses worth retrying: quota exceeded, and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+# ======================================================================================================================
+
+class TokenBucket:
+    """
+    Class to limit the rate of API calls: `rate` calls per second on average, with bursts of up to `burst` calls.
+
+    Callers are served in order of arrival (each call reserves the next free slot), so concurrent callers sharing one
+    bucket are throttled fairly. All the clients using the same API key should share the same bucket.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initializes the bucket (full).
+
+        PARAMS:
+        - rate  (float) The number of calls allowed per second, on average.
+        - burst (int)   The maximum number of calls allowed at once (i.e. the capacity of the bucket).
+        """
+
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: expected a positive number, found '{rate}'.")
+        if burst < 1:
+            raise ValueError(f"Invalid burst: expected a positive integer, found '{burst}'.")
+
+        self.rate = rate
+        self.burst = burst
+
+        self.__lock = threading.Lock()
+        self.__tokens = float(burst)
+        self.__updated_at = time.monotonic()
+        self.__paused_until = 0.0
+
+    def reserve(self) -> float:
+        """
+        Reserves a call, and returns the number of seconds to wait before issuing it (0 if it can be issued now).
+        """
+
+        with self.__lock:
+            self.__refill()
+
+            # Tokens go negative while calls are queued: each call waits for its own token
+            self.__tokens -= 1
+            return -self.__tokens / self.rate if self.__tokens < 0 else 0.0
+
+    def acquire(self):
+        """
+        Waits until a call can be issued.
+        """
+
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float):
+        """
+        Holds the calls reserved from now on for `seconds` (ex: when the API asks to retry later). They resume one at a
+        time after the pause, spaced by the rate of the bucket (no burst). Pauses overlapping add up to the longest.
+        """
+
+        with self.__lock:
+            now = self.__refill()
+            extension = now + seconds - max(self.__paused_until, now)
+            if extension <= 0:
+                return
+
+            # The pause is a debt of tokens: the calls queued behind it keep their own slots
+            self.__paused_until = now + seconds
+            self.__tokens = min(self.__tokens, 0.0) - extension * self.rate
+
+    def __refill(self) -> float:
+        """Helper method to add the tokens earned since the last update (up to `burst`), and return the time."""
+
+        now = time.monotonic()
+        self.__tokens = min(self.burst, self.__tokens + (now - self.__updated_at) * self.rate)
+        self.__updated_at = now
+        return now
+
+
+# ======================================================================================================================
+
+class RetryPolicy:
+    """
+    Class to decide whether (and when) a failed call is retried: on transient HTTP statuses and connection errors,
+    after the delay requested by the API (`Retry-After`), or else after an exponential backoff with full jitter.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+            self,
+            max_retries: int = 3,
+            backoff: float = 0.5,
+            max_backoff: float = 30,
+            retry_statuses: tuple = RETRY_STATUSES,
+            jitter: bool = True
+    ):
+        """
+        Initializes the policy.
+
+        PARAMS:
+        - max_retries    (int)   The maximum number of retries of a call (0 to never retry).
+        - backoff        (float) The base delay (in seconds) of the exponential backoff: backoff * 2 ** attempt.
+        - max_backoff    (float) The maximum delay (in seconds) before a retry: calls whose `Retry-After` is longer
+                                 are not retried (their response is returned).
+        - retry_statuses (tuple) The HTTP statuses which are retried.
+        - jitter         (bool)  If true, the backoff delays are drawn uniformly in [0, delay] (full jitter).
+        """
+
+        if max_retries < 0:
+            raise ValueError(f"Invalid max_retries: expected a non-negative integer, found '{max_retries}'.")
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = tuple(retry_statuses)
+        self.jitter = jitter
+
+    def should_retry(self, attempt: int, status: int = None, retry_after: str = None) -> bool:
+        """
+        Returns True if a call which failed `attempt + 1` times should be retried (status None = connection error):
+        not if the API asks to wait longer than `max_backoff` (`Retry-After`).
+        """
+
+        if attempt >= self.max_retries or (status is not None and status not in self.retry_statuses):
+            return False
+
+        delay = parse_retry_after(retry_after)
+        return delay is None or delay <= self.max_backoff
+
+    def get_delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Returns the number of seconds to wait before retrying a call which failed `attempt + 1` times (the delay
+        requested by the API if any, see `should_retry`).
+        """
+
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return delay
+
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+# ======================================================================================================================
+
+def parse_retry_after(value: str):
+    """
+    Returns the number of seconds requested by a `Retry-After` header (a delay or a HTTP date), or None if invalid.
+    """
+
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = email_utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=dt.timezone.utc)
+
+    return max(0.0, (date - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+# ======================================================================================================================
@@ -0,0 +1,210 @@
+# ======================================================================================================================
+
+"""
+Module to trace the API calls: one span per call of an endpoint, with child spans for its stages (transport,
+decompression, JSON parsing and columnar conversion), recorded by the built-in tracer or by OpenTelemetry.
+"""
+
+# ======================================================================================================================
+
+import contextlib
+import contextvars
+import random
+import threading
+import time
+
+from amberdata_derivatives.version import __version__
+
+# Spans of the stages of a call
+TRANSPORT = 'amberdata.transport'
+DECOMPRESS = 'amberdata.decompress'
+JSON_PARSE = 'amberdata.json_parse'
+COLUMNAR = 'amberdata.columnar'
+
+# Parameters of the calls tagging their spans
+TAGGED_PARAMS = ('exchange', 'currency', 'asset')
+
+# Span of the current thread (or asyncio task), parent of the spans it starts
+_current_span = contextvars.ContextVar('amberdata_derivatives_span', default=None)
+
+
+# ======================================================================================================================
+
+# pylint: disable=too-many-instance-attributes
+class Span:
+    """
+    Class describing a span recorded by the built-in `Tracer` (times are nanoseconds since epoch).
+    """
+
+    def __init__(self, name: str, attributes: dict = None, parent=None):
+        """
+        Initializes a span starting now, as a child of `parent` (if any).
+        """
+
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.trace_id = parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_time = time.time_ns()
+        self.end_time = None
+        self.error = None
+
+    def set_attribute(self, key: str, value):
+        """
+        Sets an attribute of the span.
+        """
+
+        self.attributes[key] = value
+
+    @property
+    def duration(self) -> float:
+        """
+        Returns the duration of the span (in seconds), None if it has not ended.
+        """
+
+        return None if self.end_time is None else (self.end_time - self.start_time) / 1e9
+
+    def __repr__(self):
+        return f"Span({self.name!r}, duration={self.duration}, attributes={self.attributes})"
+
+
+class InMemoryExporter:
+    """
+    Class to keep the ended spans in memory (ex: in tests), in the order they ended. Thread-safe.
+    """
+
+    def __init__(self):
+        self.__spans = []
+        self.__lock = threading.Lock()
+
+    def export(self, span: Span):
+        """
+        Records an ended span.
+        """
+
+        with self.__lock:
+            self.__spans.append(span)
+
+    @property
+    def spans(self) -> list:
+        """
+        Returns the recorded spans.
+        """
+
+        with self.__lock:
+            return list(self.__spans)
+
+    def clear(self):
+        """
+        Discards all the recorded spans.
+        """
+
+        with self.__lock:
+            self.__spans.clear()
+
+
+class Tracer:  # pylint: disable=too-few-public-methods
+    """
+    Class to record spans without any dependency: spans started while another one is open (in the same thread or
+    asyncio task) are its children, and each span is passed to the exporter when it ends.
+    """
+
+    def __init__(self, exporter=None):
+        """
+        Initializes the tracer.
+
+        PARAMS:
+        - exporter (object) The recipient of the ended spans, with an `export(span)` method (defaults to a new
+                            `InMemoryExporter`).
+        """
+
+        self.exporter = exporter if exporter is not None else InMemoryExporter()
+
+    @contextlib.contextmanager
+    def start_span(self, name: str, attributes: dict = None):
+        """
+        Context manager starting a span (child of the current span), and ending it on exit.
+        """
+
+        span = Span(name, attributes, _current_span.get())
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = e
+            raise
+        finally:
+            span.end_time = time.time_ns()
+            _current_span.reset(token)
+            self.exporter.export(span)
+
+
+class OpenTelemetryTracer:  # pylint: disable=too-few-public-methods
+    """
+    Class to record spans with OpenTelemetry, i.e. with the tracer provider (and exporters) set up by the application.
+
+    Requires the optional dependency `opentelemetry-api` (pip install amberdata-derivatives[tracing]).
+    """
+
+    def __init__(self, tracer=None):
+        """
+        Initializes the tracer.
+
+        PARAMS:
+        - tracer (object) The OpenTelemetry tracer to use (defaults to the tracer of the SDK, from the global provider).
+        """
+
+        try:
+            from opentelemetry import trace  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryTracer requires 'opentelemetry-api' (pip install amberdata-derivatives[tracing])."
+            ) from e
+
+        self.tracer = tracer if tracer is not None else trace.get_tracer('amberdata_derivatives', __version__)
+
+    def start_span(self, name: str, attributes: dict = None):
+        """
+        Context manager starting a span (child of the current span), and ending it on exit.
+        """
+
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+
+# ======================================================================================================================
+
+def start_span(tracer, name: str, attributes: dict = None):
+    """
+    Returns the context manager of a span started by `tracer`, or of a no-op span if `tracer` is None.
+    """
+
+    if tracer is None:
+        return contextlib.nullcontext(_NO_SPAN)
+    return tracer.start_span(name, attributes)
+
+
+def get_call_attributes(url_path: str, query_params: dict) -> dict:
+    """
+    Returns the attributes of the span of a call: its endpoint, and its main parameters (exchange, currency, asset).
+    """
+
+    attributes = {'amberdata.endpoint': url_path}
+    for key in TAGGED_PARAMS:
+        if query_params.get(key) is not None:
+            attributes[f"amberdata.{key}"] = str(query_params[key])
+    return attributes
+
+
+# ======================================================================================================================
+
+class _NoSpan:  # pylint: disable=too-few-public-methods
+    """Helper class of the span returned when tracing is disabled."""
+
+    def set_attribute(self, key: str, value):
+        """Ignores the attribute."""
+
+
+_NO_SPAN = _NoSpan()
+
+# ======================================================================================================================
@@ -0,0 +1,100 @@
+# ======================================================================================================================
+
+"""
+Module to handle the HTTP transport (connection pooling & keep-alive) used by the SDK.
+"""
+
+# ======================================================================================================================
+
+import threading
+import zlib
+
+from amberdata_derivatives import lazy
+
+# Imported on first use (the HTTP stack on the creation of the first session)
+connections = lazy.load('amberdata_derivatives.connections')
+gzip = lazy.load('gzip')
+requests = lazy.load('requests')
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT = 30
+
+# Time spent opening connections, per thread (each thread issues one request at a time)
+_connect_times = threading.local()
+
+
+# ======================================================================================================================
+
+def create_session(
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True
+) -> 'requests.Session':
+    """
+    Creates a HTTP session backed by a pool of persistent connections.
+
+    PARAMS:
+    - pool_connections (int)  The number of per-host connection pools to cache (i.e. the number of distinct hosts).
+    - pool_maxsize     (int)  The maximum number of connections to keep open (and reuse) per host.
+    - pool_block       (bool) If true, callers wait for a free connection instead of opening more than `pool_maxsize`
+                              connections to the same host.
+    - keep_alive       (bool) If false, connections are closed after each request (no reuse).
+    """
+
+    if pool_connections < 1:
+        raise ValueError(f"Invalid pool_connections: expected a positive integer, found '{pool_connections}'.")
+    if pool_maxsize < 1:
+        raise ValueError(f"Invalid pool_maxsize: expected a positive integer, found '{pool_maxsize}'.")
+
+    adapter = connections.TimedHTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+
+    return session
+
+
+def decompress(body: bytes, encoding: str = None) -> bytes:
+    """
+    Decompresses a body received as is (not decoded) according to its `Content-Encoding` (gzip | deflate | identity).
+    """
+
+    encoding = (encoding or 'identity').strip().lower()
+    if encoding == 'identity':
+        return body
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        # Either zlib-wrapped (as specified) or raw (as sent by some servers)
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+
+    raise ValueError(f"Unsupported content encoding: '{encoding}'.")
+
+
+def add_connect_time(seconds: float):
+    """
+    Adds the duration of a connection opened by the current thread to its connect time.
+    """
+
+    _connect_times.elapsed = getattr(_connect_times, 'elapsed', 0.0) + seconds
+
+
+def pop_connect_time() -> float:
+    """
+    Returns the number of seconds the current thread spent opening connections (DNS, TCP & TLS) since the last call.
+    """
+
+    elapsed = getattr(_connect_times, 'elapsed', 0.0)
+    _connect_times.elapsed = 0.0
+    return elapsed
+
+# ======================================================================================================================
@@ -55,6 +55,13 @@ setup(
         'python-dotenv',
         'requests'
     ],
+    extras_require={
+        'async': ['aiohttp>=3.9'],
+        'columnar': ['numpy', 'pandas'],
+        'fast-json': ['orjson'],
+        'parquet': ['pyarrow'],
+        'tracing': ['opentelemetry-api'],
+    },
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
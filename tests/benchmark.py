@@ -0,0 +1,257 @@
+# ======================================================================================================================
+
+"""
+Module to benchmark the SDK against the recorded API responses (served by the local replay server), per endpoint:
+request latency percentiles, decode time, rows per second and peak memory.
+
+Results are written as JSON, and can be compared to the results of a previous run (ex: of the previous version), to
+detect regressions above a threshold.
+
+Usage:
+    python -m tests.benchmark --iterations 20 --output benchmark.json
+    python -m tests.benchmark --baseline benchmark.json --threshold 0.2
+"""
+
+# ======================================================================================================================
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives, json_backend
+from amberdata_derivatives.endpoints import get_function_name
+from amberdata_derivatives.version import __version__
+from tests.replay_server import ReplayServer
+
+# Metrics compared to the baseline (lower is better)
+COMPARED_METRICS = ('latency_p50_ms', 'latency_p90_ms', 'decode_ms', 'peak_rss_mb')
+
+# Endpoints with the largest responses
+HEAVY_ENDPOINTS = (
+    'get_instruments_information',
+    'get_trades_flow_decorated_trades',
+    'get_volatility_level_1_quotes',
+)
+
+
+# ======================================================================================================================
+
+def select_calls(server: ReplayServer, endpoints: list = None) -> dict:
+    """
+    Returns the call benchmarked for each endpoint: the successful recorded call returning the most records.
+    """
+
+    calls = {}
+    for (url_path, params), fixture in server.calls.items():
+        function_name = get_function_name(url_path)
+        if endpoints and not any(endpoint in function_name for endpoint in endpoints):
+            continue
+
+        with open(fixture, 'rb') as f:
+            response = json.loads(f.read())
+        if response.get('status') != 200:
+            continue
+
+        size = (len(response['payload']['data']), os.path.getsize(fixture))
+        if function_name not in calls or size > calls[function_name][2]:
+            calls[function_name] = (dict(params), fixture, size)
+
+    return {function_name: call[:2] for function_name, call in sorted(calls.items())}
+
+
+# pylint: disable-next=too-many-arguments, too-many-positional-arguments, too-many-locals
+def run_endpoint(function_name: str, params: dict, fixture: str, api_url: str, iterations: int, warmup: int) -> dict:
+    """
+    Benchmarks one endpoint (ideally in a fresh process, for the peak memory to be its own).
+    """
+
+    with mock.patch.dict(os.environ, {'API_URL': api_url}):
+        client = AmberdataDerivatives(api_key='<api_key>')
+    endpoint = getattr(client, function_name)
+
+    for _ in range(warmup):
+        endpoint(**params)
+
+    latencies = []
+    rows = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        response = endpoint(**params)
+        latencies.append(time.perf_counter() - call_started)
+        rows += len(response['payload']['data'])
+    elapsed = time.perf_counter() - started
+
+    # Memory allocated by one call (traced separately, as tracing slows the calls down)
+    tracemalloc.start()
+    endpoint(**params)
+    peak_allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    client.close()
+
+    # Decoding alone (without the transport)
+    with open(fixture, 'rb') as f:
+        body = f.read()
+    decode_times = []
+    for _ in range(iterations):
+        decode_started = time.perf_counter()
+        json_backend.loads(body)
+        decode_times.append(time.perf_counter() - decode_started)
+
+    return {
+        'params':            params,
+        'response_bytes':    len(body),
+        'rows':              rows // iterations,
+        'latency_p50_ms':    _percentile(latencies, 50) * 1000,
+        'latency_p90_ms':    _percentile(latencies, 90) * 1000,
+        'latency_p99_ms':    _percentile(latencies, 99) * 1000,
+        'latency_mean_ms':   statistics.mean(latencies) * 1000,
+        'decode_ms':         statistics.median(decode_times) * 1000,
+        'rows_per_second':   rows / elapsed,
+        'peak_allocated_mb': peak_allocated / 1024 / 1024,
+        'peak_rss_mb':       _peak_rss_mb(),
+    }
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def run(
+        endpoints: list = None,
+        iterations: int = 20,
+        warmup: int = 2,
+        latency: float = 0.0,
+        bandwidth: float = None,
+        isolate: bool = True
+) -> dict:
+    """
+    Benchmarks all the endpoints (or those whose name contains one of `endpoints`), and returns the results.
+    """
+
+    results = {}
+    with ReplayServer(latency=latency, bandwidth=bandwidth) as server:
+        for function_name, (params, fixture) in select_calls(server, endpoints).items():
+            arguments = (function_name, params, fixture, server.url, iterations, warmup)
+            if isolate:
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    results[function_name] = executor.submit(run_endpoint, *arguments).result()
+            else:
+                results[function_name] = run_endpoint(*arguments)
+
+    return {
+        'sdk_version':  __version__,
+        'python':       platform.python_version(),
+        'platform':     platform.platform(),
+        'json_backend': json_backend.DEFAULT_BACKEND,
+        'iterations':   iterations,
+        'latency':      latency,
+        'bandwidth':    bandwidth,
+        'isolated':     isolate,
+        'endpoints':    results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2) -> list:
+    """
+    Returns the regressions of the current results compared to a baseline: metrics (lower is better) which increased
+    by more than `threshold` (ex: 0.2 = 20%), as (endpoint, metric, baseline value, current value) tuples.
+    """
+
+    regressions = []
+    for function_name, metrics in sorted(current['endpoints'].items()):
+        baseline_metrics = baseline['endpoints'].get(function_name)
+        if baseline_metrics is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = baseline_metrics.get(metric), metrics.get(metric)
+            if before is not None and after is not None and after > before * (1 + threshold):
+                regressions.append((function_name, metric, before, after))
+    return regressions
+
+
+# ======================================================================================================================
+
+def _percentile(values: list, percentile: float) -> float:
+    """Helper function to compute a percentile (nearest rank)."""
+
+    values = sorted(values)
+    return values[max(0, math.ceil(percentile / 100 * len(values)) - 1)]
+
+
+def _peak_rss_mb() -> float:
+    """Helper function to return the peak resident memory of the current process (in MB)."""
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def _print_results(results: dict):
+    """Helper function to print the results as a table."""
+
+    print(f"{'endpoint':<56} {'rows':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'decode ms':>9} "
+          f"{'rows/s':>10} {'RSS MB':>7}")
+    for function_name, metrics in results['endpoints'].items():
+        marker = '*' if function_name in HEAVY_ENDPOINTS else ' '
+        print(
+            f"{function_name + marker:<56} {metrics['rows']:>7} {metrics['latency_p50_ms']:>8.2f} "
+            f"{metrics['latency_p90_ms']:>8.2f} {metrics['latency_p99_ms']:>8.2f} {metrics['decode_ms']:>9.2f} "
+            f"{metrics['rows_per_second']:>10.0f} {metrics['peak_rss_mb']:>7.1f}"
+        )
+
+
+def main():
+    """
+    Runs the benchmark, and exits with an error if a regression is found compared to the baseline.
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks the SDK against the recorded API responses.')
+    parser.add_argument('--endpoints', nargs='*', help='Benchmark only the endpoints containing these names.')
+    parser.add_argument('--iterations', type=int, default=20, help='The number of calls per endpoint.')
+    parser.add_argument('--warmup', type=int, default=2, help='The number of calls per endpoint before measuring.')
+    parser.add_argument('--latency', type=float, default=0.0, help='The artificial latency of the server (seconds).')
+    parser.add_argument('--bandwidth', type=float, default=None, help='The bandwidth of the server (bytes/second).')
+    parser.add_argument('--no-isolate', action='store_true', help='Run all the endpoints in the current process.')
+    parser.add_argument('--output', help='The file to write the results to (JSON).')
+    parser.add_argument('--baseline', help='The results of a previous run to compare to (JSON).')
+    parser.add_argument('--threshold', type=float, default=0.2, help='The tolerated increase of metrics (0.2=20%%).')
+    arguments = parser.parse_args()
+
+    results = run(
+        endpoints=arguments.endpoints,
+        iterations=arguments.iterations,
+        warmup=arguments.warmup,
+        latency=arguments.latency,
+        bandwidth=arguments.bandwidth,
+        isolate=not arguments.no_isolate
+    )
+    _print_results(results)
+
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if arguments.baseline:
+        with open(arguments.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare(baseline, results, arguments.threshold)
+        for function_name, metric, before, after in regressions:
+            print(f"REGRESSION {function_name} {metric}: {before:.2f} -> {after:.2f} (+{after / before - 1:.0%})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
+
+# ======================================================================================================================
@@ -0,0 +1,304 @@
+# ======================================================================================================================
+
+"""
+Module to replay the recorded API responses (tests/fixtures) from a local HTTP server, to test and benchmark the SDK
+without network access nor API key.
+
+The calls recorded by each fixture are found by parsing the unit tests: `self.call_endpoint(...)` in a test method
+validated by `self.validate_response_data(response)` is answered by the fixture of that method.
+
+Usage:
+    python -m tests.replay_server --port 8080 --latency 0.05 --bandwidth 10000000
+    API_URL=http://127.0.0.1:8080 python3 -m unittest -v tests/test_endpoint_*.py
+"""
+
+# ======================================================================================================================
+
+import argparse
+import ast
+import glob
+import gzip
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from amberdata_derivatives import cache, endpoints, query
+
+TESTS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIRECTORY = os.path.join(TESTS_DIRECTORY, 'fixtures')
+
+
+# ======================================================================================================================
+
+def load_calls(tests_directory: str = TESTS_DIRECTORY, fixtures_directory: str = FIXTURES_DIRECTORY) -> dict:
+    """
+    Parses the unit tests of the endpoints, and returns the fixture file answering each recorded call (by cache key).
+    """
+
+    calls = {}
+    for filename in sorted(glob.glob(os.path.join(tests_directory, 'test_endpoint_*.py'))):
+        with open(filename, 'r', encoding='utf-8') as f:
+            module = ast.parse(f.read(), filename)
+
+        for test_case in [node for node in module.body if isinstance(node, ast.ClassDef)]:
+            function_name, time_format = _parse_set_up(test_case)
+            if function_name not in endpoints.ENDPOINTS:
+                continue
+
+            url_path = endpoints.ENDPOINTS[function_name].url_path
+            for method in [node for node in test_case.body if isinstance(node, ast.FunctionDef)]:
+                query_params = _parse_test(method)
+                fixture = os.path.join(fixtures_directory, test_case.name, method.name + '.json')
+                if query_params is None or not os.path.exists(fixture):
+                    continue
+
+                # Query parameters as sent by the client
+                query_params = {key: query.canonical_value(value) for key, value in query_params.items()}
+                if time_format is not None:
+                    query_params.setdefault('timeFormat', time_format)
+                calls.setdefault(cache.make_key(url_path, query_params), fixture)
+
+    return calls
+
+
+def _parse_set_up(test_case: ast.ClassDef):
+    """Helper function to extract the endpoint (and default time format) of a test case from its `setUp` method."""
+
+    for node in ast.walk(test_case):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'setUp':
+            arguments = {keyword.arg: keyword.value for keyword in node.keywords}
+            try:
+                function_name = ast.literal_eval(arguments['function_name'])
+                time_format = ast.literal_eval(arguments['time_format']) if 'time_format' in arguments else None
+            except (KeyError, ValueError):
+                continue
+            return function_name, time_format
+    return None, None
+
+
+def _parse_test(method: ast.FunctionDef):
+    """Helper function to extract the parameters of the (only) call of a test method validated against its fixture."""
+
+    calls = []
+    is_validated = False
+    for node in ast.walk(method):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            if node.func.attr == 'call_endpoint':
+                calls.append(node)
+            elif node.func.attr == 'validate_response_data' and not node.keywords and len(node.args) == 1:
+                is_validated = True
+
+    if len(calls) != 1 or not is_validated or calls[0].args:
+        return None
+
+    try:
+        return {keyword.arg: ast.literal_eval(keyword.value) for keyword in calls[0].keywords}
+    except ValueError:
+        return None
+
+
+# ======================================================================================================================
+
+# pylint: disable=too-many-instance-attributes
+class ReplayServer:
+    """
+    Class to serve the recorded API responses over HTTP, with an artificial latency and bandwidth.
+
+    Calls which were not recorded are answered by a 404 error.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            latency: float = 0.0,
+            bandwidth: float = None,
+            compress: bool = True,
+            tests_directory: str = TESTS_DIRECTORY,
+            fixtures_directory: str = FIXTURES_DIRECTORY
+    ):
+        """
+        Initializes the server (started by `start()`, or when used as a context manager).
+
+        PARAMS:
+        - host               (string) The interface to listen on.
+        - port               (int)    The port to listen on (0 for any free port).
+        - latency            (float)  The number of seconds to wait before answering each call.
+        - bandwidth          (float)  The maximum number of bytes sent per second, per call (None for no limit).
+        - compress           (bool)   If true, responses are gzip-compressed when the client accepts it.
+        - tests_directory    (string) The directory of the unit tests (parsed to find the recorded calls).
+        - fixtures_directory (string) The directory of the recorded responses.
+        """
+
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.compress = compress
+        self.calls = load_calls(tests_directory, fixtures_directory)
+        self.requests = 0
+
+        self.__bodies = {}
+        self.__lock = threading.Lock()
+        self.__server = ThreadingHTTPServer((host, port), self.__create_handler())
+        self.__server.daemon_threads = True
+        self.__thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the base URL of the server (to set as `API_URL`).
+        """
+
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Starts serving in a background thread.
+        """
+
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """
+        Stops serving, and releases the port.
+        """
+
+        self.__server.shutdown()
+        self.__server.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def serve_forever(self):
+        """
+        Serves in the current thread, until interrupted.
+        """
+
+        try:
+            self.__server.serve_forever()
+        finally:
+            self.__server.server_close()
+
+    # ==================================================================================================================
+
+    def get_body(self, url: str, compress: bool):
+        """
+        Returns the HTTP status and the body of the response to a call (fixtures are read - and compressed - once).
+        """
+
+        split_url = urlsplit(url)
+        key = cache.make_key(split_url.path, dict(parse_qsl(split_url.query, keep_blank_values=True)))
+
+        fixture = self.calls.get(key)
+        if fixture is None:
+            body = json.dumps({
+                'status': 404, 'title': 'NOT FOUND', 'description': f"No recorded response for '{url}'."
+            }).encode('utf-8')
+            return 404, gzip.compress(body) if compress else body
+
+        with self.__lock:
+            self.requests += 1
+            bodies = self.__bodies.get(fixture)
+
+        if bodies is None:
+            with open(fixture, 'rb') as f:
+                body = f.read()
+            bodies = (json.loads(body).get('status', 200), body, gzip.compress(body, compresslevel=6))
+            with self.__lock:
+                self.__bodies[fixture] = bodies
+
+        return bodies[0], bodies[2] if compress else bodies[1]
+
+    def __create_handler(self):
+        """Helper method to create the request handler class, bound to this server."""
+
+        replay_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Class to answer the calls with the recorded responses."""
+
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately: do not delay the body (Nagle's algorithm)
+            disable_nagle_algorithm = True
+
+            # pylint: disable-next=invalid-name
+            def do_GET(self):
+                """Answers a call."""
+
+                compress = replay_server.compress and 'gzip' in self.headers.get('Accept-Encoding', '')
+                status, body = replay_server.get_body(self.path, compress)
+
+                if replay_server.latency > 0:
+                    time.sleep(replay_server.latency)
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if compress:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.end_headers()
+
+                self.__write(body)
+
+            def __write(self, body: bytes):
+                if not replay_server.bandwidth:
+                    self.wfile.write(body)
+                    return
+
+                # Throttled in slices of 1/100th of a second
+                size = max(1, int(replay_server.bandwidth / 100))
+                started = time.monotonic()
+                for offset in range(0, len(body), size):
+                    self.wfile.write(body[offset:offset + size])
+                    delay = started + (offset + size) / replay_server.bandwidth - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        return Handler
+
+
+# ======================================================================================================================
+
+def main():
+    """
+    Serves the recorded API responses until interrupted.
+    """
+
+    parser = argparse.ArgumentParser(description='Replays the recorded API responses (tests/fixtures) over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='The interface to listen on.')
+    parser.add_argument('--port', type=int, default=8080, help='The port to listen on.')
+    parser.add_argument('--latency', type=float, default=0.0, help='The number of seconds to wait before answering.')
+    parser.add_argument('--bandwidth', type=float, default=None, help='The maximum number of bytes sent per second.')
+    parser.add_argument('--no-compress', action='store_true', help='Never compress the responses.')
+    arguments = parser.parse_args()
+
+    server = ReplayServer(
+        host=arguments.host,
+        port=arguments.port,
+        latency=arguments.latency,
+        bandwidth=arguments.bandwidth,
+        compress=not arguments.no_compress
+    )
+    print(f"Replaying {len(server.calls)} recorded calls on {server.url} (set API_URL={server.url})")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
+
+# ======================================================================================================================
@@ -0,0 +1,104 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import os
+import tempfile
+import unittest
+
+from amberdata_derivatives import arrow_cache, columnar, ranges
+
+START = ranges.to_milliseconds('2024-04-01T00:00:00')
+PARAMS = {'exchange': 'deribit', 'currency': 'BTC', 'startDate': START, 'endDate': START + ranges.HOUR}
+
+SURFACES = [
+    {'timestamp': START + minute * ranges.MINUTE, 'expirationTimestamp': '2024-04-26 08:00:00 000', 'atm': 50 + minute,
+     'deltaCall25': 52.5, 'deltaPut25': None, 'exchange': 'deribit', 'currency': 'BTC'}
+    for minute in range(60)
+]
+
+
+# ======================================================================================================================
+
+@unittest.skipIf(arrow_cache.pa is None, "Requires 'pyarrow'")
+class ArrowCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache = arrow_cache.ArrowCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key(self):
+        self.assertEqual(
+            arrow_cache.make_key('get_volatility_delta_surfaces_floating', {'currency': 'BTC', 'exchange': 'deribit'}),
+            arrow_cache.make_key('get_volatility_delta_surfaces_floating',
+                                 {'exchange': 'deribit', 'currency': 'BTC', 'timeFormat': 'iso'})
+        )
+        self.assertNotEqual(
+            self.cache.get_path('get_volatility_delta_surfaces_floating', **PARAMS),
+            self.cache.get_path('get_volatility_delta_surfaces_floating', **{**PARAMS, 'currency': 'ETH'})
+        )
+
+    def test_read(self):
+        response = {'status': 200, 'payload': {'data': SURFACES}}
+        self.assertEqual(60, self.cache.write('get_volatility_delta_surfaces_floating', response, **PARAMS))
+
+        table = self.cache.read('get_volatility_delta_surfaces_floating', **PARAMS)
+        self.assertEqual(60, table.num_rows)
+        self.assertEqual('timestamp[ms, tz=UTC]', str(table.schema.field('expirationTimestamp').type))
+        self.assertEqual([record['atm'] for record in SURFACES], table.column('atm').to_pylist())
+        self.assertEqual([None] * 60, table.column('deltaPut25').to_pylist())
+
+        # Column pruning (missing calls are not cached)
+        table = self.cache.read('get_volatility_delta_surfaces_floating', columns=['timestamp', 'atm'], **PARAMS)
+        self.assertEqual(['timestamp', 'atm'], table.column_names)
+        self.assertIsNone(self.cache.read('get_volatility_delta_surfaces_floating', **{**PARAMS, 'currency': 'ETH'}))
+
+    @unittest.skipIf(columnar.np is None, "Requires 'numpy'")
+    def test_zero_copy(self):
+        self.cache.write('get_volatility_delta_surfaces_floating', SURFACES, **PARAMS)
+
+        allocated_bytes = arrow_cache.pa.total_allocated_bytes()
+        table = self.cache.read('get_volatility_delta_surfaces_floating', **PARAMS)
+        atm = table.column('atm').to_numpy()
+
+        # The columns point into the memory-mapped file
+        self.assertEqual(allocated_bytes, arrow_cache.pa.total_allocated_bytes())
+        self.assertFalse(atm.flags.owndata)
+        self.assertEqual(50, atm[0])
+
+    def test_replace(self):
+        self.cache.write('get_volatility_level_1_quotes', [{'timestamp': START, 'strike': 1}], **PARAMS)
+        table = self.cache.read('get_volatility_level_1_quotes', **PARAMS)
+
+        # Tables already read keep the version they mapped
+        self.cache.write('get_volatility_level_1_quotes', [{'timestamp': START, 'strike': 2}], **PARAMS)
+        self.assertEqual([1], table.column('strike').to_pylist())
+        self.assertEqual([2], self.cache.read('get_volatility_level_1_quotes', **PARAMS).column('strike').to_pylist())
+
+        # No temporary files are left
+        directory = os.path.dirname(self.cache.get_path('get_volatility_level_1_quotes', **PARAMS))
+        self.assertEqual(1, len(os.listdir(directory)))
+
+    def test_clear(self):
+        self.cache.write('get_volatility_level_1_quotes', [{'timestamp': START}], **PARAMS)
+        self.cache.write('get_volatility_delta_surfaces_floating', SURFACES, **PARAMS)
+
+        self.cache.clear('get_volatility_level_1_quotes')
+        self.assertIsNone(self.cache.read('get_volatility_level_1_quotes', **PARAMS))
+        self.assertIsNotNone(self.cache.read('get_volatility_delta_surfaces_floating', **PARAMS))
+        self.cache.clear()
+        self.assertIsNone(self.cache.read('get_volatility_delta_surfaces_floating', **PARAMS))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, self.cache.write, 'get_volatility_level_1_quotes', {'status': 500, 'payload': {}})
+        self.assertRaises(ValueError, self.cache.read, 'get_unknown')
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
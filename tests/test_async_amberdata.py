@@ -0,0 +1,157 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives, AsyncAmberdataDerivatives, RetryPolicy, TokenBucket
+
+try:
+    from aiohttp import web
+except ImportError:  # pragma: no cover
+    web = None
+
+
+# ======================================================================================================================
+
+@unittest.skipIf(web is None, "Requires 'aiohttp'")
+class AsyncAmberdataDerivativesTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failures = 0
+        self.calls = 0
+
+        async def handler(request):
+            self.calls += 1
+            if self.failures > 0:
+                self.failures -= 1
+                return web.json_response({'status': 429}, status=429, headers={'Retry-After': '0'})
+
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return web.json_response({
+                'path': request.path, 'query': dict(request.query), 'payload': {'data': [dict(request.query)] * 3}
+            })
+
+        app = web.Application()
+        app.router.add_get('/{tail:.*}', handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+        self.api_url = f'http://127.0.0.1:{port}'
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    # ==================================================================================================================
+
+    def test_same_endpoints(self):
+        sync_endpoints = [name for name in dir(AmberdataDerivatives) if name.startswith('get_')]
+        async_endpoints = [name for name in dir(AsyncAmberdataDerivatives) if name.startswith('get_')]
+        self.assertEqual(sync_endpoints, async_endpoints)
+
+    async def test_request(self):
+        with mock.patch.dict(os.environ, {'API_URL': self.api_url}):
+            client = AsyncAmberdataDerivatives(api_key='<api_key>', time_format='hr')
+
+        async with client:
+            response = await client.get_volatility_index(exchange='deribit', currency='BTC')
+
+        self.assertEqual('/markets/derivatives/analytics/volatility/index', response['path'])
+        self.assertEqual({'exchange': 'deribit', 'currency': 'BTC', 'timeFormat': 'hr'}, response['query'])
+
+    async def test_max_concurrency(self):
+        with mock.patch.dict(os.environ, {'API_URL': self.api_url}):
+            client = AsyncAmberdataDerivatives(api_key='<api_key>', max_concurrency=3)
+
+        async with client:
+            responses = await asyncio.gather(*[
+                client.get_volatility_index(exchange='deribit', currency=currency)
+                for currency in ['BTC', 'ETH', 'SOL_USDC'] * 5
+            ])
+
+        self.assertEqual(15, len(responses))
+        self.assertLessEqual(self.max_in_flight, 3)
+
+    async def test_iter_rows(self):
+        with mock.patch.dict(os.environ, {'API_URL': self.api_url}):
+            client = AsyncAmberdataDerivatives(api_key='<api_key>')
+
+        async with client:
+            rows = [row async for row in client.iter_rows('get_volatility_index', exchange='deribit', currency='BTC')]
+
+        self.assertEqual([{'exchange': 'deribit', 'currency': 'BTC'}] * 3, rows)
+
+    async def test_retry(self):
+        self.failures = 2
+        with mock.patch.dict(os.environ, {'API_URL': self.api_url}):
+            client = AsyncAmberdataDerivatives(
+                api_key='<api_key>', rate_limiter=TokenBucket(rate=1000, burst=10), retry_policy=RetryPolicy()
+            )
+
+        async with client:
+            response = await client.get_volatility_index(exchange='deribit', currency='BTC')
+            rows = [row async for row in client.iter_rows('get_volatility_index', exchange='deribit', currency='BTC')]
+
+        self.assertEqual({'exchange': 'deribit', 'currency': 'BTC'}, response['query'])
+        self.assertEqual(3, len(rows))
+        self.assertEqual(4, self.calls)
+
+    async def test_retries_exhausted(self):
+        self.failures = 2
+        with mock.patch.dict(os.environ, {'API_URL': self.api_url}):
+            client = AsyncAmberdataDerivatives(api_key='<api_key>', retry_policy=RetryPolicy(max_retries=1))
+
+        async with client:
+            response = await client.get_volatility_index(exchange='deribit', currency='BTC')
+
+        self.assertEqual({'status': 429}, response)
+        self.assertEqual(2, self.calls)
+
+    async def test_coalesce_calls(self):
+        with mock.patch.dict(os.environ, {'API_URL': self.api_url}):
+            client = AsyncAmberdataDerivatives(api_key='<api_key>', coalesce_calls=True)
+
+        async with client:
+            responses = await asyncio.gather(*[
+                client.get_volatility_index(exchange='deribit', currency=currency) for currency in ['BTC', 'ETH'] * 5
+            ])
+
+        self.assertEqual(10, len(responses))
+        self.assertEqual(2, self.calls)
+
+    async def test_fetch_batch(self):
+        with mock.patch.dict(os.environ, {'API_URL': self.api_url}):
+            client = AsyncAmberdataDerivatives(api_key='<api_key>', max_concurrency=2)
+
+        params_list = [{'exchange': 'deribit', 'currency': currency} for currency in ['BTC', 'ETH', 'SOL_USDC']]
+        async with client:
+            results = await client.fetch_batch('get_volatility_index', params_list + [{'currency': 'BTC'}])
+
+        self.assertEqual(4, len(results))
+        response = results[(('currency', 'ETH'), ('exchange', 'deribit'))]
+        self.assertEqual({'exchange': 'deribit', 'currency': 'ETH'}, response['query'])
+        self.assertIsInstance(results[(('currency', 'BTC'),)], TypeError)
+        self.assertLessEqual(self.max_in_flight, 2)
+
+    def test_sync_context_manager(self):
+        client = AsyncAmberdataDerivatives(api_key='<api_key>')
+        with self.assertRaises(TypeError):
+            with client:
+                pass
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,103 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import json
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import batching
+
+
+def fake_get(url, **_):
+    query = {key: values[0] for key, values in parse_qs(urlparse(url).query).items()}
+    if query['exchange'] == 'bybit':
+        raise requests.ConnectionError('<error>')
+
+    status = 400 if query['currency'] == 'SOL_USDC' else 200
+    return mock.Mock(status_code=status, content=json.dumps({'status': status, 'query': query}).encode('utf-8'))
+
+
+# ======================================================================================================================
+
+class BatchingTestCase(unittest.TestCase):
+    def test_combinations(self):
+        self.assertEqual(
+            [
+                {'exchange': 'deribit', 'currency': 'BTC'},
+                {'exchange': 'deribit', 'currency': 'ETH'},
+                {'exchange': 'okex', 'currency': 'BTC'},
+                {'exchange': 'okex', 'currency': 'ETH'},
+            ],
+            batching.combinations(exchange=['deribit', 'okex'], currency=['BTC', 'ETH'])
+        )
+
+    def test_make_key(self):
+        self.assertEqual(
+            batching.make_key({'exchange': 'deribit', 'currency': 'BTC'}),
+            batching.make_key({'currency': 'BTC', 'exchange': 'deribit'})
+        )
+        self.assertEqual((('instrument', "['A', 'B']"), ('strike', '100')),
+                         batching.make_key({'strike': 100, 'instrument': ['A', 'B']}))
+        self.assertRaises(TypeError, batching.make_key, None)
+
+    @mock.patch('requests.Session.get', side_effect=fake_get)
+    def test_fetch_batch(self, get):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        params_list = batching.combinations(exchange=['deribit', 'okex', 'bybit'], currency=['BTC', 'ETH', 'SOL_USDC'])
+
+        results = client.fetch_batch('get_volatility_index', params_list + [{'currency': 'BTC'}], max_workers=4)
+
+        self.assertEqual(9, get.call_count)
+        self.assertEqual(10, len(results))
+
+        response = results[batching.make_key({'exchange': 'okex', 'currency': 'ETH'})]
+        self.assertEqual({'status': 200, 'query': {'exchange': 'okex', 'currency': 'ETH'}}, response)
+
+        # Failures are reported per parameter set
+        self.assertEqual(400, results[batching.make_key({'exchange': 'deribit', 'currency': 'SOL_USDC'})]['status'])
+        error = results[batching.make_key({'exchange': 'bybit', 'currency': 'BTC'})]
+        self.assertIsInstance(error, requests.ConnectionError)
+        self.assertIsInstance(results[batching.make_key({'currency': 'BTC'})], TypeError)
+
+    @mock.patch('requests.Session.get', side_effect=fake_get)
+    def test_fetch_batch_invalid_items(self, get):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        params_list = [
+            {'exchange': 'deribit', 'currency': 'BTC'},
+            {'exchange': 'deribit', 'currency': 'ETH', 'instrument': ['BTC-26APR24-60000-C', 'BTC-26APR24-65000-C']},
+            None,
+        ]
+
+        # Unhashable values and invalid items only fail their own item
+        results = client.fetch_batch('get_volatility_index', params_list)
+
+        self.assertEqual(3, len(results))
+        self.assertEqual(200, results[batching.make_key(params_list[0])]['status'])
+        self.assertEqual(400, results[batching.make_key(params_list[1])]['status'])
+        self.assertIsInstance(results['None'], TypeError)
+        self.assertEqual(1, get.call_count)
+
+    @mock.patch('requests.Session.get', side_effect=fake_get)
+    def test_fetch_batch_duplicates(self, get):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        params_list = [{'exchange': 'deribit', 'currency': 'BTC'}, {'currency': 'BTC', 'exchange': 'deribit'}]
+
+        self.assertEqual(1, len(client.fetch_batch('get_volatility_index', params_list)))
+        self.assertEqual(1, get.call_count)
+
+    def test_fetch_batch_unknown_endpoint(self):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        self.assertRaises(ValueError, client.fetch_batch, '<function_name>', [{}])
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
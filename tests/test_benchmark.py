@@ -0,0 +1,49 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import unittest
+
+from tests import benchmark
+
+
+# ======================================================================================================================
+
+class BenchmarkTestCase(unittest.TestCase):
+    def test_run(self):
+        results = benchmark.run(endpoints=['get_volatility_index'], iterations=3, warmup=1, isolate=False)
+
+        self.assertEqual(['get_volatility_index', 'get_volatility_index_decorated'], list(results['endpoints']))
+        metrics = results['endpoints']['get_volatility_index']
+        self.assertGreater(metrics['rows'], 0)
+        self.assertGreater(metrics['rows_per_second'], 0)
+        self.assertLessEqual(metrics['latency_p50_ms'], metrics['latency_p99_ms'])
+        for metric in benchmark.COMPARED_METRICS:
+            self.assertGreater(metrics[metric], 0)
+
+    def test_compare(self):
+        baseline = {'endpoints': {
+            'get_volatility_index': {'latency_p50_ms': 10, 'decode_ms': 1, 'peak_rss_mb': 100},
+            'get_volatility_metrics': {'latency_p50_ms': 10},
+        }}
+        current = {'endpoints': {
+            'get_volatility_index': {'latency_p50_ms': 11, 'decode_ms': 2, 'peak_rss_mb': 100},
+            'get_volatility_level_1_quotes': {'latency_p50_ms': 50},
+        }}
+
+        self.assertEqual([('get_volatility_index', 'decode_ms', 1, 2)], benchmark.compare(baseline, current, 0.2))
+        self.assertEqual(2, len(benchmark.compare(baseline, current, 0.05)))
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(50, benchmark._percentile(values, 50))  # pylint: disable=protected-access
+        self.assertEqual(99, benchmark._percentile(values, 99))  # pylint: disable=protected-access
+        self.assertEqual(7, benchmark._percentile([7], 90))  # pylint: disable=protected-access
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,89 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import json
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives, ResponseCache
+from amberdata_derivatives import cache
+
+RESPONSE = {'status': 200, 'title': 'OK', 'payload': {'data': [], 'metadata': {'api-version': '2023-09-30'}}}
+
+
+# ======================================================================================================================
+
+class ResponseCacheTestCase(unittest.TestCase):
+    def test_make_key(self):
+        self.assertEqual(
+            cache.make_key('volatility/metrics', {'exchange': 'deribit', 'currency': 'BTC'}),
+            cache.make_key('volatility/metrics/', {'currency': 'BTC', 'exchange': 'deribit', 'timeFormat': 'ms'})
+        )
+        self.assertEqual(
+            cache.make_key('volatility/metrics', {'timeFormat': 'iso8601', 'isAtm': True}),
+            cache.make_key('volatility/metrics', {'timeFormat': 'iso', 'isAtm': 'true'})
+        )
+        self.assertNotEqual(
+            cache.make_key('volatility/metrics', {'timeFormat': 'iso'}),
+            cache.make_key('volatility/metrics', {'timeFormat': 'hr'})
+        )
+
+    def test_lru_eviction(self):
+        response_cache = ResponseCache(maxsize=2)
+        response_cache.put(('a', ()), 1)
+        response_cache.put(('b', ()), 2)
+        self.assertEqual(1, response_cache.get(('a', ())))
+        response_cache.put(('c', ()), 3)
+
+        self.assertIsNone(response_cache.get(('b', ())))
+        self.assertEqual(1, response_cache.get(('a', ())))
+        self.assertEqual(3, response_cache.get(('c', ())))
+        self.assertEqual({'hits': 3, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2}, response_cache.stats())
+
+    def test_ttl(self):
+        response_cache = ResponseCache(ttl=60, ttls={'volatility/metrics': 0.05, 'term-structures/richness': 0})
+        self.assertEqual(0.05, response_cache.get_ttl('markets/derivatives/analytics/volatility/metrics'))
+        self.assertEqual(60, response_cache.get_ttl('markets/derivatives/analytics/volatility/index'))
+
+        response_cache.put(('markets/derivatives/analytics/volatility/term-structures/richness', ()), 1)
+        self.assertEqual(0, len(response_cache))
+
+        with mock.patch('time.monotonic', return_value=1000):
+            response_cache.put(('markets/derivatives/analytics/volatility/metrics', ()), 1)
+        with mock.patch('time.monotonic', return_value=1000.01):
+            self.assertEqual(1, response_cache.get(('markets/derivatives/analytics/volatility/metrics', ())))
+        with mock.patch('time.monotonic', return_value=1000.1):
+            self.assertIsNone(response_cache.get(('markets/derivatives/analytics/volatility/metrics', ())))
+
+    @mock.patch('requests.Session.get')
+    def test_client(self, get):
+        get.return_value.content = json.dumps(RESPONSE).encode('utf-8')
+        response_cache = ResponseCache()
+        client = AmberdataDerivatives(api_key='<api_key>', time_format='iso', response_cache=response_cache)
+
+        client.get_volatility_metrics(exchange='deribit', currency='BTC')
+        client.get_volatility_metrics(currency='BTC', exchange='deribit', timeFormat='iso')
+        client.get_volatility_metrics(currency='BTC', exchange='deribit', timeFormat='hr')
+
+        self.assertEqual(2, get.call_count)
+        self.assertEqual(1, response_cache.hits)
+        self.assertEqual(2, response_cache.misses)
+
+    @mock.patch('requests.Session.get')
+    def test_client_errors_not_cached(self, get):
+        get.return_value.content = json.dumps({'status': 400, 'title': 'BAD REQUEST'}).encode('utf-8')
+        client = AmberdataDerivatives(api_key='<api_key>', response_cache=ResponseCache(), validate_params=False)
+
+        client.get_volatility_metrics(exchange='deribit', currency='BTC', invalid='parameter')
+        client.get_volatility_metrics(exchange='deribit', currency='BTC', invalid='parameter')
+
+        self.assertEqual(2, get.call_count)
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,121 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import coalescing
+
+
+# ======================================================================================================================
+
+class SingleFlightTestCase(unittest.TestCase):
+    def test_concurrent_calls(self):
+        single_flight = coalescing.SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            release.wait()
+            return {'status': 200}
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(single_flight.do, 'key', function) for _ in range(10)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual({'calls': 1, 'shared': 9, 'in_flight': 0}, single_flight.stats())
+
+    def test_sequential_calls(self):
+        single_flight = coalescing.SingleFlight()
+        self.assertEqual(1, single_flight.do('key', lambda: 1))
+        self.assertEqual(2, single_flight.do('key', lambda: 2))
+
+    def test_error(self):
+        single_flight = coalescing.SingleFlight()
+        release = threading.Event()
+
+        def function():
+            release.wait()
+            raise ValueError('<error>')
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(single_flight.do, 'key', function) for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                self.assertRaises(ValueError, future.result)
+
+        self.assertEqual(3, single_flight.do('key', lambda: 3))
+
+    @mock.patch('requests.Session.get')
+    def test_client(self, get):
+        release = threading.Event()
+
+        def fake_get(*_, **__):
+            release.wait()
+            return mock.Mock(status_code=200, content=json.dumps({'status': 200}).encode('utf-8'))
+
+        get.side_effect = fake_get
+        client = AmberdataDerivatives(api_key='<api_key>', coalesce_calls=True)
+
+        endpoint = client.get_volatility_term_structures_floating
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(endpoint, exchange='deribit', currency='BTC') for _ in range(8)]
+            futures.append(executor.submit(endpoint, exchange='deribit', currency='ETH'))
+            time.sleep(0.05)
+            release.set()
+            responses = [future.result() for future in futures]
+
+        self.assertEqual([{'status': 200}] * 9, responses)
+        self.assertEqual(2, get.call_count)
+
+
+class AsyncSingleFlightTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls(self):
+        single_flight = coalescing.AsyncSingleFlight()
+        calls = []
+
+        async def function():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {'status': 200}
+
+        results = await asyncio.gather(*[single_flight.do('key', function) for _ in range(10)])
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual({'calls': 1, 'shared': 9, 'in_flight': 0}, single_flight.stats())
+
+    async def test_cancelled_caller(self):
+        single_flight = coalescing.AsyncSingleFlight()
+
+        async def function():
+            await asyncio.sleep(0.02)
+            return 1
+
+        first = asyncio.ensure_future(single_flight.do('key', function))
+        second = asyncio.ensure_future(single_flight.do('key', function))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(1, await second)
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,150 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import json
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import columnar, schemas
+
+RESPONSE = {
+    'status': 200,
+    'title': 'OK',
+    'payload': {
+        'data': [
+            {'exchange': 'deribit', 'exchangeTimestamp': 1711933140000, 'close': 76.67, 'high': 77, 'volume': None},
+            {'exchange': 'deribit', 'exchangeTimestamp': 1711933080000, 'close': 76.65, 'high': 76.5, 'volume': 3},
+        ],
+        'metadata': {'api-version': '2023-09-30'}
+    }
+}
+
+
+# ======================================================================================================================
+
+@unittest.skipIf(columnar.np is None, "Requires 'numpy'")
+class ColumnarTestCase(unittest.TestCase):
+    def test_to_columns(self):
+        columns = columnar.to_columns(RESPONSE['payload']['data'], schemas.get_fields('get_volatility_index'))
+
+        self.assertEqual('int64', columns['exchangeTimestamp'].dtype)
+        self.assertEqual('float64', columns['close'].dtype)
+        self.assertEqual('float64', columns['high'].dtype)
+        self.assertEqual('object', columns['exchange'].dtype)
+        self.assertEqual([76.67, 76.65], columns['close'].tolist())
+
+        # Not in the schema: typed from the values (with missing values as NaN)
+        self.assertEqual('float64', columns['volume'].dtype)
+        self.assertEqual(3, columns['volume'][1])
+
+    def test_to_columns_categorical(self):
+        data = json.loads(json.dumps([{'instrument': 'BTC-PERPETUAL', 'putCall': None}] * 2))
+        columns = columnar.to_columns(data, schemas.get_fields('get_volatility_level_1_quotes'))
+
+        self.assertEqual('object', columns['instrument'].dtype)
+        self.assertIs(columns['instrument'][0], columns['instrument'][1])
+
+    @unittest.skipIf(columnar.pd is None, "Requires 'pandas'")
+    def test_to_dataframe_categorical(self):
+        data = [{'instrument': f"BTC-26APR24-{60000 + 1000 * (index % 3)}-C", 'markIv': index} for index in range(9)]
+        data.append({'instrument': None, 'markIv': 9})
+        frame = columnar.to_dataframe(data, schemas.get_fields('get_volatility_level_1_quotes'))
+
+        self.assertEqual('category', frame['instrument'].dtype)
+        self.assertEqual(3, len(frame['instrument'].cat.categories))
+        self.assertTrue(frame['instrument'].isna().iloc[-1])
+        self.assertEqual('float64', frame['markIv'].dtype)
+
+    def test_to_columns_timestamp_strings(self):
+        columns = columnar.to_columns([{'timestamp': '2024-04-01 00:00:00 000'}], {'timestamp': schemas.TIMESTAMP})
+        self.assertEqual('object', columns['timestamp'].dtype)
+
+    def test_normalize_timestamps(self):
+        expected = [1711929662345, 1711929600000]
+        for values in (
+                [1711929662345, 1711929600000],
+                ['2024-04-01T00:01:02.345Z', '2024-04-01T00:00:00.000Z'],
+                ['2024-04-01 00:01:02 345', '2024-04-01 00:00:00 000'],
+        ):
+            timestamps = columnar.normalize_timestamps(values)
+            self.assertEqual('datetime64[ms]', timestamps.dtype)
+            self.assertEqual(expected, timestamps.view('int64').tolist())
+
+            milliseconds = columnar.normalize_timestamps(values, columnar.EPOCH_MS)
+            self.assertEqual('int64', milliseconds.dtype)
+            self.assertEqual(expected, milliseconds.tolist())
+
+    def test_normalize_timestamps_nanoseconds(self):
+        values = [1711929662345678901, None]
+        for time_format in ('ns', 'nanoseconds'):
+            milliseconds = columnar.normalize_timestamps(values, columnar.EPOCH_MS, time_format)
+            self.assertEqual(1711929662345, milliseconds[0])
+            self.assertEqual(1711929662345, columnar.normalize_timestamps(values, time_format=time_format)[0].astype(
+                'int64'))
+
+    def test_normalize_timestamps_missing(self):
+        timestamps = columnar.normalize_timestamps(['2024-04-01 00:00:00 000', None])
+        self.assertEqual('2024-04-01T00:00:00.000', str(timestamps[0]))
+        self.assertTrue(columnar.np.isnat(timestamps[1]))
+
+        milliseconds = columnar.normalize_timestamps([None, 1711929600000], columnar.EPOCH_MS)
+        self.assertEqual('float64', milliseconds.dtype)
+        self.assertTrue(columnar.np.isnan(milliseconds[0]))
+
+    def test_normalize_timestamps_invalid(self):
+        self.assertRaises(ValueError, columnar.normalize_timestamps, ['2024-04-01'])
+        self.assertRaises(ValueError, columnar.normalize_timestamps, [1711929600000], '<dtype>')
+        self.assertRaises(ValueError, columnar.normalize_timestamps, [1711929600], columnar.EPOCH_MS, 'seconds')
+
+    def test_convert_response_error(self):
+        error = {'status': 400, 'title': 'BAD REQUEST'}
+        self.assertIs(error, columnar.convert_response(error, columnar.COLUMNS))
+
+    @unittest.skipIf(columnar.pd is None, "Requires 'pandas'")
+    @mock.patch('requests.Session.get')
+    def test_client_dataframe(self, get):
+        get.return_value.content = json.dumps(RESPONSE).encode('utf-8')
+        client = AmberdataDerivatives(api_key='<api_key>', result_format='dataframe')
+
+        response = client.get_volatility_index(exchange='deribit', currency='BTC')
+        data = response['payload']['data']
+
+        self.assertEqual(2, len(data))
+        self.assertEqual('int64', data['exchangeTimestamp'].dtype)
+        self.assertEqual(RESPONSE['payload']['metadata'], response['payload']['metadata'])
+
+    @mock.patch('requests.Session.get')
+    def test_client_timestamp_dtype(self, get):
+        get.return_value.content = json.dumps(RESPONSE).encode('utf-8')
+        client = AmberdataDerivatives(api_key='<api_key>', result_format='columns', timestamp_dtype='datetime64[ms]')
+
+        data = client.get_volatility_index(exchange='deribit', currency='BTC')['payload']['data']
+
+        self.assertEqual('datetime64[ms]', data['exchangeTimestamp'].dtype)
+        self.assertEqual([1711933140000, 1711933080000], data['exchangeTimestamp'].view('int64').tolist())
+
+    @mock.patch('requests.Session.get')
+    def test_client_timestamp_dtype_nanoseconds(self, get):
+        records = [{**record, 'exchangeTimestamp': record['exchangeTimestamp'] * 1000000}
+                   for record in RESPONSE['payload']['data']]
+        get.return_value.content = json.dumps({**RESPONSE, 'payload': {'data': records}}).encode('utf-8')
+        client = AmberdataDerivatives(api_key='<api_key>', result_format='columns', timestamp_dtype='datetime64[ms]')
+
+        # Timestamps are read in the unit of the timeFormat of the call
+        data = client.get_volatility_index(exchange='deribit', currency='BTC', timeFormat='ns')['payload']['data']
+        self.assertEqual([1711933140000, 1711933080000], data['exchangeTimestamp'].view('int64').tolist())
+
+    def test_client_invalid_format(self):
+        self.assertRaises(ValueError, AmberdataDerivatives, api_key='<api_key>', result_format='<format>')
+        self.assertRaises(ValueError, AmberdataDerivatives, api_key='<api_key>', timestamp_dtype='<dtype>')
+        self.assertRaises(ValueError, AmberdataDerivatives, api_key='<api_key>', timestamp_dtype='int64')
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,87 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives, DiskCache
+from amberdata_derivatives import cache
+
+RESPONSE = {'status': 200, 'title': 'OK', 'payload': {'data': [{'strike': 50000}], 'metadata': {'api-version': '1'}}}
+
+
+# ======================================================================================================================
+
+class DiskCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, 'cache', 'responses.sqlite3')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    # ==================================================================================================================
+
+    def test_is_closed_window(self):
+        with DiskCache(self.path, closed_after=3600) as disk_cache:
+            now = time.time()
+            self.assertTrue(disk_cache.is_closed_window({'endDate': '2024-04-01T00:00:00'}, now))
+            self.assertTrue(disk_cache.is_closed_window({'timestamp': 1711929600000}, now))
+            self.assertFalse(disk_cache.is_closed_window({'startDate': '2024-04-01T00:00:00'}, now))
+            self.assertFalse(disk_cache.is_closed_window({'endDate': int(now - 60)}, now))
+            self.assertFalse(disk_cache.is_closed_window({'endDate': '<timestamp>'}, now))
+
+    def test_closed_window_kept(self):
+        key = cache.make_key('volatility/index', {'endDate': '2024-04-01T00:00:00'})
+        with DiskCache(self.path, open_ttl=0) as disk_cache:
+            disk_cache.put(key, RESPONSE, {'endDate': '2024-04-01T00:00:00'})
+
+        # Shared with other processes (i.e. other connections)
+        with mock.patch('time.time', return_value=time.time() + 10 * 365 * 86400):
+            with DiskCache(self.path) as disk_cache:
+                self.assertEqual(RESPONSE, disk_cache.get(key))
+                self.assertEqual(0, disk_cache.purge())
+
+    def test_open_window_expires(self):
+        key = cache.make_key('volatility/index', {})
+        with DiskCache(self.path, open_ttl=60) as disk_cache:
+            disk_cache.put(key, RESPONSE, {})
+            self.assertEqual(RESPONSE, disk_cache.get(key))
+
+            with mock.patch('time.time', return_value=time.time() + 120):
+                self.assertIsNone(disk_cache.get(key))
+                self.assertEqual(1, disk_cache.purge())
+
+            self.assertEqual({'hits': 1, 'misses': 1, 'size': 0}, disk_cache.stats())
+
+    def test_open_window_not_cached(self):
+        key = cache.make_key('volatility/index', {})
+        with DiskCache(self.path, open_ttl=0) as disk_cache:
+            disk_cache.put(key, RESPONSE, {})
+            self.assertIsNone(disk_cache.get(key))
+
+    @mock.patch('requests.Session.get')
+    def test_client(self, get):
+        get.return_value.content = json.dumps(RESPONSE).encode('utf-8')
+        with DiskCache(self.path) as disk_cache:
+            for _ in range(2):
+                client = AmberdataDerivatives(api_key='<api_key>', disk_cache=disk_cache)
+                response = client.get_volatility_index(
+                    exchange='deribit', currency='BTC', startDate='2024-04-01T00:00:00', endDate='2024-04-02T00:00:00'
+                )
+                self.assertEqual(RESPONSE, response)
+
+        self.assertEqual(1, get.call_count)
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
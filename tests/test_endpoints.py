@@ -0,0 +1,109 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import inspect
+import re
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import endpoints, ranges, schemas
+
+
+def get_documented_params(method) -> dict:
+    """
+    Returns the parameters listed in the docstring of a method (name -> True if required).
+    """
+
+    documented = re.findall(r'^\s*- (\w+)\s+\([\w-]+\)\s+\[(Required|Optional)\]', method.__doc__, re.MULTILINE)
+    return {name: flag == 'Required' for name, flag in documented}
+
+
+# ======================================================================================================================
+
+class RegistryTestCase(unittest.TestCase):
+    def test_methods(self):
+        names = [name for name in dir(AmberdataDerivatives) if name.startswith('get_') and name != 'get_version']
+        self.assertEqual(sorted(names), sorted(endpoints.ENDPOINTS))
+
+        client = AmberdataDerivatives(api_key='<api_key>')
+        for name, endpoint in endpoints.ENDPOINTS.items():
+            with self.subTest(name):
+                method = getattr(client, name)
+                parameters = [parameter for parameter in inspect.signature(method).parameters if parameter != 'kwargs']
+                self.assertEqual(list(endpoint.required), parameters)
+
+                with mock.patch.object(AmberdataDerivatives, '_make_request', return_value=None) as make_request:
+                    method(**{parameter: '<value>' for parameter in parameters})
+
+                url_path, query_params = make_request.call_args.args
+                self.assertEqual(endpoint.url_path, url_path)
+                self.assertEqual(name, endpoints.get_function_name(url_path))
+                self.assertEqual(list(endpoint.required), list(query_params))
+
+    def test_docstrings(self):
+        for name, endpoint in endpoints.ENDPOINTS.items():
+            with self.subTest(name):
+                documented = get_documented_params(getattr(AmberdataDerivatives, name))
+                self.assertEqual({param: param in endpoint.required for param in endpoint.params}, documented)
+
+    def test_types(self):
+        types = {schemas.BOOL, schemas.INT, schemas.STR, schemas.TIMESTAMP}
+        for name, endpoint in endpoints.ENDPOINTS.items():
+            with self.subTest(name):
+                for kind in endpoint.params.values():
+                    # Enumerated parameters are typed by the tuple of their accepted values
+                    self.assertTrue(kind in types or all(isinstance(value, str) for value in kind), kind)
+                self.assertIn(endpoint.timestamp_field, {**endpoint.fields, 'timestamp': None})
+                self.assertTrue(set(endpoint.range_limits) <= {None, 'minute', 'hour', 'day'})
+                if endpoint.range_limits:
+                    self.assertTrue(endpoint.historical)
+
+
+# ======================================================================================================================
+
+class EndpointTestCase(unittest.TestCase):
+    def test_endpoint(self):
+        endpoint = endpoints.get_endpoint('get_volatility_level_1_quotes')
+        self.assertEqual('markets/derivatives/analytics/volatility/level-1-quotes', endpoint.url_path)
+        self.assertEqual(['exchange', 'currency'], list(endpoint.params)[:2])
+        self.assertEqual(schemas.TIMESTAMP, endpoint.params['startDate'])
+        self.assertEqual(schemas.TIMESTAMP, endpoint.fields['timestamp'])
+        self.assertEqual('timestamp', endpoint.timestamp_field)
+        self.assertTrue(endpoint.historical)
+        self.assertFalse(endpoints.get_endpoint('get_volatility_metrics').historical)
+        self.assertEqual('exchangeTimestamp', endpoints.get_endpoint('get_volatility_index').timestamp_field)
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, endpoints.get_endpoint, 'get_version')
+        self.assertIsNone(endpoints.get_function_name('markets/derivatives/analytics/unknown'))
+        self.assertEqual(
+            'get_volatility_index', endpoints.get_function_name('/markets/derivatives/analytics/volatility/index/')
+        )
+
+    def test_check_params(self):
+        endpoint = endpoints.get_endpoint('get_volatility_index')
+        endpoint.check_params({'exchange': 'deribit', 'currency': 'BTC', 'unknown': 'parameter'})
+        with self.assertRaisesRegex(TypeError, "'exchange', 'currency'"):
+            endpoint.check_params({})
+
+    def test_split_range(self):
+        endpoint = endpoints.get_endpoint('get_volatility_delta_surfaces_constant')
+        self.assertEqual(5, len(endpoint.split_range('2024-01-01', '2024-12-31', 'h')))
+        self.assertEqual(1, len(endpoint.split_range('2024-01-01', '2024-12-31', 'day')))
+        self.assertEqual(
+            [(0, ranges.HOUR), (ranges.HOUR, 2 * ranges.HOUR)], endpoint.split_range(0, 2 * ranges.HOUR // 1000)
+        )
+        self.assertRaises(ValueError, endpoint.split_range, 0, 1, 'week')
+
+        endpoint = endpoints.get_endpoint('get_volatility_index')
+        self.assertEqual([(1000, 2000)], endpoint.split_range(1, 2, 'minute'))
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
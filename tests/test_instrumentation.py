@@ -0,0 +1,219 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+
+from amberdata_derivatives import AmberdataDerivatives, AsyncAmberdataDerivatives, DiskCache, ResponseCache, RetryPolicy
+from amberdata_derivatives import instrumentation
+from tests.replay_server import FIXTURES_DIRECTORY, ReplayServer
+
+FIXTURE = os.path.join(FIXTURES_DIRECTORY, 'EndpointVolatilityIndexTestCase', 'test_historical_timeformat_iso.json')
+PARAMS = {
+    'exchange': 'deribit', 'currency': 'BTC', 'startDate': '2024-04-01T00:00:00', 'endDate': '2024-04-01T01:00:00',
+    'timeFormat': 'iso',
+}
+URL_PATH = 'markets/derivatives/analytics/volatility/index'
+
+
+def http_response(status: int, headers: dict = None):
+    content = json.dumps({'status': status}).encode('utf-8')
+    response = mock.Mock(status_code=status, headers=headers or {}, content=content)
+    response.raw.read.return_value = content
+    return response
+
+
+# ======================================================================================================================
+
+class EventTestCase(unittest.TestCase):
+    def test_to_dict(self):
+        event = instrumentation.RequestEvent(URL_PATH, {'currency': 'BTC'})
+        event.status = 200
+        event.finish(ValueError('<error>'))
+
+        event = event.to_dict()
+        self.assertEqual({'currency': 'BTC'}, event['params'])
+        self.assertEqual(200, event['status'])
+        self.assertEqual('ValueError: <error>', event['error'])
+        self.assertGreaterEqual(event['timings']['total'], 0)
+        json.dumps(event)
+
+    def test_recorder(self):
+        recorder = instrumentation.EventRecorder(max_events=2)
+        for i in range(3):
+            recorder(instrumentation.RequestEvent(URL_PATH, {'i': i}))
+
+        self.assertEqual([{'i': 1}, {'i': 2}], [event.params for event in recorder.events])
+        recorder.clear()
+        self.assertEqual([], recorder.events)
+
+    def test_failing_observer(self):
+        def observer(_):
+            raise ValueError('<error>')
+
+        recorder = instrumentation.EventRecorder()
+        event = instrumentation.RequestEvent(URL_PATH, {})
+        with self.assertLogs('amberdata_derivatives.instrumentation', 'ERROR'):
+            instrumentation.notify([observer, recorder], event)
+        self.assertEqual([event], recorder.events)
+
+
+# ======================================================================================================================
+
+class ClientInstrumentationTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ReplayServer(latency=0.02)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def create_client(self, client_class=AmberdataDerivatives, **kwargs):
+        with mock.patch.dict(os.environ, {'API_URL': self.server.url}):
+            return client_class(api_key='<api_key>', **kwargs)
+
+    # ==================================================================================================================
+
+    def test_call(self):
+        recorder = instrumentation.EventRecorder()
+        with self.create_client(observers=[recorder]) as client:
+            client.get_volatility_index(**PARAMS)
+            client.get_volatility_index(**PARAMS)
+
+        first, second = recorder.events
+        self.assertEqual(URL_PATH, first.url_path)
+        self.assertEqual(PARAMS, first.params)
+        self.assertEqual(200, first.status)
+        self.assertIsNone(first.cache)
+        self.assertEqual(0, first.retries)
+        self.assertEqual(os.path.getsize(FIXTURE), first.uncompressed_bytes)
+        self.assertLess(first.compressed_bytes, first.uncompressed_bytes)
+        self.assertIsNone(first.error)
+
+        # The connection is opened by the first call only (then reused)
+        self.assertGreater(first.timings['connect'], 0)
+        self.assertEqual(0, second.timings['connect'])
+        for event in (first, second):
+            self.assertGreaterEqual(event.timings['first_byte'], 0.02)
+            self.assertGreaterEqual(event.timings['total'], sum(
+                event.timings[phase] for phase in ('first_byte', 'download', 'decompress', 'decode')
+            ))
+
+    def test_cache(self):
+        recorder = instrumentation.EventRecorder()
+        with tempfile.TemporaryDirectory() as directory, DiskCache(os.path.join(directory, 'cache.db')) as disk_cache:
+            with self.create_client(disk_cache=disk_cache) as client:
+                client.get_volatility_index(**PARAMS)
+
+            client = self.create_client(response_cache=ResponseCache(), disk_cache=disk_cache, observers=[recorder])
+            with client:
+                client.get_volatility_index(**PARAMS)
+                client.get_volatility_index(**PARAMS)
+                client.get_volatility_index(exchange='deribit', currency='ETH')
+
+        self.assertEqual(
+            [(instrumentation.DISK, None), (instrumentation.MEMORY, None), (instrumentation.MISS, 404)],
+            [(event.cache, event.status) for event in recorder.events]
+        )
+        self.assertIsNone(recorder.events[0].uncompressed_bytes)
+
+    def test_coalesced_calls(self):
+        recorder = instrumentation.EventRecorder()
+        with self.create_client(coalesce_calls=True, observers=[recorder]) as client:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for future in [executor.submit(client.get_volatility_index, **PARAMS) for _ in range(4)]:
+                    future.result()
+
+        statuses = sorted((event.coalesced, event.status) for event in recorder.events)
+        self.assertEqual(4, len(statuses))
+        self.assertEqual((False, 200), statuses[0])
+        self.assertEqual([(True, None)] * (len(statuses) - 1), statuses[1:])
+
+    def test_async_call(self):
+        recorder = instrumentation.EventRecorder()
+
+        async def main():
+            async with self.create_client(AsyncAmberdataDerivatives, observers=[recorder]) as client:
+                await asyncio.gather(client.get_volatility_index(**PARAMS), client.get_volatility_index(**PARAMS))
+                await client.get_volatility_index(**PARAMS)
+
+        asyncio.run(main())
+
+        self.assertEqual(3, len(recorder.events))
+        for event in recorder.events:
+            self.assertEqual((200, 0), (event.status, event.retries))
+            self.assertEqual(os.path.getsize(FIXTURE), event.uncompressed_bytes)
+            self.assertLess(event.compressed_bytes, event.uncompressed_bytes)
+            self.assertGreaterEqual(event.timings['first_byte'], 0.02)
+
+        # Two connections are opened for the concurrent calls, and one of them is reused by the last call
+        self.assertTrue(all(event.timings['connect'] > 0 for event in recorder.events[:2]))
+        self.assertEqual(0, recorder.events[2].timings['connect'])
+
+    # ==================================================================================================================
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.get')
+    def test_retries(self, get, _):
+        get.side_effect = [requests.ConnectionError(), http_response(503), http_response(200)]
+        recorder = instrumentation.EventRecorder()
+        client = AmberdataDerivatives(api_key='<api_key>', retry_policy=RetryPolicy(), observers=[recorder])
+
+        client.get_volatility_index(exchange='deribit', currency='BTC')
+
+        event, = recorder.events
+        self.assertEqual((200, 2), (event.status, event.retries))
+        self.assertEqual(len(json.dumps({'status': 200})), event.compressed_bytes)
+        self.assertTrue(get.call_args.kwargs['stream'])
+
+    @mock.patch('requests.Session.get')
+    def test_error(self, get):
+        get.side_effect = requests.ConnectionError('<error>')
+        recorder = instrumentation.EventRecorder()
+        client = AmberdataDerivatives(api_key='<api_key>', observers=[recorder])
+
+        self.assertRaises(requests.ConnectionError, client.get_volatility_index, exchange='deribit', currency='BTC')
+
+        event, = recorder.events
+        self.assertIsInstance(event.error, requests.ConnectionError)
+        self.assertIsNone(event.status)
+
+    @mock.patch('requests.Session.get')
+    def test_observer_thread(self, get):
+        get.return_value = http_response(200)
+        threads = []
+        client = AmberdataDerivatives(api_key='<api_key>', observers=[lambda _: threads.append(threading.get_ident())])
+
+        client.fetch_batch('get_volatility_index', [{'exchange': 'deribit', 'currency': c} for c in ('BTC', 'ETH')])
+
+        self.assertEqual(2, len(threads))
+        self.assertNotIn(threading.get_ident(), threads)
+
+    @mock.patch('requests.Session.get')
+    def test_no_observer(self, get):
+        get.return_value = http_response(200)
+        client = AmberdataDerivatives(api_key='<api_key>')
+
+        client.get_volatility_index(exchange='deribit', currency='BTC')
+
+        # Not instrumented: the body is read along with the headers
+        self.assertFalse(get.call_args.kwargs['stream'])
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,52 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import glob
+import json
+import math
+import os
+import unittest
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import json_backend
+
+FIXTURES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), 'fixtures', '*', '*.json')))
+
+
+# ======================================================================================================================
+
+class JsonBackendTestCase(unittest.TestCase):
+    def test_identical_output(self):
+        for backend in json_backend.AVAILABLE_BACKENDS:
+            loads = json_backend.get_loads(backend)
+            for fixture in FIXTURES:
+                with open(fixture, 'rb') as file:
+                    body = file.read()
+                with self.subTest(backend=backend, fixture=fixture):
+                    self.assertEqual(json.loads(body), loads(body))
+
+    def test_fallback(self):
+        for backend in json_backend.AVAILABLE_BACKENDS:
+            loads = json_backend.get_loads(backend)
+            self.assertEqual(2 ** 70, loads(b'{"value": 1180591620717411303424}')['value'])
+            self.assertTrue(math.isnan(loads(b'{"value": NaN}')['value']))
+            self.assertRaises(ValueError, loads, b'{"value": ')
+
+    def test_default_backend(self):
+        self.assertEqual(json_backend.AVAILABLE_BACKENDS[0], json_backend.DEFAULT_BACKEND)
+        self.assertEqual({'status': 200}, json_backend.loads('{"status": 200}'))
+
+    def test_invalid_backend(self):
+        self.assertRaises(ValueError, json_backend.get_loads, '<backend>')
+        for backend in set(json_backend.BACKENDS) - set(json_backend.AVAILABLE_BACKENDS):
+            self.assertRaises(ImportError, json_backend.get_loads, backend)
+            self.assertRaises(ImportError, AmberdataDerivatives, api_key='<api_key>', json_library=backend)
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,215 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import asyncio
+import json
+import threading
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives, AsyncAmberdataDerivatives
+from amberdata_derivatives import endpoints, pagination, ranges
+
+START = ranges.to_milliseconds('2024-04-01T00:00:00')
+END = START + ranges.DAY
+STEP = 10 * ranges.MINUTE
+RECORDS = [
+    {'exchangeTimestamp': timestamp, 'price': price} for price, timestamp in enumerate(range(START, END + 1, STEP))
+]
+NEXT_URL = 'https://api.amberdata.com/markets/derivatives/analytics/instruments/information?exchange=deribit&page=1'
+
+
+def serve(_, query_params: dict, records: list = None, **_kwargs) -> dict:
+    """
+    Answers a call like the API would: the records of [startDate, endDate] (both included), `limit` records at most.
+    """
+
+    start, end = (ranges.to_milliseconds(query_params[name]) for name in ('startDate', 'endDate'))
+    data = [record for record in records or RECORDS if start <= record['exchangeTimestamp'] <= end]
+    data = data[:int(query_params['limit'])] if 'limit' in query_params else data
+    return {'status': 200, 'payload': {'data': data, 'metadata': {'api-version': '2023-09-30'}}}
+
+
+def response(data: list, next_url: str = None) -> dict:
+    return {'status': 200, 'payload': {'data': data, 'metadata': {'next': next_url} if next_url else {}}}
+
+
+# ======================================================================================================================
+
+class PageCursorTestCase(unittest.TestCase):
+    def test_windows(self):
+        endpoint = endpoints.get_endpoint('get_trades_flow_decorated_trades')
+        cursor = pagination.PageCursor(endpoint, {'currency': 'BTC', 'startDate': START, 'endDate': END}, ranges.HOUR)
+
+        windows = []
+        while cursor.request is not None:
+            url_path, query_params = cursor.request
+            self.assertEqual(endpoint.url_path, url_path)
+            windows.append((query_params['startDate'], query_params['endDate']))
+            cursor.advance(serve(url_path, query_params))
+
+        self.assertEqual(ranges.split_range(START, END, ranges.HOUR), windows)
+
+    def test_default_page_size(self):
+        endpoint = endpoints.get_endpoint('get_volatility_level_1_quotes')
+        for query_params, page_size in [
+            ({}, endpoint.range_limits[None]),
+            ({'timeInterval': 'hour'}, endpoint.range_limits['hour']),
+        ]:
+            with self.subTest(query_params):
+                cursor = pagination.PageCursor(endpoint, {'startDate': START, 'endDate': END, **query_params})
+                self.assertEqual(START + page_size, cursor.request[1]['endDate'])
+
+        cursor = pagination.PageCursor(endpoints.get_endpoint('get_volatility_index'), {'startDate': START})
+        self.assertEqual(START + pagination.DEFAULT_PAGE_SIZE, cursor.request[1]['endDate'])
+
+    def test_boundaries(self):
+        endpoint = endpoints.get_endpoint('get_trades_flow_decorated_trades')
+        cursor = pagination.PageCursor(endpoint, {'startDate': START, 'endDate': START + 2 * ranges.HOUR}, ranges.HOUR)
+
+        first = cursor.advance(serve(*cursor.request))
+        second = cursor.advance(serve(*cursor.request))
+
+        # The record at the boundary of the windows is returned once
+        self.assertEqual(START + ranges.HOUR, first['payload']['data'][-1]['exchangeTimestamp'])
+        self.assertEqual(START + ranges.HOUR + STEP, second['payload']['data'][0]['exchangeTimestamp'])
+        self.assertIsNone(cursor.request)
+
+    def test_full_pages(self):
+        # Two records per timestamp, pages capped at 3 records: the timestamps of the cap are requested again
+        records = [{'exchangeTimestamp': START + index // 2 * STEP, 'price': index} for index in range(10)]
+        endpoint = endpoints.get_endpoint('get_trades_flow_decorated_trades')
+        cursor = pagination.PageCursor(endpoint, {'startDate': START, 'endDate': START + ranges.HOUR, 'limit': 3})
+
+        pages = []
+        while cursor.request is not None:
+            pages.append(cursor.advance(serve(*cursor.request, records=records))['payload']['data'])
+
+        self.assertEqual(records, [record for page in pages for record in page])
+        self.assertEqual([3, 2, 2, 2, 1], [len(page) for page in pages])
+
+        # Pages of records at one timestamp move past it
+        cursor = pagination.PageCursor(endpoint, {'startDate': START, 'endDate': START + ranges.HOUR}, page_limit=1)
+        for _ in range(10):
+            if cursor.request is not None:
+                cursor.advance(serve(*cursor.request, records=records))
+        self.assertIsNone(cursor.request)
+
+    def test_next_url(self):
+        endpoint = endpoints.get_endpoint('get_instruments_information')
+        cursor = pagination.PageCursor(endpoint, {'exchange': 'deribit'})
+        self.assertEqual((endpoint.url_path, {'exchange': 'deribit'}), cursor.request)
+
+        self.assertTrue(cursor.validate)
+
+        # The parameters of continuation links are built by the API (ex: page), and not validated
+        cursor.advance(response([{'instrument': 'A'}], NEXT_URL))
+        self.assertEqual((endpoint.url_path, {'exchange': 'deribit', 'page': '1'}), cursor.request)
+        self.assertFalse(cursor.validate)
+
+        cursor.advance(response([{'instrument': 'B'}]))
+        self.assertIsNone(cursor.request)
+
+    def test_error(self):
+        cursor = pagination.PageCursor(endpoints.get_endpoint('get_instruments_information'), {'exchange': 'deribit'})
+        error = {'status': 500, 'title': 'INTERNAL SERVER ERROR'}
+
+        self.assertIs(error, cursor.advance(error))
+        self.assertIsNone(cursor.request)
+
+
+# ======================================================================================================================
+
+class ClientPaginationTestCase(unittest.TestCase):
+    def test_pages(self):
+        client = AmberdataDerivatives(api_key='<api_key>', result_format='columns')
+        with mock.patch.object(AmberdataDerivatives, '_request_json', side_effect=serve) as request_json:
+            pages = list(client.iter_pages(
+                'get_trades_flow_decorated_trades', page_size=6 * ranges.HOUR,
+                exchange='deribit', currency='BTC', startDate=START, endDate=END
+            ))
+
+        self.assertEqual(4, request_json.call_count)
+        self.assertEqual(
+            [record['exchangeTimestamp'] for record in RECORDS],
+            [timestamp for page in pages for timestamp in page['payload']['data']['exchangeTimestamp'].tolist()]
+        )
+
+    def test_prefetch(self):
+        requested = threading.Event()
+
+        def request_json(url_path, query_params, **_kwargs):
+            if query_params['startDate'] > START:
+                requested.set()
+            return serve(url_path, query_params)
+
+        client = AmberdataDerivatives(api_key='<api_key>')
+        with mock.patch.object(AmberdataDerivatives, '_request_json', side_effect=request_json):
+            for prefetch in (True, False):
+                with self.subTest(prefetch=prefetch):
+                    requested.clear()
+                    pages = client.iter_pages(
+                        'get_volatility_index', page_size=ranges.HOUR, prefetch=prefetch,
+                        exchange='deribit', currency='BTC', startDate=START, endDate=END
+                    )
+                    next(pages)
+
+                    # The second page is requested while the caller processes the first one (unless disabled)
+                    self.assertEqual(prefetch, requested.wait(0.5))
+                    pages.close()
+
+    def test_next_url(self):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        responses = [response([{'instrument': 'A'}], NEXT_URL), response([{'instrument': 'B'}])]
+        with mock.patch.object(AmberdataDerivatives, '_request_json', side_effect=responses) as request_json:
+            pages = list(client.iter_pages('get_instruments_information', exchange='deribit'))
+
+        self.assertEqual(responses, pages)
+        self.assertEqual({'exchange': 'deribit', 'page': '1'}, request_json.call_args.args[1])
+
+    @mock.patch('requests.Session.get')
+    def test_next_url_request(self, get):
+        bodies = [response([{'instrument': 'A'}], NEXT_URL), response([{'instrument': 'B'}])]
+        get.side_effect = [mock.Mock(status_code=200, content=json.dumps(body).encode('utf-8')) for body in bodies]
+
+        # Continuation links are requested as is, with their parameters unknown to the registry (default client)
+        client = AmberdataDerivatives(api_key='<api_key>')
+        pages = list(client.iter_pages('get_instruments_information', exchange='deribit'))
+
+        self.assertEqual(bodies, pages)
+        self.assertEqual(2, get.call_count)
+        self.assertTrue(get.call_args.args[0].endswith('/markets/derivatives/analytics/instruments/information?'
+                                                       'exchange=deribit&page=1'))
+
+    def test_invalid_arguments(self):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        self.assertRaises(TypeError, next, client.iter_pages('get_volatility_index', exchange='deribit'))
+        self.assertRaises(ValueError, next, client.iter_pages('get_unknown'))
+
+    def test_async_pages(self):
+        async def main():
+            async with AsyncAmberdataDerivatives(api_key='<api_key>') as client:
+                pages = client.iter_pages(
+                    'get_trades_flow_decorated_trades', page_size=6 * ranges.HOUR,
+                    exchange='deribit', currency='BTC', startDate=START, endDate=END
+                )
+                return [page async for page in pages]
+
+        async def request_json(url_path, query_params, **_kwargs):
+            await asyncio.sleep(0.01)
+            return serve(url_path, query_params)
+
+        with mock.patch.object(AsyncAmberdataDerivatives, '_request_json', side_effect=request_json):
+            pages = asyncio.run(main())
+
+        self.assertEqual(4, len(pages))
+        self.assertEqual(RECORDS, [record for page in pages for record in page['payload']['data']])
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,117 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import os
+import tempfile
+import unittest
+
+from amberdata_derivatives import columnar, parquet_store, ranges
+
+START = ranges.to_milliseconds('2024-04-01T00:00:00')
+FUNCTION_NAME = 'get_volatility_level_1_quotes'
+
+
+def make_quotes(start: int, hours: int, currency: str = 'BTC') -> list:
+    return [
+        {
+            'exchange': 'deribit',
+            'currency': currency,
+            'timestamp': start + hour * ranges.HOUR,
+            'instrument': f"{currency}-26APR24-{strike}-{put_call}",
+            'strike': strike,
+            'putCall': put_call,
+            'markIv': 50 + hour / 10,
+            'isAtm': strike == 70000,
+        }
+        for hour in range(hours) for strike in (60000, 70000) for put_call in ('C', 'P')
+    ]
+
+
+# ======================================================================================================================
+
+@unittest.skipIf(parquet_store.pa is None, "Requires 'pyarrow'")
+class ParquetStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = parquet_store.ParquetStore(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_partitions(self):
+        response = {'status': 200, 'payload': {'data': make_quotes(START, 48)}}
+        self.assertEqual(4 * 48, self.store.write(FUNCTION_NAME, response))
+        self.store.write(FUNCTION_NAME, make_quotes(START, 1, 'ETH'))
+
+        path = self.store.get_path(FUNCTION_NAME)
+        self.assertEqual(['currency=BTC', 'currency=ETH'], sorted(os.listdir(os.path.join(path, 'exchange=deribit'))))
+        self.assertEqual(['date=2024-04-01', 'date=2024-04-02'],
+                         sorted(os.listdir(os.path.join(path, 'exchange=deribit', 'currency=BTC'))))
+
+    def test_read(self):
+        quotes = make_quotes(START, 48)
+        self.store.write(FUNCTION_NAME, quotes[::-1])
+
+        table = self.store.read(FUNCTION_NAME)
+        self.assertEqual(len(quotes), table.num_rows)
+        self.assertEqual('timestamp[ms, tz=UTC]', str(table.schema.field('timestamp').type))
+        self.assertEqual('double', str(table.schema.field('strike').type))
+        self.assertEqual(sorted(record['timestamp'] for record in quotes),
+                         table.column('timestamp').cast('int64').to_pylist())
+
+        # Filters and column pruning
+        table = self.store.read(
+            FUNCTION_NAME, columns=['timestamp', 'markIv'], start_date=START + 23 * ranges.HOUR,
+            end_date='2024-04-02T02:00:00', instrument='BTC-26APR24-70000-P', putCall=['P'], strike=70000
+        )
+        self.assertEqual(['timestamp', 'markIv'], table.column_names)
+        self.assertEqual([START + hour * ranges.HOUR for hour in (23, 24, 25)],
+                         table.column('timestamp').cast('int64').to_pylist())
+        self.assertEqual(0, self.store.read(FUNCTION_NAME, currency='ETH').num_rows)
+
+    def test_time_formats(self):
+        quotes = [
+            {'timestamp': '2024-04-01T01:00:00.000Z', 'strike': 1, 'expirationTimestamp': None},
+            {'timestamp': '2024-04-01 02:00:00 000', 'strike': 2},
+        ]
+        self.store.write(FUNCTION_NAME, quotes, exchange='deribit', currency='BTC')
+
+        table = self.store.read(FUNCTION_NAME, exchange='deribit', currency='BTC')
+        self.assertEqual([START + ranges.HOUR, START + 2 * ranges.HOUR],
+                         table.column('timestamp').cast('int64').to_pylist())
+        self.assertEqual([None, None], table.column('expirationTimestamp').to_pylist())
+        self.assertEqual(['2024-04-01', '2024-04-01'], table.column('date').to_pylist())
+
+    @unittest.skipIf(columnar.pd is None, "Requires 'pandas'")
+    def test_dataframe(self):
+        quotes = make_quotes(START, 2)
+        self.store.write(FUNCTION_NAME, columnar.to_dataframe(quotes, timestamp_dtype=columnar.DATETIME64))
+
+        frame = self.store.read(FUNCTION_NAME, columns=['instrument', 'markIv']).to_pandas()
+        self.assertEqual(sorted(record['markIv'] for record in quotes), sorted(frame['markIv'].tolist()))
+
+    def test_replace(self):
+        self.store.write(FUNCTION_NAME, make_quotes(START, 2))
+        self.store.write(FUNCTION_NAME, make_quotes(START, 2))
+        self.assertEqual(16, self.store.read(FUNCTION_NAME).num_rows)
+
+        self.store.write(FUNCTION_NAME, make_quotes(START, 3), replace=True)
+        self.assertEqual(12, self.store.read(FUNCTION_NAME).num_rows)
+
+    def test_empty(self):
+        table = self.store.read(FUNCTION_NAME, columns=['instrument'])
+        self.assertEqual((0, ['instrument']), (table.num_rows, table.column_names))
+        self.assertEqual(0, self.store.write(FUNCTION_NAME, []))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, self.store.write, FUNCTION_NAME, {'status': 400, 'payload': {}})
+        self.assertRaises(ValueError, self.store.get_path, 'get_unknown')
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,148 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import asyncio
+import datetime as dt
+import json
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives, AsyncAmberdataDerivatives
+from amberdata_derivatives import endpoints, instrumentation, query, ranges
+from tests.error_message import ErrorMessage
+from tests.replay_server import load_calls
+
+LEVEL_1_QUOTES = endpoints.get_endpoint('get_volatility_level_1_quotes')
+
+
+# ======================================================================================================================
+
+class EncodingTestCase(unittest.TestCase):
+    def test_canonical_value(self):
+        self.assertEqual('true', query.canonical_value(True))
+        self.assertEqual('false', query.canonical_value(False))
+        self.assertEqual('100000', query.canonical_value(100000))
+        self.assertEqual('2024-04-01T08:00:00', query.canonical_value(dt.datetime(2024, 4, 1, 8)))
+        self.assertEqual('BTC', query.canonical_value('BTC'))
+
+    def test_canonicalize(self):
+        self.assertEqual(
+            query.canonicalize({'exchange': 'deribit', 'currency': 'BTC', 'isAtm': True}),
+            query.canonicalize({'isAtm': 'true', 'currency': 'BTC', 'exchange': 'deribit'})
+        )
+
+    def test_encode(self):
+        self.assertEqual('currency=BTC&exchange=deribit', query.encode({'exchange': 'deribit', 'currency': 'BTC'}))
+        self.assertEqual(
+            'startDate=2024-04-01T00:00:00&uniqueTrade=%5B%22sell%20BTC-27SEP24-90000-C%22%5D',
+            query.encode({'uniqueTrade': '["sell BTC-27SEP24-90000-C"]', 'startDate': '2024-04-01T00:00:00'})
+        )
+        self.assertEqual('instrument=BTC-27SEP24-90000-C%2BX', query.encode({'instrument': 'BTC-27SEP24-90000-C+X'}))
+
+
+# ======================================================================================================================
+
+class ValidationTestCase(unittest.TestCase):
+    def test_valid(self):
+        self.assertIsNone(query.validate(LEVEL_1_QUOTES, {
+            'exchange': 'deribit', 'currency': 'BTC', 'isAtm': True, 'strike': 100000, 'putCall': 'C',
+            'startDate': '2024-04-01T00:00:00', 'endDate': 1711929600000, 'timeFormat': 'iso',
+        }))
+
+    def test_invalid(self):
+        for query_params, message in [
+            ({'invalid': 'parameter'}, ErrorMessage.INVALID_PARAMETER),
+            ({'putCall': '<put_call>'}, ErrorMessage.INVALID_PARAMETER_PUT_CALL),
+            ({'timeFormat': '<time_format>'}, ErrorMessage.INVALID_PARAMETER_TIME_FORMAT),
+            ({'startDate': '<timestamp>'}, ErrorMessage.INVALID_PARAMETER_TIMESTAMP),
+            ({'strike': '<strike>'}, "The argument 'strike' is not in numerical form (<strike>)."),
+            ({'strike': 1.5}, "The argument 'strike' is not in numerical form (1.5)."),
+            ({'startDate': '2024-04-01 00:00:00 000'}, "Invalid timestamp value: '2024-04-01 00:00:00 000'."),
+            ({'startDate': '2024-02-30'}, "Invalid timestamp value: '2024-02-30'."),
+        ]:
+            with self.subTest(query_params):
+                self.assertEqual(message, query.validate(LEVEL_1_QUOTES, {'exchange': 'deribit', **query_params}))
+
+    def test_recorded_calls(self):
+        rejected = []
+        for (url_path, query_params), fixture in load_calls().items():
+            with open(fixture, 'r', encoding='utf-8') as f:
+                response = json.load(f)
+
+            message = query.validate(endpoints.find_endpoint(url_path), dict(query_params))
+            if message is not None:
+                if response['status'] == 400:
+                    # Rejected with the very message of the API
+                    self.assertEqual(response['message'], message)
+                elif response['status'] == 200:
+                    rejected.append(message)
+
+        # No call the API accepts is rejected (ex: invalid isAtm values, see test_invalid_isatm)
+        self.assertEqual([], rejected)
+
+    def test_dates(self):
+        # ISO 8601 dates are parsed the same way on all the versions of Python
+        for value in (
+                '2024-04-01', '2024-04-01T00:00', '2024-04-01T00:00:00Z', '2024-04-01 00:00:00.000Z',
+                '2024-04-01T02:00:00+0200', '2024-03-31T22:00:00-02:00', 1711929600000, '1711929600000',
+        ):
+            with self.subTest(value):
+                self.assertIsNone(query.validate(LEVEL_1_QUOTES, {'startDate': value}))
+                self.assertEqual(1711929600000, ranges.to_milliseconds(value))
+
+        self.assertEqual(1711929600100, ranges.to_milliseconds('2024-04-01T00:00:00.1Z'))
+        self.assertEqual(1711929600123, ranges.to_milliseconds('2024-04-01T00:00:00.1234567'))
+
+
+# ======================================================================================================================
+
+class ClientValidationTestCase(unittest.TestCase):
+    @mock.patch('requests.Session.get')
+    def test_client(self, get):
+        recorder = instrumentation.EventRecorder()
+        client = AmberdataDerivatives(api_key='<api_key>', coalesce_calls=True, observers=[recorder])
+
+        response = client.get_volatility_index(exchange='deribit', currency='BTC', invalid='parameter')
+
+        self.assertEqual(query.bad_request(ErrorMessage.INVALID_PARAMETER), response)
+        get.assert_not_called()
+
+        event, = recorder.events
+        self.assertEqual((400, False, None), (event.status, event.coalesced, event.error))
+
+    @mock.patch('requests.Session.get')
+    def test_disabled(self, get):
+        get.return_value.content = json.dumps({'status': 400}).encode('utf-8')
+        client = AmberdataDerivatives(api_key='<api_key>', validate_params=False)
+
+        client.get_volatility_index(exchange='deribit', currency='BTC', invalid='parameter')
+
+        self.assertIn('?currency=BTC&exchange=deribit&invalid=parameter', get.call_args.args[0])
+
+    @mock.patch('requests.Session.get')
+    def test_iter_rows(self, get):
+        client = AmberdataDerivatives(api_key='<api_key>')
+
+        with self.assertRaisesRegex(ValueError, ErrorMessage.INVALID_PARAMETER):
+            list(client.iter_rows('get_volatility_index', exchange='deribit', currency='BTC', invalid='parameter'))
+        get.assert_not_called()
+
+    def test_async_client(self):
+        async def main():
+            async with AsyncAmberdataDerivatives(api_key='<api_key>') as client:
+                return await client.get_volatility_index(exchange='deribit', currency='BTC', timeFormat='<time_format>')
+
+        with mock.patch('aiohttp.ClientSession._request') as request:
+            response = asyncio.run(main())
+
+        self.assertEqual(query.bad_request(ErrorMessage.INVALID_PARAMETER_TIME_FORMAT), response)
+        request.assert_not_called()
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,113 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import datetime as dt
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import ranges
+
+
+# ======================================================================================================================
+
+def fake_response(query_params):
+    """
+    Returns one record per minute of the requested window (plus a duplicate of the first minute of the next window).
+    """
+    start, end = query_params['startDate'], query_params['endDate']
+    data = [{'timestamp': timestamp} for timestamp in range(start, end + ranges.MINUTE, ranges.MINUTE)]
+    return {'status': 200, 'title': 'OK', 'payload': {'data': list(reversed(data)), 'metadata': {'api-version': '1'}}}
+
+
+class RangesTestCase(unittest.TestCase):
+    def test_to_milliseconds(self):
+        self.assertEqual(1578531600000, ranges.to_milliseconds(1578531600))
+        self.assertEqual(1578531600000, ranges.to_milliseconds(1578531600000))
+        self.assertEqual(1578531600000, ranges.to_milliseconds('1578531600'))
+        self.assertEqual(1711929600000, ranges.to_milliseconds('2024-04-01T00:00:00'))
+        self.assertEqual(1711929600000, ranges.to_milliseconds('2024-04-01T00:00:00.000Z'))
+        self.assertEqual(1711929600000, ranges.to_milliseconds(dt.datetime(2024, 4, 1)))
+        self.assertRaises(ValueError, ranges.to_milliseconds, '<timestamp>')
+
+    def test_split_range(self):
+        windows = ranges.split_range('2024-04-01T00:00:00', '2024-04-01T02:30:00', ranges.HOUR)
+        self.assertEqual([
+            (1711929600000, 1711933200000),
+            (1711933200000, 1711936800000),
+            (1711936800000, 1711938600000),
+        ], windows)
+
+    def test_split_range_unlimited(self):
+        self.assertEqual([(1000, 2000)], ranges.split_range(1, 2))
+        self.assertRaises(ValueError, ranges.split_range, 2, 1)
+
+    def test_window_size(self):
+        limits = {None: ranges.HOUR, 'minute': ranges.HOUR, 'hour': 90 * ranges.DAY}
+        self.assertEqual(ranges.HOUR, ranges.window_size(limits))
+        self.assertEqual(90 * ranges.DAY, ranges.window_size(limits, 'h'))
+        self.assertIsNone(ranges.window_size(limits, 'Days'))
+        self.assertIsNone(ranges.window_size({}, 'minute'))
+        self.assertRaises(ValueError, ranges.window_size, limits, 'week')
+
+    def test_merge_responses_error(self):
+        error = {'status': 400, 'title': 'BAD REQUEST'}
+        self.assertEqual(error, ranges.merge_responses([fake_response({'startDate': 0, 'endDate': 0}), error]))
+
+    def test_merge_responses_boundaries(self):
+        trade = {'timestamp': 2, 'price': 10}
+        responses = [
+            {'status': 200, 'payload': {'data': [{'timestamp': 1, 'price': 10}, trade, trade]}},
+            {'status': 200, 'payload': {'data': [trade, trade, {'timestamp': 2, 'price': 11}, {'timestamp': 3}]}},
+            {'status': 200, 'payload': {'data': []}},
+            {'status': 200, 'payload': {'data': [{'timestamp': 3}, {'timestamp': 4}, {'timestamp': 4}]}},
+        ]
+
+        # Only the records repeated on the boundary of two windows are dropped (identical records are all kept)
+        self.assertEqual([
+            {'timestamp': 1, 'price': 10}, trade, trade, {'timestamp': 2, 'price': 11}, {'timestamp': 3},
+            {'timestamp': 4}, {'timestamp': 4},
+        ], ranges.merge_responses(responses)['payload']['data'])
+
+    @mock.patch.object(AmberdataDerivatives, '_request_json',
+                       side_effect=lambda _, params, **_kwargs: fake_response(params))
+    def test_fetch_range(self, request_json):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        response = client.fetch_range(
+            'get_volatility_level_1_quotes', exchange='deribit', currency='BTC',
+            startDate='2024-04-01T00:00:00', endDate='2024-04-01T03:00:00', timeInterval='minute'
+        )
+
+        self.assertEqual(3, request_json.call_count)
+        timestamps = [record['timestamp'] for record in response['payload']['data']]
+        self.assertEqual(list(range(1711929600000, 1711940400000 + ranges.MINUTE, ranges.MINUTE)), timestamps)
+        self.assertEqual({'api-version': '1'}, response['payload']['metadata'])
+
+    @mock.patch.object(AmberdataDerivatives, '_request_json',
+                       side_effect=lambda _, params, **_kwargs: fake_response(params))
+    def test_fetch_range_daily(self, request_json):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        client.fetch_range(
+            'get_volatility_level_1_quotes', exchange='deribit', currency='BTC',
+            startDate='2024-01-01T00:00:00', endDate='2024-03-01T00:00:00', timeInterval='day'
+        )
+
+        # Daily ranges are split as well, rather than requested in one unbounded call
+        self.assertEqual(2, request_json.call_count)
+        windows = [(call.args[1]['startDate'], call.args[1]['endDate']) for call in request_json.call_args_list]
+        self.assertEqual(ranges.split_range('2024-01-01T00:00:00', '2024-03-01T00:00:00', 30 * ranges.DAY), windows)
+
+    def test_fetch_range_unknown_endpoint(self):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        self.assertRaises(ValueError, client.fetch_range, 'get_version', startDate=0, endDate=1)
+        self.assertRaises(ValueError, client.fetch_range, 'close', startDate=0, endDate=1)
+        self.assertRaises(TypeError, client.fetch_range, 'get_volatility_index', startDate=0, endDate=1)
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
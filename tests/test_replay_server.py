@@ -0,0 +1,77 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import json
+import os
+import time
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives
+from tests.replay_server import FIXTURES_DIRECTORY, ReplayServer
+
+FIXTURE = os.path.join(FIXTURES_DIRECTORY, 'EndpointVolatilityIndexTestCase', 'test_historical_timeformat_iso.json')
+PARAMS = {
+    'exchange': 'deribit', 'currency': 'BTC', 'startDate': '2024-04-01T00:00:00', 'endDate': '2024-04-01T01:00:00',
+}
+
+
+# ======================================================================================================================
+
+class ReplayServerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ReplayServer(latency=0.05)
+        cls.server.start()
+        with mock.patch.dict(os.environ, {'API_URL': cls.server.url}):
+            cls.client = AmberdataDerivatives(api_key='<api_key>')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.stop()
+
+    # ==================================================================================================================
+
+    def test_recorded_call(self):
+        with open(FIXTURE, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+
+        started = time.monotonic()
+        response = self.client.get_volatility_index(**PARAMS, timeFormat='iso')
+
+        self.assertEqual(expected, response)
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+    def test_parameters_order(self):
+        response = self.client.get_volatility_index(timeFormat='iso8601', **dict(reversed(PARAMS.items())))
+        self.assertEqual(200, response['status'])
+
+    def test_error_call(self):
+        response = self.client.get_volatility_index(exchange='deribit', currency='BTC', invalid='parameter')
+        self.assertEqual(400, response['status'])
+
+    def test_unknown_call(self):
+        response = self.client.get_volatility_index(exchange='<exchange>', currency='<currency>')
+        self.assertEqual(404, response['status'])
+
+    def test_bandwidth(self):
+        with ReplayServer(bandwidth=50000, compress=False) as server:
+            with mock.patch.dict(os.environ, {'API_URL': server.url}):
+                client = AmberdataDerivatives(api_key='<api_key>')
+
+            started = time.monotonic()
+            client.get_volatility_index(**PARAMS, timeFormat='iso')
+            client.close()
+
+        # About 18 kB at 50 kB/s
+        self.assertGreaterEqual(time.monotonic() - started, os.path.getsize(FIXTURE) / 50000 * 0.9)
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
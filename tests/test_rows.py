@@ -0,0 +1,89 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import json
+import sys
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import rows, schemas
+
+DATA = [
+    {'exchange': 'deribit', 'exchangeTimestamp': 1711933140000, 'close': 76.67, 'volume': 2},
+    {'exchange': 'deribit', 'exchangeTimestamp': 1711933080000, 'close': 76.65},
+]
+
+
+# ======================================================================================================================
+
+class RowsTestCase(unittest.TestCase):
+    def test_row_class(self):
+        row_class = rows.get_row_class('get_volatility_level_1_quotes')
+
+        self.assertEqual('VolatilityLevel1QuotesRow', row_class.__name__)
+        self.assertEqual(tuple(schemas.get_fields('get_volatility_level_1_quotes')), row_class._fields)
+        self.assertIs(row_class, rows.get_row_class('get_volatility_level_1_quotes'))
+        self.assertFalse(hasattr(row_class._make([None] * len(row_class._fields)), '__dict__'))
+
+    def test_to_rows(self):
+        data = rows.to_rows(DATA, 'get_volatility_index')
+
+        self.assertEqual(['deribit', 'deribit'], [row.exchange for row in data])
+        self.assertEqual([76.67, 76.65], [row.close for row in data])
+        self.assertIsNone(data[1].high)
+
+        # Not in the schema: added to the class
+        self.assertEqual([2, None], [row.volume for row in data])
+        self.assertEqual(DATA[0], {
+            key: value for key, value in data[0]._asdict().items() if value is not None
+        })
+
+    def test_invalid_names(self):
+        data = [{'exchangeTimestamp': 1711933140000, 'class': 'A', '_id': 1, '1d': 2.5, 'close': 76.67}]
+        row = rows.to_rows(data, 'get_volatility_index')[0]
+
+        # Fields which are not valid attribute names are renamed by position (and still converted back by position)
+        names = list(dict.fromkeys([*schemas.get_fields('get_volatility_index'), *data[0]]))
+        self.assertEqual(f"_{names.index('class')}", row._fields[names.index('class')])
+        self.assertEqual(['A', 1, 2.5, 76.67], [row[names.index(name)] for name in ('class', '_id', '1d', 'close')])
+        self.assertEqual(76.67, row.close)
+
+    def test_interned_strings(self):
+        # Decoded strings are distinct objects, even when equal
+        data = json.loads(json.dumps([{'exchange': 'deribit', 'instrument': 'BTC-PERPETUAL', 'symbol': 'BTC'}] * 2))
+        self.assertIsNot(data[0]['instrument'], data[1]['instrument'])
+
+        first, second = rows.to_rows(data, 'get_volatility_level_1_quotes')
+        self.assertIs(first.instrument, second.instrument)
+        self.assertIs(first.exchange, second.exchange)
+        self.assertIsNot(first.symbol, second.symbol)
+
+    def test_memory(self):
+        record = {name: 1.0 for name in schemas.get_fields('get_volatility_level_1_quotes')}
+        row = rows.to_rows([record], 'get_volatility_level_1_quotes')[0]
+        self.assertLess(sys.getsizeof(row), sys.getsizeof(record) / 2)
+
+    def test_unknown_endpoint(self):
+        self.assertEqual([('a', 'b')], [tuple(row) for row in rows.to_rows([{'a': 'a', 'b': 'b'}], None)])
+
+    @mock.patch('requests.Session.get')
+    def test_client(self, get):
+        get.return_value.content = json.dumps({'status': 200, 'payload': {'data': DATA}}).encode('utf-8')
+        client = AmberdataDerivatives(api_key='<api_key>', result_format='rows')
+
+        response = client.get_volatility_index(exchange='deribit', currency='BTC')
+
+        self.assertEqual('VolatilityIndexRow', type(response['payload']['data'][0]).__name__)
+        self.assertEqual([1711933140000, 1711933080000], [row.exchangeTimestamp for row in response['payload']['data']])
+        self.assertRaises(ValueError, AmberdataDerivatives, api_key='<api_key>', result_format='rows',
+                          timestamp_dtype='int64')
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
@@ -0,0 +1,24 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import unittest
+
+from amberdata_derivatives import endpoints, schemas
+
+
+# ======================================================================================================================
+
+class SchemasTestCase(unittest.TestCase):
+    def test_fields(self):
+        self.assertEqual(sorted(endpoints.ENDPOINTS), sorted(schemas.FIELDS))
+        self.assertEqual(schemas.TIMESTAMP, schemas.get_fields('get_volatility_level_1_quotes')['timestamp'])
+        self.assertEqual({}, schemas.get_fields('<function_name>'))
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
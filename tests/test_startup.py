@@ -0,0 +1,146 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import-time budgets (in seconds, median of several cold imports in new interpreters), with a generous margin for slow
+# machines: a dependency imported eagerly again (ex: requests or pandas, ~100ms to ~1s) exceeds them
+IMPORT_BUDGETS = {
+    'import amberdata_derivatives':                              0.05,
+    'from amberdata_derivatives import AmberdataDerivatives':      0.15,
+    'from amberdata_derivatives import AsyncAmberdataDerivatives': 0.15,
+}
+RUNS = 5
+
+# Dependencies only imported on first use
+HEAVY_MODULES = (
+    'aiohttp', 'asyncio', 'dotenv', 'numpy', 'orjson', 'pandas', 'pyarrow', 'requests', 'sqlite3', 'urllib3'
+)
+
+
+def run_python(code: str, cwd: str = ROOT_DIRECTORY) -> dict:
+    """
+    Runs code in a new interpreter (without API_URL in its environment), and returns the JSON object it prints.
+    """
+
+    env = {key: value for key, value in os.environ.items() if key != 'API_URL'}
+    env['PYTHONPATH'] = ROOT_DIRECTORY
+    output = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, capture_output=True, check=True, text=True)
+    return json.loads(output.stdout)
+
+
+def measure_import(statement: str) -> dict:
+    """
+    Returns the duration (in seconds) of an import statement in a new interpreter, and the modules it imported.
+    """
+
+    return run_python(
+        "import json, sys, time\n"
+        "modules = set(sys.modules)\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "duration = time.perf_counter() - start\n"
+        "print(json.dumps({'duration': duration, 'modules': sorted(set(sys.modules) - modules)}))\n"
+    )
+
+
+# ======================================================================================================================
+
+class ImportTimeTestCase(unittest.TestCase):
+    def test_budgets(self):
+        for statement, budget in IMPORT_BUDGETS.items():
+            with self.subTest(statement):
+                duration = statistics.median(measure_import(statement)['duration'] for _ in range(RUNS))
+                self.assertLess(duration, budget, f"'{statement}' took {duration * 1000:.1f}ms")
+
+    def test_heavy_modules(self):
+        for statement in IMPORT_BUDGETS:
+            with self.subTest(statement):
+                modules = {module.partition('.')[0] for module in measure_import(statement)['modules']}
+                # The asynchronous client is built on asyncio (though not on aiohttp, until its first call)
+                heavy_modules = set(HEAVY_MODULES) - ({'asyncio'} if 'Async' in statement else set())
+                self.assertEqual(set(), modules & heavy_modules)
+
+    def test_exports(self):
+        result = run_python(
+            "import json, amberdata_derivatives\n"
+            "print(json.dumps({name: getattr(amberdata_derivatives, name).__name__ "
+            "for name in amberdata_derivatives.__all__}))\n"
+        )
+        self.assertEqual({name: name for name in result}, result)
+
+    def test_public_names(self):
+        exports, names = run_python(
+            "import json, amberdata_derivatives\n"
+            "print(json.dumps([amberdata_derivatives.__all__, "
+            "[name for name in dir(amberdata_derivatives) if not name.startswith('_')]]))\n"
+        )
+        # Only the exported classes are public (the helpers of the lazy imports are kept private)
+        self.assertEqual(sorted(exports), names)
+
+
+# ======================================================================================================================
+
+class LazyModuleTestCase(unittest.TestCase):
+    def test_concurrent_first_use(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'slow_module.py'), 'w', encoding='utf-8') as file:
+                file.write('import time\ntime.sleep(0.2)\nVALUE = 1\n')
+
+            values = run_python(
+                "import json\n"
+                "from concurrent.futures import ThreadPoolExecutor\n"
+                "from amberdata_derivatives import lazy\n"
+                "module = lazy.load('slow_module')\n"
+                "def get(_):\n"
+                "    try:\n"
+                "        return module.VALUE\n"
+                "    except AttributeError as e:\n"
+                "        return str(e)\n"
+                "with ThreadPoolExecutor(max_workers=4) as executor:\n"
+                "    print(json.dumps(list(executor.map(get, range(4)))))\n",
+                cwd=directory
+            )
+
+        # The threads using a module being imported by another one wait for its initialization
+        self.assertEqual([1, 1, 1, 1], values)
+
+
+# ======================================================================================================================
+
+class EnvironmentTestCase(unittest.TestCase):
+    def test_deferred_dotenv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, '.env'), 'w', encoding='utf-8') as file:
+                file.write('API_URL=http://127.0.0.1:1\n')
+
+            result = run_python(
+                "import json, os, sys\n"
+                "from amberdata_derivatives import AmberdataDerivatives\n"
+                "imported = (os.getenv('API_URL'), 'dotenv' in sys.modules)\n"
+                "AmberdataDerivatives(api_key='<api_key>')\n"
+                "constructed = (os.getenv('API_URL'), 'requests' in sys.modules)\n"
+                "print(json.dumps({'imported': imported, 'constructed': constructed}))\n",
+                cwd=directory
+            )
+
+        # The .env file is loaded on the construction of the first client, requests on its first call
+        self.assertEqual([None, False], result['imported'])
+        self.assertEqual(['http://127.0.0.1:1', False], result['constructed'])
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
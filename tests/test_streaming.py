@@ -0,0 +1,83 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import json
+import os
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import streaming
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), 'fixtures', 'EndpointTradesFlowDecoratedTradesTestCase', 'test_historical.json'
+)
+
+
+def chunked(body: bytes, size: int):
+    return [body[index:index + size] for index in range(0, len(body), size)]
+
+
+# ======================================================================================================================
+
+class RowDecoderTestCase(unittest.TestCase):
+    def test_fixture(self):
+        with open(FIXTURE, 'rb') as file:
+            body = file.read()
+
+        rows = list(streaming.iter_rows(chunked(body, 4096)))
+        self.assertEqual(json.loads(body)['payload']['data'], rows)
+
+    def test_chunk_boundaries(self):
+        data = [{'price': 12345.678, 'instrument': 'BTC-26APR24-70000-C', 'note': 'é €'}, 42, None, [1, 2], 'text']
+        body = json.dumps({'status': 200, 'payload': {'metadata': {'next': None}, 'data': data}}, ensure_ascii=False)
+
+        # Every chunk size, down to one byte (splitting numbers, strings and multibyte characters)
+        for size in range(1, 40):
+            self.assertEqual(data, list(streaming.iter_rows(chunked(body.encode('utf-8'), size))))
+
+    def test_incremental(self):
+        decoder = streaming.RowDecoder()
+        self.assertEqual([{'a': 1}], decoder.feed(b'{"status": 200, "payload": {"data": [{"a": 1}, {"b"'))
+        self.assertEqual([{'b': 2}], decoder.feed(b': 2}, {"c": 3'))
+        self.assertEqual([{'c': 3}], decoder.feed(b'}], "metadata": {}}}'))
+        self.assertTrue(decoder.done)
+        self.assertEqual([], decoder.close())
+
+    def test_missing_data(self):
+        for body in (b'{"status": 400, "title": "BAD REQUEST"}', b'{"payload": null}', b'{"payload": {"data": null}}'):
+            self.assertEqual([], list(streaming.iter_rows([body])))
+
+    def test_truncated(self):
+        with self.assertRaises(ValueError):
+            list(streaming.iter_rows([b'{"payload": {"data": [{"a": 1}, {"b": 2']))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(streaming.iter_rows([b'{"payload" {"data": []}}']))
+
+    @mock.patch('requests.Session.get')
+    def test_client(self, get):
+        body = json.dumps({'status': 200, 'payload': {'data': [{'a': 1}, {'a': 2}]}}).encode('utf-8')
+        get.return_value.__enter__.return_value.iter_content.return_value = chunked(body, 7)
+
+        client = AmberdataDerivatives(api_key='<api_key>')
+        rows = list(client.iter_rows('get_trades_flow_decorated_trades', exchange='deribit', currency='BTC'))
+
+        self.assertEqual([{'a': 1}, {'a': 2}], rows)
+        self.assertTrue(get.call_args.kwargs['stream'])
+        self.assertIn('trades-flow/decorated-trades?currency=BTC&exchange=deribit', get.call_args.args[0])
+
+    def test_client_invalid_arguments(self):
+        client = AmberdataDerivatives(api_key='<api_key>')
+        self.assertRaises(ValueError, list, client.iter_rows('<function_name>'))
+        self.assertRaises(TypeError, list, client.iter_rows('get_trades_flow_decorated_trades', exchange='deribit'))
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
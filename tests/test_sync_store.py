@@ -0,0 +1,205 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from amberdata_derivatives import AmberdataDerivatives, AsyncAmberdataDerivatives, SyncStore
+from amberdata_derivatives import ranges, sync_store
+
+START = ranges.to_milliseconds('2024-04-01T00:00:00')
+PARAMS = {'exchange': 'deribit', 'currency': 'BTC'}
+
+# The timestamp field of the volatility index
+FIELD = 'exchangeTimestamp'
+
+
+def make_records(start: int, end: int) -> list:
+    return [{FIELD: timestamp, 'dvol': timestamp % 97} for timestamp in range(start, end + 1, ranges.HOUR)]
+
+
+class FakeApi:  # pylint: disable=too-few-public-methods
+    """
+    Answers the calls like the API would (the records of [startDate, endDate], both included), or fails them.
+    """
+
+    def __init__(self, overlap: int = 0):
+        self.overlap = overlap
+        self.calls = []
+        self.error = None
+
+    def __call__(self, _, query_params: dict, **_kwargs) -> dict:
+        self.calls.append(query_params)
+        if self.error is not None:
+            return self.error
+
+        start = ranges.to_milliseconds(query_params['startDate']) - self.overlap
+        end = ranges.to_milliseconds(query_params['endDate'])
+        records = make_records(START, START + 10 * ranges.DAY)
+        return {'status': 200, 'payload': {'data': [record for record in records if start <= record[FIELD] <= end]}}
+
+
+# ======================================================================================================================
+
+class SyncStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = SyncStore(os.path.join(self.directory.name, 'series.sqlite3'))
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_key(self):
+        self.assertEqual(
+            'get_volatility_index?currency=BTC&exchange=deribit',
+            sync_store.make_key('get_volatility_index', {'exchange': 'deribit', 'currency': 'BTC', 'timeFormat': 'ms'})
+        )
+        self.assertEqual(
+            sync_store.make_key('get_volatility_index', {'currency': 'BTC', 'exchange': 'deribit'}),
+            sync_store.make_key('get_volatility_index', {'exchange': 'deribit', 'currency': 'BTC', 'startDate': 1})
+        )
+
+    def test_append(self):
+        records = make_records(START, START + 3 * ranges.HOUR)
+        self.assertIsNone(self.store.get_watermark('get_volatility_index', PARAMS))
+
+        self.assertEqual(records[:3], self.store.append('get_volatility_index', PARAMS, records[:3], FIELD))
+        self.assertEqual(records[3:], self.store.append('get_volatility_index', PARAMS, records[2:], FIELD))
+
+        self.assertEqual(START + 3 * ranges.HOUR, self.store.get_watermark('get_volatility_index', PARAMS))
+        self.assertEqual(records, self.store.read('get_volatility_index', PARAMS))
+        self.assertEqual(records[1:3], self.store.read(
+            'get_volatility_index', PARAMS, START + ranges.HOUR, '2024-04-01T03:00:00'
+        ))
+
+        # Series are independent
+        self.assertIsNone(self.store.get_watermark('get_volatility_index', {**PARAMS, 'currency': 'ETH'}))
+        self.assertEqual([], self.store.read('get_volatility_index', {**PARAMS, 'currency': 'ETH'}))
+
+    def test_identical_records(self):
+        trade = {'timestamp': START, 'amount': 1}
+        later_trade = {'timestamp': START + 1, 'amount': 1}
+        self.assertEqual([trade, trade], self.store.append('get_trades_flow_decorated_trades', PARAMS, [trade, trade]))
+
+        # Identical records are all stored, except those at the watermark returned again
+        self.assertEqual([later_trade, later_trade], self.store.append(
+            'get_trades_flow_decorated_trades', PARAMS, [trade, trade, later_trade, later_trade]
+        ))
+        self.assertEqual([trade, trade, later_trade, later_trade],
+                         self.store.read('get_trades_flow_decorated_trades', PARAMS))
+
+    def test_untimed_records(self):
+        records = [{'amount': 1}, {'amount': 2}]
+        self.assertEqual(records, self.store.append('get_futures_perpetuals_open_interest', PARAMS, records))
+
+        # Records without a timestamp are not stored again on each synchronization
+        self.assertEqual([{'amount': 3}], self.store.append(
+            'get_futures_perpetuals_open_interest', PARAMS, [{'amount': 2}, {'amount': 3}]
+        ))
+        self.assertEqual(3, self.store.stats()['get_futures_perpetuals_open_interest?currency=BTC&exchange=deribit'][
+            'records'])
+        self.assertIsNone(self.store.get_watermark('get_futures_perpetuals_open_interest', PARAMS))
+
+    def test_timestamp_field(self):
+        records = [{'timestamp': '2024-04-01T00:00:00.000Z', 'amount': 1}, {'amount': 2}]
+        self.assertEqual(records, self.store.append('get_futures_perpetuals_open_interest', PARAMS, records))
+        self.assertEqual(START, self.store.get_watermark('get_futures_perpetuals_open_interest', PARAMS))
+
+    def test_clear(self):
+        self.store.append('get_volatility_index', PARAMS, make_records(START, START + ranges.HOUR), FIELD)
+        self.store.append('get_volatility_index', {**PARAMS, 'currency': 'ETH'}, make_records(START, START), FIELD)
+        self.assertEqual({
+            'get_volatility_index?currency=BTC&exchange=deribit': {'records': 2, 'watermark': START + ranges.HOUR},
+            'get_volatility_index?currency=ETH&exchange=deribit': {'records': 1, 'watermark': START},
+        }, self.store.stats())
+
+        self.store.clear('get_volatility_index', PARAMS)
+        self.assertEqual(['get_volatility_index?currency=ETH&exchange=deribit'], list(self.store.stats()))
+        self.store.clear()
+        self.assertEqual({}, self.store.stats())
+
+
+# ======================================================================================================================
+
+class ClientSyncTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = SyncStore(os.path.join(self.directory.name, 'series.sqlite3'))
+        self.client = AmberdataDerivatives(api_key='<api_key>')
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def sync(self, api: FakeApi, **kwargs):
+        with mock.patch.object(AmberdataDerivatives, '_request_json', side_effect=api):
+            return self.client.sync('get_volatility_index', self.store, **PARAMS, **kwargs)
+
+    def test_incremental(self):
+        api = FakeApi()
+        first = self.sync(api, startDate=START, endDate=START + ranges.DAY)
+        self.assertEqual(make_records(START, START + ranges.DAY), first['payload']['data'])
+        self.assertEqual('ms', api.calls[0]['timeFormat'])
+
+        # Only the records newer than the watermark are requested, and returned
+        api.calls.clear()
+        second = self.sync(api, startDate=START, endDate=START + 2 * ranges.DAY)
+        self.assertEqual([START + ranges.DAY + 1], [call['startDate'] for call in api.calls])
+        self.assertEqual(make_records(START + ranges.DAY + ranges.HOUR, START + 2 * ranges.DAY),
+                         second['payload']['data'])
+        self.assertEqual(make_records(START, START + 2 * ranges.DAY), self.store.read('get_volatility_index', PARAMS))
+
+        # Up to date
+        api.calls.clear()
+        third = self.sync(api, endDate=START + 2 * ranges.DAY)
+        self.assertEqual((200, []), (third['status'], third['payload']['data']))
+        self.assertEqual([], api.calls)
+
+    def test_overlap(self):
+        self.sync(FakeApi(), startDate=START, endDate=START + ranges.DAY)
+
+        # Records at (or before) the watermark returned again are stored once
+        response = self.sync(FakeApi(overlap=3 * ranges.HOUR), endDate=START + 2 * ranges.DAY)
+        self.assertEqual(24, len(response['payload']['data']))
+        self.assertEqual(49, self.store.stats()['get_volatility_index?currency=BTC&exchange=deribit']['records'])
+
+    def test_error(self):
+        self.sync(FakeApi(), startDate=START, endDate=START + ranges.DAY)
+
+        api = FakeApi()
+        api.error = {'status': 500, 'title': 'INTERNAL SERVER ERROR'}
+        self.assertEqual(api.error, self.sync(api, endDate=START + 2 * ranges.DAY))
+        self.assertEqual(START + ranges.DAY, self.store.get_watermark('get_volatility_index', PARAMS))
+
+    def test_invalid_arguments(self):
+        self.assertRaisesRegex(TypeError, 'startDate', self.sync, FakeApi())
+        self.assertRaises(ValueError, self.sync, FakeApi(), startDate=START, timeFormat='iso')
+        self.assertRaises(TypeError, self.client.sync, 'get_volatility_index', self.store, exchange='deribit')
+
+    def test_async_client(self):
+        async def main():
+            async with AsyncAmberdataDerivatives(api_key='<api_key>') as client:
+                await client.sync('get_volatility_index', self.store, startDate=START, endDate=START + ranges.DAY,
+                                  **PARAMS)
+                return await client.sync('get_volatility_index', self.store, endDate=START + 2 * ranges.DAY, **PARAMS)
+
+        api = FakeApi()
+        with mock.patch.object(AsyncAmberdataDerivatives, '_request_json', side_effect=api):
+            response = asyncio.run(main())
+
+        self.assertEqual(make_records(START + ranges.DAY + ranges.HOUR, START + 2 * ranges.DAY),
+                         response['payload']['data'])
+        self.assertEqual(START + ranges.DAY + 1, api.calls[-1]['startDate'])
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
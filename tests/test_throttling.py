@@ -0,0 +1,167 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import email.utils
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from amberdata_derivatives import AmberdataDerivatives, RetryPolicy, TokenBucket
+from amberdata_derivatives import throttling
+
+
+def http_response(status: int, headers: dict = None):
+    response = mock.Mock(status_code=status, headers=headers or {})
+    response.content = json.dumps({'status': status}).encode('utf-8')
+    return response
+
+
+# ======================================================================================================================
+
+class TokenBucketTestCase(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, burst=3)
+
+        self.assertEqual([0.0, 0.0, 0.0], [bucket.reserve() for _ in range(3)])
+        # Queued calls wait for their own token, in order of arrival
+        delays = [bucket.reserve() for _ in range(3)]
+        for index, delay in enumerate(delays):
+            self.assertAlmostEqual((index + 1) * 0.1, delay, delta=0.01)
+
+    def test_pause(self):
+        bucket = TokenBucket(rate=1000, burst=10)
+        bucket.pause(0.5)
+        self.assertAlmostEqual(0.5, bucket.reserve(), delta=0.01)
+
+        # The calls queued behind a pause resume one at a time (and overlapping pauses do not add up)
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.pause(1)
+        bucket.pause(0.5)
+        delays = [bucket.reserve() for _ in range(3)]
+        for index, delay in enumerate(delays):
+            self.assertAlmostEqual(1 + (index + 1) * 0.1, delay, delta=0.01)
+
+    def test_concurrent_callers(self):
+        bucket = TokenBucket(rate=100, burst=1)
+        started = time.monotonic()
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.095)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, TokenBucket, rate=0)
+        self.assertRaises(ValueError, TokenBucket, rate=1, burst=0)
+
+
+class RetryPolicyTestCase(unittest.TestCase):
+    def test_should_retry(self):
+        policy = RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry(0, 429))
+        self.assertTrue(policy.should_retry(1, 503))
+        self.assertTrue(policy.should_retry(1))
+        self.assertFalse(policy.should_retry(2, 429))
+        self.assertFalse(policy.should_retry(0, 400))
+        self.assertFalse(policy.should_retry(0, 200))
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+        self.assertEqual([1, 2, 4, 5], [policy.get_delay(attempt) for attempt in range(4)])
+
+        policy = RetryPolicy(backoff=1, max_backoff=5)
+        for attempt in range(10):
+            self.assertTrue(0 <= policy.get_delay(attempt) <= 5)
+
+    def test_retry_after(self):
+        policy = RetryPolicy()
+        self.assertEqual(7, policy.get_delay(0, '7'))
+        self.assertTrue(policy.should_retry(0, 429, '7'))
+
+        # Calls asked to wait longer than max_backoff are not retried early
+        self.assertFalse(policy.should_retry(0, 429, '3600'))
+
+        date = email.utils.formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(60, throttling.parse_retry_after(date), delta=2)
+        self.assertIsNone(throttling.parse_retry_after('<invalid>'))
+
+
+class ClientThrottlingTestCase(unittest.TestCase):
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.get')
+    def test_retry_after(self, get, sleep):
+        get.side_effect = [http_response(429, {'Retry-After': '2'}), http_response(503), http_response(200)]
+        client = AmberdataDerivatives(api_key='<api_key>', retry_policy=RetryPolicy(backoff=1, jitter=False))
+
+        response = client.get_volatility_index(exchange='deribit', currency='BTC')
+
+        self.assertEqual(200, response['status'])
+        self.assertEqual(3, get.call_count)
+        self.assertEqual([mock.call(2.0), mock.call(2)], sleep.call_args_list)
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.get')
+    def test_long_retry_after(self, get, sleep):
+        get.side_effect = [http_response(429, {'Retry-After': '3600'}), http_response(200)]
+        bucket = TokenBucket(rate=10)
+        client = AmberdataDerivatives(api_key='<api_key>', rate_limiter=bucket, retry_policy=RetryPolicy())
+
+        # The response is returned rather than retried before the delay requested by the API
+        self.assertEqual(429, client.get_volatility_index(exchange='deribit', currency='BTC')['status'])
+        self.assertEqual(1, get.call_count)
+        self.assertEqual([], sleep.call_args_list)
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.get')
+    def test_retries_exhausted(self, get, sleep):
+        get.side_effect = [http_response(429)] * 3
+        client = AmberdataDerivatives(api_key='<api_key>', retry_policy=RetryPolicy(max_retries=2))
+
+        self.assertEqual(429, client.get_volatility_index(exchange='deribit', currency='BTC')['status'])
+        self.assertEqual(3, get.call_count)
+        self.assertEqual(2, sleep.call_count)
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.get')
+    def test_connection_error(self, get, _):
+        get.side_effect = [requests.ConnectionError(), http_response(200)]
+        client = AmberdataDerivatives(api_key='<api_key>', retry_policy=RetryPolicy())
+        self.assertEqual(200, client.get_volatility_index(exchange='deribit', currency='BTC')['status'])
+
+        get.side_effect = [requests.ConnectionError()]
+        client = AmberdataDerivatives(api_key='<api_key>')
+        self.assertRaises(requests.ConnectionError, client.get_volatility_index, exchange='deribit', currency='BTC')
+
+    @mock.patch('requests.Session.get')
+    def test_no_retry(self, get):
+        get.side_effect = [http_response(429)]
+        client = AmberdataDerivatives(api_key='<api_key>')
+        self.assertEqual(429, client.get_volatility_index(exchange='deribit', currency='BTC')['status'])
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.get')
+    def test_rate_limiter(self, get, sleep):
+        get.return_value = http_response(200)
+        client = AmberdataDerivatives(api_key='<api_key>', rate_limiter=TokenBucket(rate=10, burst=2))
+
+        for _ in range(4):
+            client.get_volatility_index(exchange='deribit', currency='BTC')
+
+        # The first two calls use the burst, the next ones wait for a token
+        self.assertEqual(2, sleep.call_count)
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
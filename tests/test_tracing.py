@@ -0,0 +1,220 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import asyncio
+import importlib.util
+import os
+import sys
+import unittest
+from unittest import mock
+
+import requests
+
+from amberdata_derivatives import AmberdataDerivatives, AsyncAmberdataDerivatives, ResponseCache
+from amberdata_derivatives import tracing
+from tests.replay_server import ReplayServer
+
+PARAMS = {
+    'exchange': 'deribit', 'currency': 'BTC', 'startDate': '2024-04-01T00:00:00', 'endDate': '2024-04-01T01:00:00',
+    'timeFormat': 'iso',
+}
+URL_PATH = 'markets/derivatives/analytics/volatility/index'
+STAGES = [tracing.TRANSPORT, tracing.DECOMPRESS, tracing.JSON_PARSE]
+
+
+def get_children(spans: list, parent: tracing.Span) -> list:
+    return [span.name for span in sorted(spans, key=lambda span: span.start_time) if span.parent_id == parent.span_id]
+
+
+# ======================================================================================================================
+
+class TracerTestCase(unittest.TestCase):
+    def test_nested_spans(self):
+        tracer = tracing.Tracer()
+        with tracer.start_span('parent', {'key': 'value'}) as parent:
+            with tracer.start_span('child') as child:
+                child.set_attribute('rows', 3)
+        with tracer.start_span('other'):
+            pass
+
+        child, parent, other = tracer.exporter.spans
+        self.assertEqual(('child', 'parent', 'other'), (child.name, parent.name, other.name))
+        self.assertEqual({'key': 'value'}, parent.attributes)
+        self.assertEqual({'rows': 3}, child.attributes)
+        self.assertEqual((parent.trace_id, parent.span_id), (child.trace_id, child.parent_id))
+        self.assertIsNone(parent.parent_id)
+        self.assertNotEqual(parent.trace_id, other.trace_id)
+        self.assertGreaterEqual(parent.duration, child.duration)
+
+    def test_error(self):
+        tracer = tracing.Tracer()
+        with self.assertRaises(ValueError):
+            with tracer.start_span('span'):
+                raise ValueError('<error>')
+
+        span, = tracer.exporter.spans
+        self.assertIsInstance(span.error, ValueError)
+        self.assertIsNotNone(span.end_time)
+
+    def test_exporter(self):
+        exporter = tracing.InMemoryExporter()
+        tracer = tracing.Tracer(exporter)
+        with tracer.start_span('span'):
+            pass
+
+        self.assertEqual(['span'], [span.name for span in exporter.spans])
+        exporter.clear()
+        self.assertEqual([], exporter.spans)
+
+    def test_no_tracer(self):
+        with tracing.start_span(None, 'span', {'key': 'value'}) as span:
+            span.set_attribute('key', 'value')
+
+    def test_call_attributes(self):
+        self.assertEqual(
+            {'amberdata.endpoint': URL_PATH, 'amberdata.exchange': 'deribit', 'amberdata.currency': 'BTC'},
+            tracing.get_call_attributes(URL_PATH, PARAMS)
+        )
+        self.assertEqual(
+            {'amberdata.endpoint': URL_PATH, 'amberdata.asset': 'BTC'},
+            tracing.get_call_attributes(URL_PATH, {'asset': 'BTC', 'exchange': None})
+        )
+
+    def test_open_telemetry(self):
+        open_telemetry_tracer = mock.MagicMock()
+        trace = mock.Mock(get_tracer=mock.Mock(return_value=open_telemetry_tracer))
+        with mock.patch.dict(sys.modules, {'opentelemetry': mock.Mock(trace=trace)}):
+            tracer = tracing.OpenTelemetryTracer()
+
+        with tracer.start_span('span', {'key': 'value'}):
+            pass
+        self.assertEqual('amberdata_derivatives', trace.get_tracer.call_args.args[0])
+        open_telemetry_tracer.start_as_current_span.assert_called_once_with('span', attributes={'key': 'value'})
+
+    @unittest.skipIf(importlib.util.find_spec('opentelemetry') is not None, 'opentelemetry is installed')
+    def test_open_telemetry_missing(self):
+        self.assertRaises(ImportError, tracing.OpenTelemetryTracer)
+
+
+# ======================================================================================================================
+
+class ClientTracingTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ReplayServer()
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.tracer = tracing.Tracer()
+
+    def create_client(self, client_class=AmberdataDerivatives, **kwargs):
+        with mock.patch.dict(os.environ, {'API_URL': self.server.url}):
+            return client_class(api_key='<api_key>', tracer=self.tracer, **kwargs)
+
+    def get_call_spans(self) -> list:
+        return [span for span in self.tracer.exporter.spans if span.name == 'amberdata.get_volatility_index']
+
+    # ==================================================================================================================
+
+    def test_call(self):
+        with self.create_client(result_format='columns') as client:
+            client.get_volatility_index(**PARAMS)
+
+        spans = self.tracer.exporter.spans
+        call, = self.get_call_spans()
+        self.assertEqual(STAGES + [tracing.COLUMNAR], get_children(spans, call))
+        self.assertEqual(
+            {'amberdata.endpoint': URL_PATH, 'amberdata.exchange': 'deribit', 'amberdata.currency': 'BTC'},
+            call.attributes
+        )
+
+        stages = {span.name: span for span in spans}
+        self.assertEqual(200, stages[tracing.TRANSPORT].attributes['http.status_code'])
+        self.assertEqual(0, stages[tracing.TRANSPORT].attributes['amberdata.retries'])
+        self.assertEqual('gzip', stages[tracing.DECOMPRESS].attributes['amberdata.content_encoding'])
+        self.assertLess(
+            stages[tracing.DECOMPRESS].attributes['amberdata.compressed_bytes'],
+            stages[tracing.DECOMPRESS].attributes['amberdata.uncompressed_bytes']
+        )
+
+    def test_cached_call(self):
+        with self.create_client(response_cache=ResponseCache()) as client:
+            client.get_volatility_index(**PARAMS)
+            client.get_volatility_index(**PARAMS)
+
+        spans = self.tracer.exporter.spans
+        first, second = self.get_call_spans()
+        self.assertEqual(STAGES, get_children(spans, first))
+        self.assertEqual([], get_children(spans, second))
+
+    def test_error(self):
+        # Invalid parameters are sent as is (to be rejected by the API)
+        with self.create_client(validate_params=False) as client:
+            client.get_volatility_index(exchange='deribit', currency='BTC', invalid='parameter')
+
+        call, = self.get_call_spans()
+        transport_span = next(span for span in self.tracer.exporter.spans if span.name == tracing.TRANSPORT)
+        self.assertEqual(400, transport_span.attributes['http.status_code'])
+        self.assertIsNone(call.error)
+
+        with mock.patch.dict(os.environ, {'API_URL': 'http://127.0.0.1:1'}):
+            client = AmberdataDerivatives(api_key='<api_key>', tracer=self.tracer)
+        self.assertRaises(requests.ConnectionError, client.get_volatility_index, exchange='deribit', currency='BTC')
+
+        call, transport_span = self.tracer.exporter.spans[-1], self.tracer.exporter.spans[-2]
+        self.assertEqual((tracing.TRANSPORT, call.span_id), (transport_span.name, transport_span.parent_id))
+        self.assertIsInstance(call.error, requests.ConnectionError)
+        self.assertIsInstance(transport_span.error, requests.ConnectionError)
+
+    def test_fetch_range(self):
+        with self.create_client() as client:
+            client.fetch_range(
+                'get_trades_flow_decorated_trades', '2024-04-01T00:00:00', '2024-04-04T00:00:00', exchange='deribit',
+                currency='BTC'
+            )
+
+        spans = self.tracer.exporter.spans
+        fetch_range = spans[-1]
+        self.assertEqual('amberdata.fetch_range', fetch_range.name)
+        self.assertEqual('deribit', fetch_range.attributes['amberdata.exchange'])
+
+        # One child span per window (of one day), each with the stages of its call
+        windows = [span for span in spans if span.parent_id == fetch_range.span_id]
+        self.assertEqual(3, fetch_range.attributes['amberdata.windows'])
+        self.assertEqual(['amberdata.get_trades_flow_decorated_trades'] * 3, [window.name for window in windows])
+        for window in windows:
+            self.assertEqual(fetch_range.trace_id, window.trace_id)
+            self.assertEqual(STAGES, get_children(spans, window))
+
+    def test_async_call(self):
+        async def main():
+            async with self.create_client(AsyncAmberdataDerivatives, result_format='dataframe') as client:
+                await asyncio.gather(client.get_volatility_index(**PARAMS), client.get_volatility_index(**PARAMS))
+
+        asyncio.run(main())
+
+        spans = self.tracer.exporter.spans
+        calls = self.get_call_spans()
+        self.assertEqual(2, len(calls))
+        self.assertNotEqual(calls[0].trace_id, calls[1].trace_id)
+        for call in calls:
+            self.assertEqual(STAGES + [tracing.COLUMNAR], get_children(spans, call))
+
+    def test_no_tracer(self):
+        with mock.patch.dict(os.environ, {'API_URL': self.server.url}):
+            client = AmberdataDerivatives(api_key='<api_key>')
+        self.assertEqual(200, client.get_volatility_index(**PARAMS)['status'])
+        client.close()
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================
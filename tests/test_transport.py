@@ -0,0 +1,53 @@
+# ======================================================================================================================
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+
+import gzip
+import unittest
+import zlib
+
+from amberdata_derivatives import AmberdataDerivatives
+from amberdata_derivatives import transport
+
+
+# ======================================================================================================================
+
+class TransportTestCase(unittest.TestCase):
+    def test_create_session_pool(self):
+        session = transport.create_session(pool_connections=3, pool_maxsize=7, pool_block=True)
+        adapter = session.get_adapter('https://api.amberdata.com')
+        self.assertEqual(3, adapter._pool_connections)  # pylint: disable=protected-access
+        self.assertEqual(7, adapter.poolmanager.connection_pool_kw['maxsize'])
+        self.assertEqual(True, adapter.poolmanager.connection_pool_kw['block'])
+        self.assertEqual('keep-alive', session.headers['Connection'])
+        session.close()
+
+    def test_create_session_no_keep_alive(self):
+        session = transport.create_session(keep_alive=False)
+        self.assertEqual('close', session.headers['Connection'])
+        session.close()
+
+    def test_create_session_invalid(self):
+        self.assertRaises(ValueError, transport.create_session, pool_connections=0)
+        self.assertRaises(ValueError, transport.create_session, pool_maxsize=0)
+
+    def test_decompress(self):
+        body = b'{"status": 200}'
+        self.assertEqual(body, transport.decompress(body))
+        self.assertEqual(body, transport.decompress(body, 'identity'))
+        self.assertEqual(body, transport.decompress(gzip.compress(body), 'gzip'))
+        self.assertEqual(body, transport.decompress(zlib.compress(body), 'deflate'))
+        self.assertEqual(body, transport.decompress(zlib.compress(body)[2:-4], 'Deflate'))
+        self.assertRaises(ValueError, transport.decompress, body, 'br')
+
+    def test_context_manager(self):
+        with AmberdataDerivatives(api_key='<api_key>', pool_maxsize=2) as client:
+            self.assertIsNotNone(client.get_version())
+
+
+# ======================================================================================================================
+
+if __name__ == '__main__':
+    unittest.main()
+
+# ======================================================================================================================